@@ -8,6 +8,7 @@ NOTE: This is a STUB implementation. Full integration requires:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, cast
 
@@ -69,7 +70,8 @@ class ToolExecutor:
             from .tool_registry import get_tool_function
             
             tool_func = get_tool_function(tool_name)
-            result = tool_func(**kwargs)
+            # Off the event loop, so concurrent calls (see execute_tools) overlap
+            result = await asyncio.to_thread(tool_func, **kwargs)
             
             log.debug("Tool %s executed successfully", tool_name)
             return cast(dict[str, Any], result)
@@ -78,6 +80,29 @@ class ToolExecutor:
             log.exception("Tool %s execution failed: %s", tool_name, e)
             raise ToolExecutionError(f"Tool execution failed: {e}") from e
 
+    async def execute_tools(
+        self, calls: list[tuple[str, dict[str, Any]]],
+    ) -> list[dict[str, Any] | Exception]:
+        """Execute several tool calls of one round concurrently.
+        
+        Args:
+            calls: (tool name, parameters) pairs
+        
+        Returns:
+            Results in call order; a failing call yields its exception
+            (ToolNotAvailableError / ToolExecutionError) instead of a result
+        """
+        outcomes = await asyncio.gather(
+            *(self.execute_tool(name, **params) for name, params in calls),
+            return_exceptions=True,
+        )
+        results: list[dict[str, Any] | Exception] = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+                raise outcome
+            results.append(outcome)
+        return results
+
 
 async def propose_move_agent(
     agent_config: dict[str, Any],
@@ -0,0 +1,136 @@
+"""Long-lived asyncio runtime for provider calls (one loop thread per app).
+
+Starting every AI turn with ``asyncio.run`` means a new event loop, new
+provider clients, new connection pools and new TLS handshakes per turn.
+`AsyncRuntime` keeps one loop running in a daemon thread instead: callers
+submit coroutines and get ``concurrent.futures.Future`` objects back, and
+provider clients are cached per (provider, config) key so their pools stay
+warm between turns.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Coroutine, Hashable, TypeVar
+
+from .openai_transport import aclose_shared_async_http_client
+
+log = logging.getLogger("scrabgpt.ai.async_runtime")
+
+T = TypeVar("T")
+C = TypeVar("C")
+
+
+class AsyncRuntime:
+    """Background event loop plus a cache of long-lived provider clients."""
+
+    def __init__(self, name: str = "scrabgpt-async") -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._clients: dict[Hashable, Any] = {}
+        self.client_hits = 0
+        self.client_misses = 0
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The runtime loop (started on first use)."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name=self.name, daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None and self._loop.is_running()
+
+    def in_runtime_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> Future[T]:
+        """Schedule `coro` on the runtime loop; cancel the future to cancel it."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], *, timeout: float | None = None) -> T:
+        """Blocking `submit(...).result()` for worker threads.
+
+        Must not be called from the runtime thread itself (it would deadlock).
+        """
+        if self.in_runtime_thread():
+            coro.close()
+            raise RuntimeError("AsyncRuntime.run called from its own loop; await the coroutine instead")
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def client(self, key: Hashable, factory: Callable[[], C]) -> C:
+        """Cached client for `key`; `factory` builds it on first request."""
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self.client_hits += 1
+                return client  # type: ignore[no-any-return]
+            self.client_misses += 1
+            client = factory()
+            self._clients[key] = client
+            return client
+
+    def drop_client(self, key: Hashable) -> None:
+        """Forget a cached client (e.g. after its config changed) and close it."""
+        with self._lock:
+            client = self._clients.pop(key, None)
+        if client is not None and self.running:
+            self.submit(_close_client(client))
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"clients": len(self._clients), "client_hits": self.client_hits,
+                    "client_misses": self.client_misses}
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Close cached clients and the shared HTTP pool, then stop the loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._loop = self._thread = None
+        if loop is None or loop.is_closed():
+            return
+
+        async def close_all() -> None:
+            await asyncio.gather(*(_close_client(c) for c in clients), return_exceptions=True)
+            await aclose_shared_async_http_client()
+
+        if loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(close_all(), loop).result(timeout)
+            except Exception as e:  # noqa: BLE001
+                log.warning("Async runtime: closing clients failed: %s", e)
+            loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        if not loop.is_running():
+            loop.close()
+
+
+async def _close_client(client: Any) -> None:
+    close = getattr(client, "close", None) or getattr(client, "aclose", None)
+    if close is None:
+        return
+    try:
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:  # noqa: BLE001
+        log.debug("Async runtime: closing %s failed: %s", type(client).__name__, e)
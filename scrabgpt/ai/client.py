@@ -1,28 +1,35 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
-from pathlib import Path
 from typing import Any, Callable, TypedDict, cast
 
 from dotenv import load_dotenv
 from openai import OpenAI, BadRequestError
 from openai.types.chat import ChatCompletionMessageParam
 
-from .fastdict import load_dictionary
-from .juls_online import is_word_in_juls
+from .lexicon import get_lexicon_registry
+from .juls_online import juls_lookup_many
+from .openai_transport import shared_http_client
+from .singleflight import SingleFlight
+from .validation_store import TIER_JUDGE, TIER_JULS, ValidationStore, get_validation_store
 
 log = logging.getLogger("scrabgpt.ai")
 DEFAULT_OPENAI_MODEL = "gpt-5.2"
 
 # Pozn.: Pouzivame Responses API s json_schema formatom (strict JSON vystup).
 
-class JudgeResult(TypedDict):
+class _JudgeVerdict(TypedDict):
     word: str
     valid: bool
     reason: str
 
+class JudgeResult(_JudgeVerdict, total=False):
+    # Verdikt doplnený klientom (rozhodca nevrátil odpoveď); neukladá sa do cache
+    fallback: bool
+
 class JudgeBatchResponse(TypedDict):
     results: list[JudgeResult]
     all_valid: bool
@@ -37,6 +44,10 @@ class MoveProposal(TypedDict):
 
 JudgeValidator = Callable[[list[str], str], JudgeBatchResponse]
 
+# Súbežné LLM posudky rovnakého slova (jazyk, SLOVO) sa zlúčia do jedného
+_JUDGE_FLIGHTS: SingleFlight[tuple[str, str], JudgeResult] = SingleFlight()
+
+
 def _mask_key(k: str) -> str:
     if not k:
         return ""
@@ -70,7 +81,12 @@ class OpenAIClient:
             client_kwargs["base_url"] = base_url.rstrip("/")
             log.info("OpenAI client base_url override: %s", client_kwargs["base_url"])
 
-        self.client = OpenAI(api_key=api_key if api_key else None, **client_kwargs)
+        # Zdieľaný pool spojení (keep-alive) pre rozhodcu aj hráčov
+        self.client = OpenAI(
+            api_key=api_key if api_key else None,
+            http_client=shared_http_client(),
+            **client_kwargs,
+        )
         self.model = resolved_model
         # LMStudio/localhost: vypneme Responses endpoint úplne (pády/500)
         if base_url:
@@ -84,15 +100,12 @@ class OpenAIClient:
         self.ai_move_max_output_tokens: int = int(os.getenv("AI_MOVE_MAX_OUTPUT_TOKENS", "3600"))
         self.judge_max_output_tokens: int = int(os.getenv("JUDGE_MAX_OUTPUT_TOKENS", "800"))
 
-        # Načítaj slovenský slovník pre rýchle vyhľadávanie
+        # Slovenský slovník zo zdieľaného registra (načíta sa pri prvom použití)
         self._slovak_dict: Callable[[str], bool] | None = None
         try:
-            dict_path = Path(__file__).parent / "dicts" / "sk.sorted.txt"
-            if dict_path.exists():
-                self._slovak_dict = load_dictionary(dict_path)
-                log.info("Slovak dictionary loaded from %s", dict_path)
+            self._slovak_dict = get_lexicon_registry().contains_fn("slovak")
         except Exception as e:
-            log.warning("Failed to load Slovak dictionary: %s", e)
+            log.warning("Failed to resolve Slovak dictionary: %s", e)
 
     def _call_json(
         self,
@@ -725,6 +738,162 @@ class OpenAIClient:
         judge_llm = llm_validator or self._judge_with_openai
         llm_label = "OpenAI" if llm_validator is None else "configured judge model"
 
+        store = get_validation_store()
+        resolved, pending = self._resolve_offline(words, language=language, store=store, local=False)
+        if not pending:
+            return self._combine_results(resolved, None)
+        response = self._judge_words_uncached(
+            pending, language=language, judge_llm=judge_llm, llm_label=llm_label, store=store,
+        )
+        return self._combine_results(resolved, response)
+
+    async def judge_words_async(
+        self,
+        words: list[str],
+        *,
+        language: str,
+        llm_validator: JudgeValidator | None = None,
+    ) -> JudgeBatchResponse:
+        """Asynchrónna verzia `judge_words` pre paralelné modely.
+
+        Cache verdiktov a lokálny slovník sa vyhodnotia priamo v event loope;
+        do vlákna sa ide len so slovami, ktoré potrebujú JÚĽŠ alebo LLM.
+        """
+        judge_llm = llm_validator or self._judge_with_openai
+        llm_label = "OpenAI" if llm_validator is None else "configured judge model"
+
+        store = get_validation_store()
+        resolved, pending = self._resolve_offline(words, language=language, store=store, local=True)
+        if not pending:
+            return self._combine_results(resolved, None)
+        response = await asyncio.to_thread(
+            self._judge_words_uncached,
+            pending,
+            language=language,
+            judge_llm=judge_llm,
+            llm_label=llm_label,
+            store=store,
+        )
+        return self._combine_results(resolved, response)
+
+    def _resolve_offline(
+        self,
+        words: list[str],
+        *,
+        language: str,
+        store: ValidationStore | None,
+        local: bool,
+    ) -> tuple[list[JudgeResult], list[str]]:
+        """Úroveň 0 (perzistentná cache) a voliteľne úroveň 1 (lokálny slovník).
+
+        Vráti (vyriešené verdikty, slová na overenie online/LLM). Z cache sa
+        berú ako konečné len pozitívne verdikty a verdikty rozhodcu; negatívny
+        JÚĽŠ záznam znamená len „nenájdené online“ a slovo ide k rozhodcovi.
+        """
+        resolved: list[JudgeResult] = []
+        pending: list[str] = []
+        cached = 0
+        in_dict = self._slovak_dict if local and language.lower() == "slovak" else None
+        for word in words:
+            verdict = store.get(language, word) if store is not None else None
+            if verdict is not None and (verdict.valid or verdict.tier == TIER_JUDGE):
+                cached += 1
+                resolved.append({"word": word, "valid": verdict.valid, "reason": verdict.reason})
+            elif in_dict is not None and in_dict(word):
+                resolved.append({
+                    "word": word,
+                    "valid": True,
+                    "reason": "Slovo nájdené v oficiálnom slovenskom slovníku.",
+                })
+            else:
+                pending.append(word)
+        if cached:
+            log.info("Persistent cache: %d/%d words already judged", cached, len(words))
+        return resolved, pending
+
+    @staticmethod
+    def _combine_results(
+        resolved: list[JudgeResult],
+        response: JudgeBatchResponse | None,
+    ) -> JudgeBatchResponse:
+        if response is not None and not resolved:
+            return response
+        combined = resolved + (response["results"] if response is not None else [])
+        return cast(JudgeBatchResponse, {
+            "results": combined,
+            "all_valid": all(r["valid"] for r in combined),
+        })
+
+    @staticmethod
+    def _judge_llm_coalesced(
+        words: list[str],
+        language: str,
+        judge_llm: JudgeValidator,
+    ) -> JudgeBatchResponse:
+        """LLM judge zdieľaný so súbežnými rozhodcami (paralelné modely).
+
+        Slovo, ktoré už posudzuje iné vlákno, sa znova nepýta – počká sa na
+        jeho verdikt; LLM dostane len zvyšné slová.
+        """
+        lang = language.strip().lower()
+        word_of: dict[tuple[str, str], str] = {}
+        for word in words:
+            word_of.setdefault((lang, word.strip().upper()), word)
+
+        def run(led: list[tuple[str, str]]) -> dict[tuple[str, str], JudgeResult]:
+            led_words = [word_of[key] for key in led]
+            response = judge_llm(led_words, language)
+            results = response.get("results", [])
+            by_key = {(lang, str(r.get("word", "")).strip().upper()): r for r in results}
+            verdicts: dict[tuple[str, str], JudgeResult] = {}
+            for idx, key in enumerate(led):
+                verdict = by_key.get(key)
+                if verdict is None and len(results) == len(led):
+                    verdict = results[idx]  # model prepísal slovo inak; zachovaj poradie
+                if verdict is None:
+                    verdict = {"word": word_of[key], "valid": False, "fallback": True,
+                               "reason": "Rozhodca nevrátil verdikt pre toto slovo."}
+                verdicts[key] = verdict
+            return verdicts
+
+        verdicts = _JUDGE_FLIGHTS.do_many(list(word_of), run)
+        judged = [verdicts[key] for key in word_of]
+        return cast(JudgeBatchResponse, {
+            "results": judged,
+            "all_valid": all(r["valid"] for r in judged),
+        })
+
+    @staticmethod
+    def _remember_verdicts(
+        store: ValidationStore | None,
+        language: str,
+        results: list[JudgeResult],
+        *,
+        tier: str,
+    ) -> None:
+        if store is None:
+            return
+        for result in results:
+            if result.get("fallback"):
+                continue  # doplnený verdikt nie je rozhodnutie rozhodcu
+            store.put(
+                language,
+                result["word"],
+                valid=bool(result["valid"]),
+                tier=tier,
+                source="juls_api" if tier == TIER_JULS else "llm_judge",
+                reason=result.get("reason", ""),
+            )
+
+    def _judge_words_uncached(
+        self,
+        words: list[str],
+        *,
+        language: str,
+        judge_llm: JudgeValidator,
+        llm_label: str,
+        store: ValidationStore | None,
+    ) -> JudgeBatchResponse:
         # Pre slovenčinu: kontrola slovníka najprv
         if language.lower() == "slovak" and self._slovak_dict:
             dict_results: list[JudgeResult] = []
@@ -757,22 +926,28 @@ class OpenAIClient:
                 len(dict_results), len(words), len(juls_needed)
             )
             
+            # Všetky slová naraz cez zdieľaný HTTP/2 pool (jeden handshake)
+            try:
+                juls_outcomes = juls_lookup_many(juls_needed)
+            except Exception as e:
+                log.warning("JULS batch lookup failed: %s, falling back to LLM", e)
+                juls_outcomes = {}
             for word in juls_needed:
-                try:
-                    if is_word_in_juls(word):
-                        result: JudgeResult = {
-                            "word": word,
-                            "valid": True,
-                            "reason": "Slovo nájdené v online slovníku JÚĽŠ.",
-                        }
-                        juls_results.append(result)
-                    else:
-                        openai_needed.append(word)
-                except Exception as e:
-                    # Pri chybe JÚĽŠ (network timeout, atď), pridaj do LLM fallback fronty
-                    log.warning("JULS lookup failed for '%s': %s, falling back to LLM", word, e)
+                outcome = juls_outcomes.get(word)
+                if outcome is True:
+                    result: JudgeResult = {
+                        "word": word,
+                        "valid": True,
+                        "reason": "Slovo nájdené v online slovníku JÚĽŠ.",
+                    }
+                    juls_results.append(result)
+                else:
+                    if isinstance(outcome, Exception):
+                        # Pri chybe JÚĽŠ (network timeout, atď), pridaj do LLM fallback fronty
+                        log.warning("JULS lookup failed for '%s': %s, falling back to LLM", word, outcome)
                     openai_needed.append(word)
             
+            self._remember_verdicts(store, language, juls_results, tier=TIER_JULS)
             combined_results = dict_results + juls_results
             
             # Ak všetky slová našli sa v slovníkoch (lokálny + JÚĽŠ), vráť výsledky
@@ -795,12 +970,13 @@ class OpenAIClient:
                 len(openai_needed),
             )
             try:
-                openai_response = judge_llm(openai_needed, language)
+                openai_response = self._judge_llm_coalesced(openai_needed, language, judge_llm)
             except Exception as e:  # noqa: BLE001
                 log.exception("%s judge fallback failed: %s", llm_label, e)
                 # Mark unresolved words as invalid but keep previous findings
                 error_results: list[JudgeResult] = [
-                    {"word": w, "valid": False, "reason": f"LLM judge failed: {e}"}
+                    {"word": w, "valid": False, "fallback": True,
+                     "reason": f"LLM judge failed: {e}"}
                     for w in openai_needed
                 ]
                 combined_results = combined_results + error_results
@@ -809,6 +985,7 @@ class OpenAIClient:
                     "results": combined_results,
                     "all_valid": all_valid,
                 })
+            self._remember_verdicts(store, language, openai_response["results"], tier=TIER_JUDGE)
             combined_results = combined_results + openai_response["results"]
             all_valid = all(r["valid"] for r in combined_results)
             return cast(JudgeBatchResponse, {
@@ -817,7 +994,9 @@ class OpenAIClient:
             })
         
         # Pre ostatné jazyky alebo ak slovník neexistuje: použiť len OpenAI
-        return judge_llm(words, language)
+        llm_response = self._judge_llm_coalesced(words, language, judge_llm)
+        self._remember_verdicts(store, language, llm_response["results"], tier=TIER_JUDGE)
+        return llm_response
 
     def _judge_with_openai(self, words: list[str], language: str) -> JudgeBatchResponse:
         if not words:
@@ -2,12 +2,22 @@ from __future__ import annotations
 
 import unicodedata as ud
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator
 
 def _nfc_casefold(s: str) -> str:
     """Zachová diakritiku, len zjednotí veľkosť písmen a normalizuje Unicode."""
     return ud.normalize("NFC", s).casefold()
 
+def iter_words(path: str | Path, *, comment_prefix: str = "#") -> Iterator[str]:
+    """Postupne vracia slová zo súboru (1 slovo na riadok) bez komentárov a prázdnych riadkov."""
+    with Path(path).open("r", encoding="utf-8", errors="strict") as f:
+        for line in f:
+            if comment_prefix and line.startswith(comment_prefix):
+                continue
+            w = line.strip()
+            if w:
+                yield w
+
 def load_dictionary(
     path: str | Path,
     *,
@@ -21,19 +31,10 @@ def load_dictionary(
     - Predvolené normalize: NFC + casefold (rozlišuje diakritiku, nerozlišuje veľkosť písmen).
       Ak chceš presnú zhodu aj s veľkosťou písmen -> normalize=None.
     """
-    path = Path(path)
-    words: set[str] = set()
-
-    with path.open("r", encoding="utf-8", errors="strict") as f:
-        for line in f:
-            if comment_prefix and line.startswith(comment_prefix):
-                continue
-            w = line.strip()
-            if not w:
-                continue
-            words.add(normalize(w) if normalize else w)
-
-    frozen_words = frozenset(words)
+    frozen_words = frozenset(
+        normalize(w) if normalize else w
+        for w in iter_words(path, comment_prefix=comment_prefix)
+    )
 
     if normalize:
         def contains(word: str) -> bool:
@@ -0,0 +1,149 @@
+"""Hedged model calls driven by learned per-model latency.
+
+A model that shows no sign of life (no progress event, no answer) within its
+usual p90 time-to-first-activity gets a speculative second request to its
+fallback model; whichever leg answers successfully first wins and the other
+is cancelled. Latencies are learned per model over a sliding window.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+from collections import deque
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+LEG_PRIMARY = "primary"
+LEG_HEDGE = "hedge"
+
+DEFAULT_WINDOW = 50
+DEFAULT_MIN_SAMPLES = 5
+DEFAULT_QUANTILE = 0.9
+
+
+class LatencyTracker:
+    """Sliding-window latency samples per model with quantile lookup."""
+
+    def __init__(
+        self,
+        *,
+        window: int = DEFAULT_WINDOW,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        quantile: float = DEFAULT_QUANTILE,
+    ) -> None:
+        self.window = max(1, window)
+        self.min_samples = max(1, min_samples)
+        self.quantile = quantile
+        self._lock = threading.Lock()
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, model_id: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(model_id)
+            if samples is None:
+                samples = self._samples[model_id] = deque(maxlen=self.window)
+            samples.append(max(0.0, seconds))
+
+    def quantile_for(self, model_id: str) -> float | None:
+        """Learned quantile (nearest rank) for the model, or None with too few samples."""
+        with self._lock:
+            samples = sorted(self._samples.get(model_id, ()))
+        if len(samples) < self.min_samples:
+            return None
+        rank = max(1, math.ceil(self.quantile * len(samples)))
+        return samples[rank - 1]
+
+    def snapshot(self) -> dict[str, dict[str, float | int | None]]:
+        with self._lock:
+            counts = {model: len(samples) for model, samples in self._samples.items()}
+        return {
+            model: {"samples": count, "quantile": self.quantile_for(model)}
+            for model, count in counts.items()
+        }
+
+
+class HedgeStats:
+    """Counters of launched hedges and which leg won."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.launched = 0
+        self.wins = {LEG_PRIMARY: 0, LEG_HEDGE: 0}
+
+    def record(self, winner: str) -> None:
+        """One hedge was launched and `winner` answered first."""
+        with self._lock:
+            self.launched += 1
+            self.wins[winner] = self.wins.get(winner, 0) + 1
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {"launched": self.launched, "primary_wins": self.wins[LEG_PRIMARY],
+                    "hedge_wins": self.wins[LEG_HEDGE]}
+
+
+_LATENCY = LatencyTracker()
+_STATS = HedgeStats()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    return _LATENCY
+
+
+def hedge_stats() -> dict[str, int]:
+    return _STATS.snapshot()
+
+
+async def hedged_call(
+    primary: Callable[[asyncio.Event], Awaitable[T]],
+    hedge: Callable[[asyncio.Event], Awaitable[T]] | None,
+    *,
+    delay: float | None,
+    is_success: Callable[[T], bool],
+    stats: HedgeStats | None = None,
+) -> tuple[T, str, bool]:
+    """Run `primary`; after `delay` seconds without activity also run `hedge`.
+
+    Each leg gets an event it sets on its first sign of life. The first leg
+    to finish with `is_success(result)` wins and the other is cancelled; if
+    neither succeeds the primary's outcome is returned (or raised).
+
+    Returns (result, winning leg, whether a hedge was launched).
+    """
+    stats = _STATS if stats is None else stats
+    activity = asyncio.Event()
+    primary_task = asyncio.ensure_future(primary(activity))
+    legs: dict[asyncio.Future[T], str] = {primary_task: LEG_PRIMARY}
+    try:
+        if hedge is None or delay is None:
+            return await primary_task, LEG_PRIMARY, False
+
+        watcher = asyncio.ensure_future(activity.wait())
+        try:
+            await asyncio.wait({primary_task, watcher}, timeout=delay,
+                               return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            watcher.cancel()
+        if primary_task.done() or activity.is_set():
+            return await primary_task, LEG_PRIMARY, False
+
+        hedge_task = asyncio.ensure_future(hedge(asyncio.Event()))
+        legs[hedge_task] = LEG_HEDGE
+        pending: set[asyncio.Future[T]] = set(legs)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=lambda t: legs[t] != LEG_PRIMARY):
+                if task.cancelled() or task.exception() is not None:
+                    continue
+                if is_success(task.result()):
+                    stats.record(legs[task])
+                    return task.result(), legs[task], True
+        stats.record(LEG_PRIMARY)
+        return primary_task.result(), LEG_PRIMARY, True
+    finally:
+        for task in legs:
+            if not task.done():
+                task.cancel()
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
+import unicodedata
+from concurrent.futures import Future
+from typing import Any, Coroutine, Iterable, TypeVar
 
 import httpx
 from parsel import Selector
 
 log = logging.getLogger("scrabgpt.ai")
 
+T = TypeVar("T")
+
+BASE_URL = "https://slovnik.juls.savba.sk/"
+
 # All dictionaries you had in the URL; pass them as a list so httpx renders multiple d= params.
 DEFAULT_DICTIONARIES = [
     "kssj4","psp","ogs","sssj","orter","scs","sss","peciar","ssn","hssj",
@@ -14,14 +23,18 @@ DEFAULT_DICTIONARIES = [
     "pskfr","pskcs","psken",
 ]
 
-def is_word_in_juls(word: str, *, timeout: float = 10.0) -> bool:
-    """Return True iff the JULS search page shows a result (i.e., no <span class="notfound">).
-    
-    Treats `word` as Unicode. Uses an exact search across DEFAULT_DICTIONARIES.
-    Raises httpx.HTTPError on network/HTTP failures (so the caller can decide what to do).
-    """
-    base_url = "https://slovnik.juls.savba.sk/"
-    params = {
+_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (+https://github.com/yourrepo) httpx/2025-demo",
+    "Accept-Language": "sk,cs;q=0.9,en;q=0.8",
+}
+
+# Parallel lookups per client (HTTP/2 multiplexes them over one connection)
+JULS_MAX_CONCURRENCY = 6
+_RETRY_BACKOFF_SECONDS = 0.5
+
+
+def _search_params(word: str) -> dict[str, Any]:
+    return {
         "w": word,          # Unicode ok; httpx will percent-encode & IDNA-encode as needed
         "s": "exact",
         "c": "m5a4",        # any nonce is fine; this is what their UI uses today
@@ -29,33 +42,278 @@ def is_word_in_juls(word: str, *, timeout: float = 10.0) -> bool:
         "d": DEFAULT_DICTIONARIES,  # multiple d= entries
     }
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (+https://github.com/yourrepo) httpx/2025-demo",
-        "Accept-Language": "sk,cs;q=0.9,en;q=0.8",
-    }
 
+def page_has_result(html: str) -> bool:
+    """Return True iff a JULS search page shows a result (no <span class="notfound">)."""
+    sel = Selector(html)
+
+    # Primary check: presence of the "notfound" span.
+    if sel.css("span.notfound"):
+        return False
+
+    # Optional hardening: some skins render a localized text; keep as fallback.
+    # (Observed text: "Nič nebolo nájdené." on empty results.)
+    text_snippet = " ".join(sel.css("body ::text").getall()).strip().lower()
+    return "nič nebolo nájdené" not in text_snippet
+
+
+def _inflight_key(word: str) -> str:
+    """Case- and normalization-insensitive key, so "Slovo" and "slovo" share a lookup."""
+    return unicodedata.normalize("NFC", word.strip()).casefold()
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, (httpx.TimeoutException, httpx.TransportError))
+
+
+class JulsClient:
+    """Async JULS client with a persistent HTTP/2 connection pool.
+
+    Lookups share one `httpx.AsyncClient`, so a batch of words costs one TLS
+    handshake; a semaphore bounds in-flight requests. Retries back off with
+    `asyncio.sleep` and every lookup can carry a deadline. One instance must
+    be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = JULS_MAX_CONCURRENCY,
+        timeout: float = 10.0,
+        retry_backoff: float = _RETRY_BACKOFF_SECONDS,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.retry_backoff = retry_backoff
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        # word key -> running lookup; concurrent callers for the same word share it
+        self._inflight: dict[str, asyncio.Task[bool]] = {}
+        self.lookups = 0
+        self.coalesced = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                follow_redirects=True,
+                timeout=self.timeout,
+                headers=_HEADERS,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+                transport=self._transport,
+            )
+        return self._client
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def lookup(
+        self,
+        word: str,
+        *,
+        timeout: float | None = None,
+        retries: int = 0,
+        deadline: float | None = None,
+    ) -> bool:
+        """Check one word (exact search across DEFAULT_DICTIONARIES).
+
+        Args:
+            word: Word to look up (Unicode)
+            timeout: Per-request timeout (default: client timeout)
+            retries: Extra attempts after a timeout, transport error, 429 or 5xx
+            deadline: Overall time budget in seconds, including retries
+
+        Raises httpx.HTTPError on network/HTTP failures (so the caller can decide what to do).
+        """
+        loop = asyncio.get_running_loop()
+        until = loop.time() + deadline if deadline is not None else None
+        return await self._lookup(word, timeout=timeout, retries=retries, until=until)
+
+    async def _lookup(
+        self,
+        word: str,
+        *,
+        timeout: float | None,
+        retries: int,
+        until: float | None,
+    ) -> bool:
+        key = _inflight_key(word)
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.lookups += 1
+            task = asyncio.ensure_future(
+                self._fetch(word, timeout=timeout, retries=retries, until=until)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        # shield: a cancelled caller must not cancel the lookup others wait on
+        if until is None:
+            return await asyncio.shield(task)
+        # a joined lookup may run on the leader's longer budget; keep our own deadline
+        remaining = until - asyncio.get_running_loop().time()
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), max(0.0, remaining))
+        except asyncio.TimeoutError:
+            raise httpx.TimeoutException(f"JULS deadline exceeded for '{word}'") from None
+
+    def _finish(self, key: str, task: asyncio.Task[bool]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved here so an unawaited failure is not logged as lost
+
+    async def _fetch(
+        self,
+        word: str,
+        *,
+        timeout: float | None,
+        retries: int,
+        until: float | None,
+    ) -> bool:
+        loop = asyncio.get_running_loop()
+        request_timeout = self.timeout if timeout is None else timeout
+        last_error: Exception | None = None
+        for attempt in range(max(0, retries) + 1):
+            budget = request_timeout
+            if until is not None:
+                remaining = until - loop.time()
+                if remaining <= 0:
+                    break
+                budget = min(budget, remaining)
+            try:
+                async with self._get_semaphore():
+                    response = await self._get_client().get(
+                        BASE_URL, params=_search_params(word), timeout=budget,
+                    )
+                response.raise_for_status()
+                return page_has_result(response.text)
+            except httpx.HTTPError as e:
+                last_error = e
+                if not _is_retryable(e) or attempt >= retries:
+                    break
+                log.warning(
+                    "JULS lookup for '%s' failed (attempt %d/%d): %s",
+                    word, attempt + 1, retries + 1, e,
+                )
+                await asyncio.sleep(self.retry_backoff * (attempt + 1))
+
+        if last_error is None:
+            last_error = httpx.TimeoutException(f"JULS deadline exceeded for '{word}'")
+        log.warning("JULS online lookup failed for word '%s': %s", word, last_error)
+        raise last_error
+
+    async def lookup_many(
+        self,
+        words: Iterable[str],
+        *,
+        timeout: float | None = None,
+        retries: int = 0,
+        deadline: float | None = None,
+    ) -> dict[str, bool | Exception]:
+        """Check many words concurrently; duplicates are looked up once.
+
+        Words already being looked up by another caller join that request.
+
+        Returns word -> True/False, or the exception that ended its lookup.
+        """
+        loop = asyncio.get_running_loop()
+        until = loop.time() + deadline if deadline is not None else None
+        unique = list(dict.fromkeys(words))
+        outcomes = await asyncio.gather(
+            *(self._lookup(w, timeout=timeout, retries=retries, until=until) for w in unique),
+            return_exceptions=True,
+        )
+        results: dict[str, bool | Exception] = {}
+        for word, outcome in zip(unique, outcomes):
+            if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+                raise outcome
+            results[word] = outcome
+        return results
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# ========== Blocking facade ==========
+# Sync callers (tool threads, the judge) share one client that lives on a
+# background event loop, so its connection pool survives between calls.
+
+_LOOP: asyncio.AbstractEventLoop | None = None
+_CLIENT: JulsClient | None = None
+_RUNTIME_LOCK = threading.Lock()
+
+
+def _runtime() -> tuple[asyncio.AbstractEventLoop, JulsClient]:
+    global _LOOP, _CLIENT
+    with _RUNTIME_LOCK:
+        if _LOOP is None or _LOOP.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="juls-loop", daemon=True)
+            thread.start()
+            _LOOP = loop
+        if _CLIENT is None:
+            _CLIENT = JulsClient()
+        return _LOOP, _CLIENT
+
+
+def _run(coro: Coroutine[Any, Any, T]) -> T:
+    loop, _client = _runtime()
     try:
-        # Follow redirects + HTTP/2 for good measure
-        with httpx.Client(http2=True, follow_redirects=True, timeout=timeout, headers=headers) as client:
-            r = client.get(base_url, params=params)
-            r.raise_for_status()
-            sel = Selector(r.text)
-
-            # Primary check: presence of the "notfound" span.
-            not_found = bool(sel.css("span.notfound"))
-
-            # Optional hardening: some skins render a localized text; keep as fallback.
-            # (Observed text: "Nič nebolo nájdené." on empty results.)
-            if not_found:
-                return False
-            text_snippet = " ".join(sel.css("body ::text").getall()).strip().lower()
-            if "nič nebolo nájdené" in text_snippet:
-                return False
-
-            return True
-    except httpx.HTTPError as e:
-        log.warning("JULS online lookup failed for word '%s': %s", word, e)
-        raise
-    except Exception as e:
-        log.warning("Unexpected error during JULS lookup for word '%s': %s", word, e)
-        raise
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("Blocking JULS call from the JULS event loop; await JulsClient instead")
+    future: Future[T] = asyncio.run_coroutine_threadsafe(coro, loop)
+    return future.result()
+
+
+def juls_stats() -> dict[str, int]:
+    """Lookup/coalescing counters of the shared client (zeros before first use)."""
+    client = _CLIENT
+    if client is None:
+        return {"lookups": 0, "coalesced": 0, "in_flight": 0}
+    return {"lookups": client.lookups, "coalesced": client.coalesced,
+            "in_flight": len(client._inflight)}
+
+
+def get_juls_client() -> JulsClient:
+    """Shared client of the blocking facade (only await it on its own loop)."""
+    return _runtime()[1]
+
+
+def is_word_in_juls(word: str, *, timeout: float = 10.0, retries: int = 0) -> bool:
+    """Return True iff the JULS search page shows a result (i.e., no <span class="notfound">).
+
+    Treats `word` as Unicode. Uses an exact search across DEFAULT_DICTIONARIES.
+    Raises httpx.HTTPError on network/HTTP failures (so the caller can decide what to do).
+    """
+    client = get_juls_client()
+    return _run(client.lookup(word, timeout=timeout, retries=retries))
+
+
+def juls_lookup_many(
+    words: Iterable[str],
+    *,
+    timeout: float = 10.0,
+    retries: int = 0,
+    deadline: float | None = None,
+) -> dict[str, bool | Exception]:
+    """Blocking batch lookup over the shared pool (see `JulsClient.lookup_many`)."""
+    client = get_juls_client()
+    return _run(client.lookup_many(words, timeout=timeout, retries=retries, deadline=deadline))
@@ -0,0 +1,429 @@
+"""Kompilovaný binárny lexikón mapovaný do pamäte (mmap).
+
+Komentár (SK): Textový zoznam slov (1 slovo na riadok) sa raz skompiluje do
+zoradenej tabuľky reťazcov s offsetmi. Pri ďalšom štarte sa súbor len
+namapuje do pamäte – nič sa neparsuje a stránky zdieľajú všetky procesy
+cez page cache. Vyhľadanie slova je binárne hľadanie nad offsetmi.
+
+Formát (little-endian):
+    hlavička (32 B): magic "SGLX", verzia, rezerva, počet slov,
+                     mtime_ns a veľkosť zdrojového súboru
+    offsety: (počet + 1) x uint32 do bloku slov
+    blok:    UTF-8 slová (NFC + casefold), zoradené podľa bajtov, bez duplicít
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+import weakref
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Iterator, Protocol, TypeVar, cast
+
+from .fastdict import _nfc_casefold, iter_words
+
+log = logging.getLogger("scrabgpt.ai.lexicon")
+
+LEXICON_SUFFIX = ".lex"
+_MAGIC = b"SGLX"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHIQQ")
+_HEADER_SIZE = 32
+_USER_CACHE_DIR = Path.home() / ".cache" / "scrabgpt" / "lexicons"
+
+DICTS_DIR = Path(__file__).parent / "dicts"
+# Zoznamy slov podľa jazyka (prvý existujúci vyhráva)
+LANGUAGE_FILES: dict[str, tuple[str, ...]] = {
+    "slovak": ("sk.sorted.txt",),
+    "english": ("twl.txt", "sowpods.txt", "en.txt"),
+}
+_DEFAULT_BUDGET_MB = 256
+
+# Otvorené lexikóny podľa cesty ku skompilovanému súboru. Slabé referencie:
+# lexikón žije, kým ho drží register alebo niektorý konzument.
+_OPEN_LEXICONS: weakref.WeakValueDictionary[str, Lexicon] = weakref.WeakValueDictionary()
+_OPEN_LOCK = threading.Lock()
+
+
+class SizedResource(Protocol):
+    """Štruktúra postavená zo zoznamu slov, ktorá vie odhadnúť svoju pamäť."""
+
+    @property
+    def size_bytes(self) -> int: ...
+
+
+SizedT = TypeVar("SizedT", bound=SizedResource)
+
+
+def _source_stamp(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def compile_lexicon(
+    source: str | Path,
+    target: str | Path,
+    *,
+    comment_prefix: str = "#",
+) -> Path:
+    """Skompiluje textový zoznam slov do binárneho lexikónu (atomický zápis)."""
+
+    source_path = Path(source)
+    target_path = Path(target)
+    mtime_ns, size = _source_stamp(source_path)
+    encoded = sorted(
+        {_nfc_casefold(w).encode("utf-8") for w in iter_words(source_path, comment_prefix=comment_prefix)}
+    )
+
+    offsets = array("I", [0] * (len(encoded) + 1))
+    pos = 0
+    for i, word in enumerate(encoded):
+        offsets[i] = pos
+        pos += len(word)
+    offsets[len(encoded)] = pos
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    header = _HEADER.pack(_MAGIC, _VERSION, 0, len(encoded), mtime_ns, size)
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target_path.with_name(f"{target_path.name}.{os.getpid()}.tmp")
+    with tmp_path.open("wb") as f:
+        f.write(header.ljust(_HEADER_SIZE, b"\0"))
+        f.write(offsets.tobytes())
+        f.write(b"".join(encoded))
+    os.replace(tmp_path, target_path)
+    log.info("Compiled lexicon %s -> %s (%d words)", source_path, target_path, len(encoded))
+    return target_path
+
+
+class Lexicon:
+    """Read-only lexikón nad mmap-nutým skompilovaným súborom."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _reserved, count, mtime_ns, size = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._mm.close()
+            raise ValueError(f"Neplatný lexikón {self.path}")
+        self.source_stamp: tuple[int, int] = (mtime_ns, size)
+        self._count: int = count
+        offsets_end = _HEADER_SIZE + (count + 1) * 4
+        if sys.byteorder == "little":
+            self._offsets = memoryview(self._mm)[_HEADER_SIZE:offsets_end].cast("I")
+        else:  # pragma: no cover - big-endian platformy
+            swapped = array("I", self._mm[_HEADER_SIZE:offsets_end])
+            swapped.byteswap()
+            self._offsets = memoryview(swapped)
+        self._blob_start = offsets_end
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def size_bytes(self) -> int:
+        """Veľkosť namapovaného súboru (pre pamäťový rozpočet registra)."""
+        return len(self._mm)
+
+    def _word_bytes(self, index: int) -> bytes:
+        start = self._blob_start + self._offsets[index]
+        end = self._blob_start + self._offsets[index + 1]
+        return self._mm[start:end]
+
+    def _bisect_left(self, key: bytes) -> int:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._word_bytes(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        key = _nfc_casefold(word).encode("utf-8")
+        index = self._bisect_left(key)
+        return index < self._count and self._word_bytes(index) == key
+
+    def contains(self, word: str) -> bool:
+        """Rovnaké ako `word in lexicon` (vhodné ako contains callback)."""
+        return word in self
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self._word_bytes(index).decode("utf-8")
+
+    def with_prefix(self, prefix: str, *, limit: int | None = None) -> list[str]:
+        """Slová s daným prefixom – súvislý úsek zoradenej tabuľky (binárne hľadanie).
+
+        Vzory, prípony a rack dotazy rieši `WordTrie` (mcp_tools.get_move_generator).
+        """
+        key = _nfc_casefold(prefix).encode("utf-8")
+        out: list[str] = []
+        index = self._bisect_left(key)
+        while index < self._count and (limit is None or len(out) < limit):
+            word = self._word_bytes(index)
+            if not word.startswith(key):
+                break
+            out.append(word.decode("utf-8"))
+            index += 1
+        return out
+
+    def close(self) -> None:
+        self._offsets.release()
+        self._mm.close()
+
+
+def compiled_path_for(source: str | Path) -> Path:
+    """Cesta ku skompilovanému lexikónu: vedľa zdroja, inak v používateľskej cache."""
+
+    source_path = Path(source).resolve()
+    beside = source_path.with_suffix(LEXICON_SUFFIX)
+    if os.access(source_path.parent, os.W_OK) or beside.exists():
+        return beside
+    digest = hashlib.blake2b(str(source_path).encode("utf-8"), digest_size=4).hexdigest()
+    return _USER_CACHE_DIR / f"{source_path.stem}-{digest}{LEXICON_SUFFIX}"
+
+
+def open_lexicon(source: str | Path) -> Lexicon:
+    """Vráti zdieľaný lexikón pre textový zoznam slov.
+
+    Pri prvom použití (alebo ak sa zdrojový súbor zmenil) sa lexikón
+    skompiluje; inak sa existujúci súbor iba namapuje do pamäte.
+    """
+
+    source_path = Path(source)
+    target = compiled_path_for(source_path)
+    key = str(target)
+    stamp = _source_stamp(source_path)
+    with _OPEN_LOCK:
+        lexicon = _OPEN_LEXICONS.get(key)
+        if lexicon is not None and lexicon.source_stamp == stamp:
+            return lexicon
+
+        if target.exists():
+            try:
+                candidate = Lexicon(target)
+            except (OSError, ValueError) as exc:
+                log.warning("Ignoring unreadable lexicon %s: %s", target, exc)
+            else:
+                if candidate.source_stamp == stamp:
+                    _OPEN_LEXICONS[key] = candidate
+                    return candidate
+                candidate.close()
+
+        compile_lexicon(source_path, target)
+        lexicon = Lexicon(target)
+        _OPEN_LEXICONS[key] = lexicon
+        return lexicon
+
+
+def language_key(name: str) -> str | None:
+    """Zjednotí slug variantu / názov jazyka na kľúč z `LANGUAGE_FILES`."""
+
+    lowered = name.strip().lower()
+    if lowered.startswith("slov") or lowered in {"sk", "slk"}:
+        return "slovak"
+    if lowered.startswith("eng") or lowered in {"en", "twl", "sowpods"}:
+        return "english"
+    return None
+
+
+class LexiconRegistry:
+    """Procesový register lexikónov: jazyk/variant -> jeden zdieľaný lexikón.
+
+    Lexikóny sa načítajú lenivo pri prvom použití. Ak súčet veľkostí
+    namapovaných súborov prekročí rozpočet, uvoľnia sa najdlhšie nepoužité
+    jazyky (konzumenti, ktorí lexikón ešte držia, ho môžu používať ďalej).
+    Do toho istého rozpočtu sa rátajú aj odvodené štruktúry (napr. trie
+    generátora ťahov, viď `derived`); tie sa pri prekročení uvoľnia prvé.
+    """
+
+    def __init__(
+        self,
+        dicts_dir: str | Path = DICTS_DIR,
+        *,
+        memory_budget_bytes: int | None = None,
+    ) -> None:
+        self.dicts_dir = Path(dicts_dir)
+        if memory_budget_bytes is None:
+            try:
+                budget_mb = int(os.getenv("SCRABGPT_LEXICON_BUDGET_MB", str(_DEFAULT_BUDGET_MB)))
+            except ValueError:
+                budget_mb = _DEFAULT_BUDGET_MB
+            memory_budget_bytes = budget_mb * 1024 * 1024
+        self.memory_budget_bytes = memory_budget_bytes
+        self._loaded: OrderedDict[str, Lexicon] = OrderedDict()
+        # (jazyk, druh) -> odvodená štruktúra; LRU poradie ako pri lexikónoch
+        self._derived: OrderedDict[tuple[str, str], SizedResource] = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self.loads = 0
+        self.evictions = 0
+
+    def path_for(self, name: str) -> Path | None:
+        """Textový zoznam slov pre jazyk/variant, ak existuje."""
+        language = language_key(name)
+        if language is None:
+            return None
+        for file_name in LANGUAGE_FILES[language]:
+            path = self.dicts_dir / file_name
+            if path.exists():
+                return path
+        return None
+
+    def get(self, name: str) -> Lexicon | None:
+        """Lexikón pre jazyk/variant (načíta ho pri prvom použití)."""
+        language = language_key(name)
+        if language is None:
+            return None
+        with self._lock:
+            lexicon = self._loaded.get(language)
+            if lexicon is not None:
+                self._loaded.move_to_end(language)
+                return lexicon
+            path = self.path_for(language)
+            if path is None:
+                return None
+            started = time.perf_counter()
+            lexicon = open_lexicon(path)
+            self.loads += 1
+            log.info(
+                "Lexicon %s ready from %s (%d words) in %.1f ms",
+                language, path.name, len(lexicon), (time.perf_counter() - started) * 1000,
+            )
+            self._loaded[language] = lexicon
+            self._enforce_budget(keep=language)
+            return lexicon
+
+    def contains(self, name: str, word: str) -> bool | None:
+        """Či je slovo v lexikóne jazyka; None ak jazyk nemá lexikón."""
+        lexicon = self.get(name)
+        if lexicon is None:
+            return None
+        return word in lexicon
+
+    def contains_fn(self, name: str) -> Callable[[str], bool] | None:
+        """contains(word) callback pre jazyk, alebo None ak zoznam slov chýba.
+
+        Lexikón sa načíta až pri prvom volaní callbacku.
+        """
+        if self.path_for(name) is None:
+            return None
+
+        def contains(word: str) -> bool:
+            return bool(self.contains(name, word))
+
+        return contains
+
+    def derived(
+        self,
+        name: str,
+        kind: str,
+        build: Callable[[str, Path], SizedT | None],
+    ) -> SizedT | None:
+        """Štruktúra `kind` postavená zo zoznamu slov jazyka, zdieľaná a v rozpočte.
+
+        `build(jazyk, cesta)` sa zavolá raz (aj pri súbežných volaniach);
+        výsledok sa ráta do rozpočtu pamäte a pri jeho prekročení sa uvoľní
+        skôr ako lexikóny. None, ak jazyk nemá zoznam slov alebo build zlyhá.
+        """
+        language = language_key(name)
+        if language is None:
+            return None
+        key = (language, kind)
+        with self._lock:
+            found = self._derived.get(key)
+            if found is not None:
+                self._derived.move_to_end(key)
+                return cast(SizedT, found)
+        with self._build_lock:
+            with self._lock:
+                found = self._derived.get(key)
+            if found is not None:
+                return cast(SizedT, found)
+            path = self.path_for(language)
+            if path is None:
+                return None
+            built = build(language, path)
+            if built is None:
+                return None
+            with self._lock:
+                self._derived[key] = built
+                self._enforce_budget(keep=key)
+            return built
+
+    @property
+    def memory_in_use(self) -> int:
+        lexicons = sum(lexicon.size_bytes for lexicon in self._loaded.values())
+        return lexicons + sum(item.size_bytes for item in self._derived.values())
+
+    def loaded_languages(self) -> list[str]:
+        return list(self._loaded)
+
+    def stats(self) -> dict[str, object]:
+        """Načítané lexikóny a odvodené štruktúry s ich pamäťou."""
+        with self._lock:
+            return {
+                "lexicons": {lang: lex.size_bytes for lang, lex in self._loaded.items()},
+                "derived": {
+                    f"{lang}:{kind}": item.size_bytes
+                    for (lang, kind), item in self._derived.items()
+                },
+                "memory_in_use": self.memory_in_use,
+                "memory_budget": self.memory_budget_bytes,
+                "loads": self.loads,
+                "evictions": self.evictions,
+            }
+
+    def evict(self, name: str) -> bool:
+        language = language_key(name) or name
+        with self._lock:
+            for key in [key for key in self._derived if key[0] == language]:
+                del self._derived[key]
+            return self._loaded.pop(language, None) is not None
+
+    def _enforce_budget(self, *, keep: str | tuple[str, str]) -> None:
+        while self.memory_in_use > self.memory_budget_bytes:
+            # odvodené štruktúry sa dajú postaviť znova, uvoľnia sa prvé
+            victim = next((key for key in self._derived if key != keep), None)
+            if victim is not None:
+                del self._derived[victim]
+                self.evictions += 1
+                log.info("%s for %s evicted (budget %d bytes)",
+                         victim[1], victim[0], self.memory_budget_bytes)
+                continue
+            if len(self._loaded) <= 1:
+                break
+            oldest = next(iter(self._loaded))
+            if oldest == keep:
+                break
+            del self._loaded[oldest]
+            self.evictions += 1
+            log.info("Lexicon %s evicted (budget %d bytes)", oldest, self.memory_budget_bytes)
+
+
+_REGISTRY: LexiconRegistry | None = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_lexicon_registry() -> LexiconRegistry:
+    """Zdieľaný register pre rozhodcu, nástroje aj UI."""
+
+    global _REGISTRY
+    if _REGISTRY is None:
+        with _REGISTRY_LOCK:
+            if _REGISTRY is None:
+                _REGISTRY = LexiconRegistry()
+    return _REGISTRY
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, cast
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Sequence, cast
 
 from google.genai import types
 
@@ -12,6 +16,12 @@ from . import tool_registry
 
 log = logging.getLogger("scrabgpt.ai.tool_adapter")
 
+# Worker threads for tool calls of one model round (rule/scoring tools are
+# CPU-bound, JULS lookups wait on the shared async client)
+_TOOL_WORKERS = 8
+_TOOL_POOL: ThreadPoolExecutor | None = None
+_TOOL_POOL_LOCK = threading.Lock()
+
 
 def get_gemini_tools() -> list[types.Tool]:
     """Convert internal tool schemas to Vertex AI Tool definitions.
@@ -131,6 +141,7 @@ def _enrich_args_with_context(
     premium_grid = context.get("premium_grid")
     rack_letters = context.get("rack_letters")
     is_first_move = context.get("is_first_move")
+    language = context.get("language")
 
     if name == "get_rack_letters" and "rack" not in enriched and isinstance(rack_letters, list):
         enriched["rack"] = rack_letters
@@ -142,18 +153,27 @@ def _enrich_args_with_context(
         "validate_move_legality",
         "calculate_move_score",
         "scoring_score_words",
+        "score_moves_batch",
     }:
         if "board_grid" not in enriched and isinstance(board_grid, list):
             enriched["board_grid"] = board_grid
 
-    if name in {"calculate_move_score", "scoring_score_words"}:
+    if name in {"calculate_move_score", "scoring_score_words", "score_moves_batch"}:
         if "premium_grid" not in enriched and isinstance(premium_grid, list):
             enriched["premium_grid"] = premium_grid
 
-    if name == "validate_move_legality":
+    if name in {"validate_move_legality", "score_moves_batch"}:
         if "is_first_move" not in enriched and isinstance(is_first_move, bool):
             enriched["is_first_move"] = is_first_move
 
+    if (
+        name in {"score_moves_batch", "validate_words_batch"}
+        and "language" not in enriched
+        and isinstance(language, str)
+        and language
+    ):
+        enriched["language"] = "english" if language.lower().startswith("en") else "slovak"
+
     return enriched
 
 
@@ -217,3 +237,49 @@ def execute_tool(
     except Exception as e:
         log.exception("Error executing tool %s", name)
         return {"error": str(e)}
+
+
+def _tool_pool() -> ThreadPoolExecutor:
+    global _TOOL_POOL
+    if _TOOL_POOL is None:
+        with _TOOL_POOL_LOCK:
+            if _TOOL_POOL is None:
+                _TOOL_POOL = ThreadPoolExecutor(
+                    max_workers=_TOOL_WORKERS, thread_name_prefix="tool",
+                )
+    return _TOOL_POOL
+
+
+async def execute_tools(
+    calls: Sequence[tuple[str, dict[str, Any]]],
+    *,
+    context: dict[str, Any] | None = None,
+    execute: Callable[..., dict[str, Any]] | None = None,
+) -> list[dict[str, Any]]:
+    """Execute all tool calls of one model round concurrently.
+    
+    Each call runs on the tool thread pool; results come back in call order,
+    so a round costs as long as its slowest tool. Errors are reported per
+    call (see `execute_tool`).
+    
+    Args:
+        calls: (tool name, arguments) pairs in the order the model issued them
+        context: Live game context passed to every call
+        execute: Single-call executor (default: `execute_tool`)
+        
+    Returns:
+        Tool result dictionaries, one per call, in order
+    """
+    run = execute or execute_tool
+    if not calls:
+        return []
+    if len(calls) == 1:
+        name, args = calls[0]
+        return [await asyncio.to_thread(run, name, args, context=context)]
+    loop = asyncio.get_running_loop()
+    pool = _tool_pool()
+    futures = [
+        loop.run_in_executor(pool, partial(run, name, args, context=context))
+        for name, args in calls
+    ]
+    return list(await asyncio.gather(*futures))
@@ -9,15 +9,19 @@ Example: tool_rules_placements_in_line, tool_scoring_score_words
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
+import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from pathlib import Path
 from typing import Any, Callable, cast
 
 import httpx
 
-from ..core.board import Board, BOARD_SIZE
+from ..core.board import Board, BOARD_SIZE, FLAG_BLANK
 from ..core.types import Placement, Direction, Premium
 from ..core.rules import (
     first_move_must_cover_center,
@@ -29,25 +33,43 @@ from ..core.rules import (
 from ..core.scoring import score_words
 from ..core.tiles import get_tile_points
 from ..core.assets import get_premiums_path
-from .fastdict import load_dictionary
-from .juls_online import is_word_in_juls
+from ..core.movegen import MoveGenerator
+from .fastdict import iter_words
+from .lexicon import get_lexicon_registry, language_key
+from .juls_online import is_word_in_juls, juls_lookup_many, juls_stats
+from .validation_store import TIER_JULS, get_validation_store
 
 log = logging.getLogger("scrabgpt.ai.tools")
 
 # ========== Global Dictionary Cache ==========
 
-_SLOVAK_DICT: Callable[[str], bool] | None = None
-_ENGLISH_DICT: Callable[[str], bool] | None = None
+# Lexicons are shared process-wide through the LexiconRegistry (see lexicon.py)
 
-# Online validation cache (word -> result, with TTL)
-_VALIDATION_CACHE: dict[str, dict[str, Any]] = {}
+# Validation cache limits (per language partition)
 _CACHE_MAX_SIZE = 10000
 _CACHE_TTL_SECONDS = 3600  # 1 hour
 
-# Performance metrics
+# Performance metrics (tools run concurrently on the tool pool, so updates take the lock)
 _VALIDATION_STATS: defaultdict[str, dict[str, int | float]] = defaultdict(
     lambda: {"count": 0, "time_ms": 0.0, "hits": 0, "misses": 0}
 )
+_VALIDATION_STATS_LOCK = threading.Lock()
+
+# Per-turn board snapshots: hash(board_grid + premium state) -> parsed board.
+# Stored boards are never handed out; tools get a cheap private copy.
+_BOARD_SNAPSHOTS: OrderedDict[str, Board] = OrderedDict()
+_BOARD_SNAPSHOT_MAX = 32
+_BOARD_SNAPSHOT_LOCK = threading.Lock()
+_BOARD_SNAPSHOT_STATS = {"hits": 0, "misses": 0}
+
+# Batch word validation: max words per call
+_VALIDATE_BATCH_MAX_WORDS = 100
+
+# Per-request JULS timeout (lookups share the pooled client in juls_online)
+_JULS_TIMEOUT_SECONDS = 3.0
+
+# Upper bound on candidates evaluated by one score_moves_batch call
+_SCORE_BATCH_MAX_CANDIDATES = 50
 
 # Word length threshold for online validation
 # Words <= this length: only local dict (fast, 99% coverage)
@@ -55,102 +77,207 @@ _VALIDATION_STATS: defaultdict[str, dict[str, int | float]] = defaultdict(
 _ONLINE_VALIDATION_MIN_LENGTH = 7  # Configurable threshold
 
 
+def _get_lexicon_contains(language: str) -> Callable[[str], bool] | None:
+    """Get the shared lexicon lookup for a language (loaded lazily by the registry)."""
+    try:
+        lexicon = get_lexicon_registry().get(language)
+    except Exception as e:
+        log.exception("Failed to load %s dictionary: %s", language, e)
+        return None
+    if lexicon is None:
+        log.warning("No %s dictionary found in %s", language, get_lexicon_registry().dicts_dir)
+        return None
+    return lexicon.contains
+
+
 def _get_slovak_dict() -> Callable[[str], bool] | None:
-    """Get or load Slovak dictionary (singleton pattern with error recovery)."""
-    global _SLOVAK_DICT
-    
-    if _SLOVAK_DICT is None:
-        try:
-            dict_path = Path(__file__).parent / "dicts" / "sk.sorted.txt"
-            if not dict_path.exists():
-                log.warning("Slovak dictionary not found at %s", dict_path)
-                return None
-            
-            log.info("Loading Slovak dictionary from %s", dict_path)
-            start_time = time.time()
-            _SLOVAK_DICT = load_dictionary(dict_path)
-            load_time_ms = (time.time() - start_time) * 1000
-            
-            log.info("Slovak dictionary loaded in %.1f ms", load_time_ms)
-            
-        except Exception as e:
-            log.exception("Failed to load Slovak dictionary: %s", e)
-            return None
-    
-    return _SLOVAK_DICT
+    """Get the shared Slovak dictionary lookup."""
+    return _get_lexicon_contains("slovak")
 
 
 def _get_english_dict() -> Callable[[str], bool] | None:
-    """Get or load English dictionary (TWL/SOWPODS singleton)."""
-    global _ENGLISH_DICT
-    
-    if _ENGLISH_DICT is None:
-        try:
-            # Try TWL first, then SOWPODS as fallback
-            for dict_name in ["twl.txt", "sowpods.txt", "en.txt"]:
-                dict_path = Path(__file__).parent / "dicts" / dict_name
-                if dict_path.exists():
-                    log.info("Loading English dictionary from %s", dict_path)
-                    start_time = time.time()
-                    _ENGLISH_DICT = load_dictionary(dict_path)
-                    load_time_ms = (time.time() - start_time) * 1000
-                    
-                    log.info("English dictionary (%s) loaded in %.1f ms", dict_name, load_time_ms)
-                    return _ENGLISH_DICT
-            
-            log.warning("No English dictionary found (tried: twl.txt, sowpods.txt, en.txt)")
-            return None
-            
-        except Exception as e:
-            log.exception("Failed to load English dictionary: %s", e)
-            return None
-    
-    return _ENGLISH_DICT
+    """Get the shared English dictionary lookup (TWL, then SOWPODS fallback)."""
+    return _get_lexicon_contains("english")
+
+
+def get_move_generator(language: str) -> MoveGenerator | None:
+    """Get or build the exhaustive move generator for a language (one per language).
+
+    Returns None when no word list is available for the language.
+    """
+    registry = get_lexicon_registry()
+    if registry.path_for(language) is None:
+        log.warning("No dictionary for move generator (language=%s)", language)
+        return None
+    # Built once (also under parallel tool calls) and kept within the lexicon memory budget
+    return registry.derived(language, "move_generator", _build_move_generator)
+
+
+def _build_move_generator(language: str, dict_path: Path) -> MoveGenerator | None:
+    try:
+        start_time = time.time()
+        generator = MoveGenerator.from_words(iter_words(dict_path))
+        load_time_ms = (time.time() - start_time) * 1000
+        log.info(
+            "Move generator for %s built from %s (%d words, ~%d KiB) in %.1f ms",
+            language, dict_path.name, len(generator.trie), generator.size_bytes // 1024,
+            load_time_ms,
+        )
+    except Exception as e:
+        log.exception("Failed to build move generator for %s: %s", language, e)
+        return None
+    return generator
+
+
+class _ValidationCache:
+    """LRU cache with TTL for validation results, partitioned by language.
+
+    Every operation is O(1) under a single lock: hits move the entry to the
+    end of its partition's OrderedDict, inserts past the bound pop the least
+    recently used entry, and expired entries are dropped when read.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._partitions: dict[str, OrderedDict[str, tuple[float, dict[str, Any]]]] = {}
+        self._counters: defaultdict[str, dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        )
+        self._lock = threading.Lock()
+
+    def get(self, language: str, word: str) -> dict[str, Any] | None:
+        """Return a copy of the cached result, or None on miss/expiry."""
+        now = time.time()
+        with self._lock:
+            partition = self._partitions.get(language)
+            entry = partition.get(word) if partition is not None else None
+            counters = self._counters[language]
+            if entry is None or partition is None:
+                counters["misses"] += 1
+                return None
+            cached_at, result = entry
+            if now - cached_at >= self.ttl_seconds:
+                del partition[word]
+                counters["expirations"] += 1
+                counters["misses"] += 1
+                return None
+            partition.move_to_end(word)
+            counters["hits"] += 1
+        return dict(result)
+
+    def put(self, language: str, word: str, result: dict[str, Any]) -> None:
+        with self._lock:
+            partition = self._partitions.setdefault(language, OrderedDict())
+            partition[word] = (time.time(), dict(result))
+            partition.move_to_end(word)
+            while len(partition) > self.max_size:
+                partition.popitem(last=False)
+                self._counters[language]["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._partitions.clear()
+            self._counters.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(partition) for partition in self._partitions.values())
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Per-language size and hit/miss/eviction/expiration counters."""
+        with self._lock:
+            languages = set(self._partitions) | set(self._counters)
+            return {
+                language: {
+                    "size": len(self._partitions.get(language, ())),
+                    **self._counters[language],
+                }
+                for language in sorted(languages)
+            }
+
+
+def _bump_stat(key: str, field: str, amount: float = 1) -> None:
+    with _VALIDATION_STATS_LOCK:
+        _VALIDATION_STATS[key][field] += amount
+
+
+def _record_stat_time(key: str, elapsed_ms: float) -> None:
+    """Count one validation of `key` taking `elapsed_ms`."""
+    with _VALIDATION_STATS_LOCK:
+        stat = _VALIDATION_STATS[key]
+        stat["count"] += 1
+        stat["time_ms"] += elapsed_ms
+
+
+# Online validation cache (language -> word -> result, LRU with TTL)
+_VALIDATION_CACHE = _ValidationCache(_CACHE_MAX_SIZE, _CACHE_TTL_SECONDS)
 
 
 def _get_cached_validation(word: str, language: str) -> dict[str, Any] | None:
     """Get cached validation result if available and not expired."""
-    cache_key = f"{language}:{word.upper()}"
-    
-    if cache_key in _VALIDATION_CACHE:
-        cached = _VALIDATION_CACHE[cache_key]
-        age_seconds = time.time() - cached["cached_at"]
-        
-        if age_seconds < _CACHE_TTL_SECONDS:
-            _VALIDATION_STATS[f"{language}_cache"]["hits"] += 1
-            log.debug("Cache HIT for '%s' (age: %.1fs)", word, age_seconds)
-            cached_result = cached.get("result")
-            if isinstance(cached_result, dict):
-                return cached_result
-            return None
-        else:
-            # Expired, remove it
-            del _VALIDATION_CACHE[cache_key]
-            log.debug("Cache EXPIRED for '%s' (age: %.1fs)", word, age_seconds)
-    
-    _VALIDATION_STATS[f"{language}_cache"]["misses"] += 1
+    cached_result = _VALIDATION_CACHE.get(language, word.upper())
+    if cached_result is not None:
+        _bump_stat(f"{language}_cache", "hits")
+        log.debug("Cache HIT for '%s'", word)
+        return cached_result
+
+    persisted = _get_persisted_validation(word, language)
+    if persisted is not None:
+        _bump_stat(f"{language}_cache", "hits")
+        return persisted
+
+    _bump_stat(f"{language}_cache", "misses")
     return None
 
 
-def _cache_validation(word: str, language: str, result: dict[str, Any]) -> None:
-    """Cache validation result with TTL."""
-    # LRU-like eviction: if cache too large, clear oldest 20%
-    if len(_VALIDATION_CACHE) >= _CACHE_MAX_SIZE:
-        # Sort by timestamp and remove oldest 20%
-        sorted_keys = sorted(
-            _VALIDATION_CACHE.keys(),
-            key=lambda k: _VALIDATION_CACHE[k]["cached_at"]
-        )
-        keys_to_remove = sorted_keys[:_CACHE_MAX_SIZE // 5]
-        for key in keys_to_remove:
-            del _VALIDATION_CACHE[key]
-        log.debug("Cache eviction: removed %d old entries", len(keys_to_remove))
-    
-    cache_key = f"{language}:{word.upper()}"
-    _VALIDATION_CACHE[cache_key] = {
-        "result": result,
-        "cached_at": time.time(),
+def _get_persisted_validation(word: str, language: str) -> dict[str, Any] | None:
+    """Look up a JULS/judge verdict from the persistent cache (warms memory on hit)."""
+    store = get_validation_store()
+    if store is None:
+        return None
+    verdict = store.get(language, word)
+    if verdict is None:
+        return None
+    log.debug("Persistent cache HIT for '%s' (%s)", word, verdict.source)
+    result: dict[str, Any] = {
+        "valid": verdict.valid,
+        "language": language,
+        "tier": 2 if verdict.tier == TIER_JULS else 3,
+        "reason": verdict.reason,
+        "source": verdict.source,
+        "time_ms": 0.0,
+        "cached": True,
+        "skipped_online": False,
     }
+    _cache_validation(word, language, result, persist=False)
+    return result
+
+
+def _cache_validation(
+    word: str,
+    language: str,
+    result: dict[str, Any],
+    *,
+    persist: bool = True,
+) -> None:
+    """Cache validation result with TTL (JULS hits also go to the persistent store).
+
+    A JULS miss only means "ask the AI judge", so it stays in memory and is
+    never persisted as a final verdict.
+    """
+    if persist and result.get("tier") == 2 and result.get("valid"):
+        store = get_validation_store()
+        if store is not None:
+            store.put(
+                language,
+                word,
+                valid=bool(result.get("valid")),
+                tier=TIER_JULS,
+                source=str(result.get("source", "")),
+                reason=str(result.get("reason", "")),
+            )
+    _VALIDATION_CACHE.put(language, word.upper(), result)
 
 
 def _normalize_word(word: str) -> str:
@@ -180,6 +307,120 @@ def _is_valid_word_pattern(word: str) -> tuple[bool, str]:
     return True, "Pattern valid"
 
 
+def _coerce_premium(prem_type_raw: Any) -> Premium | None:
+    if not isinstance(prem_type_raw, str):
+        return None
+    key = prem_type_raw.strip().upper()
+    return Premium.__members__.get(key)
+
+
+def _coerce_bool(raw: Any) -> bool:
+    if isinstance(raw, bool):
+        return raw
+    if isinstance(raw, str):
+        return raw.strip().lower() in {"1", "true", "yes", "on"}
+    return bool(raw)
+
+
+def _apply_premium_grid(board: Board, premium_grid: Any) -> None:
+    """Overlay premium state sent by the model (matrix, flat list or [])."""
+    if isinstance(premium_grid, list) and premium_grid:
+        is_matrix = all(isinstance(row, list) for row in premium_grid)
+        is_flat = all(isinstance(item, dict) for item in premium_grid)
+
+        if is_matrix:
+            # Matrix form: tolerate short rows/columns or partial grids.
+            row_count = min(BOARD_SIZE, len(premium_grid))
+            for r in range(row_count):
+                row = premium_grid[r]
+                if not isinstance(row, list):
+                    continue
+                col_count = min(BOARD_SIZE, len(row))
+                for c in range(col_count):
+                    premium_cell = row[c]
+                    if not isinstance(premium_cell, dict):
+                        continue
+                    prem_enum = _coerce_premium(premium_cell.get("type"))
+                    if prem_enum is None:
+                        continue
+                    board.cells[r][c].premium = prem_enum
+                    board.cells[r][c].premium_used = _coerce_bool(
+                        premium_cell.get("used", False)
+                    )
+        elif is_flat:
+            # Flat form: list of {row, col, type, used}
+            for item in premium_grid:
+                if not isinstance(item, dict):
+                    continue
+                row_raw = item.get("row")
+                col_raw = item.get("col")
+                try:
+                    r = int(row_raw)
+                    c = int(col_raw)
+                except (TypeError, ValueError):
+                    continue
+                if not (0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE):
+                    continue
+                prem_enum = _coerce_premium(item.get("type"))
+                if prem_enum is None:
+                    continue
+                board.cells[r][c].premium = prem_enum
+                board.cells[r][c].premium_used = _coerce_bool(item.get("used", False))
+        else:
+            log.debug(
+                "Ignoring unsupported premium_grid structure in tool_scoring_score_words"
+            )
+    elif isinstance(premium_grid, list) and not premium_grid:
+        # Empty list: mark all premiums as used (no premiums active)
+        for r in range(BOARD_SIZE):
+            for c in range(BOARD_SIZE):
+                if board.cells[r][c].premium:
+                    board.cells[r][c].premium_used = True
+    else:
+        log.debug("Ignoring non-list premium_grid in tool_scoring_score_words")
+
+
+def _board_snapshot_key(board_grid: list[str], premium_grid: Any) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for row in board_grid:
+        digest.update(str(row).encode("utf-8"))
+        digest.update(b"\n")
+    digest.update(b"\x00")
+    digest.update(json.dumps(premium_grid, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _board_from_grid(board_grid: list[str], premium_grid: Any = None) -> Board:
+    """Return a private Board for `board_grid` (+ optional premium overrides).
+
+    The parsed position is cached per turn (keyed by a hash of the grid and
+    premium state), so repeated tool calls only pay for a cheap copy and can
+    overlay their candidate placements on it freely.
+    """
+    key = _board_snapshot_key(board_grid, premium_grid)
+    with _BOARD_SNAPSHOT_LOCK:
+        template = _BOARD_SNAPSHOTS.get(key)
+        if template is not None:
+            _BOARD_SNAPSHOTS.move_to_end(key)
+            _BOARD_SNAPSHOT_STATS["hits"] += 1
+            return template.copy()
+
+    template = Board(get_premiums_path())
+    for r, row in enumerate(board_grid):
+        for c, ch in enumerate(row):
+            if ch != ".":
+                template.cells[r][c].letter = ch
+    if premium_grid is not None:
+        _apply_premium_grid(template, premium_grid)
+
+    with _BOARD_SNAPSHOT_LOCK:
+        _BOARD_SNAPSHOT_STATS["misses"] += 1
+        _BOARD_SNAPSHOTS[key] = template
+        while len(_BOARD_SNAPSHOTS) > _BOARD_SNAPSHOT_MAX:
+            _BOARD_SNAPSHOTS.popitem(last=False)
+    return template.copy()
+
+
 # ========== Rule Validation Tools ==========
 
 
@@ -260,12 +501,8 @@ def tool_rules_connected_to_existing(
         {valid: bool, reason: str}
     """
     try:
-        # Reconstruct board from grid
-        board = Board(get_premiums_path())
-        for r, row in enumerate(board_grid):
-            for c, ch in enumerate(row):
-                if ch != ".":
-                    board.cells[r][c].letter = ch
+        # Reconstruct board from grid (cached per position)
+        board = _board_from_grid(board_grid)
         
         placement_objs = [
             Placement(row=p["row"], col=p["col"], letter=p["letter"])
@@ -302,11 +539,7 @@ def tool_rules_no_gaps_in_line(
         {valid: bool, reason: str}
     """
     try:
-        board = Board(get_premiums_path())
-        for r, row in enumerate(board_grid):
-            for c, ch in enumerate(row):
-                if ch != ".":
-                    board.cells[r][c].letter = ch
+        board = _board_from_grid(board_grid)
         
         placement_objs = [
             Placement(row=p["row"], col=p["col"], letter=p["letter"])
@@ -342,11 +575,7 @@ def tool_rules_extract_all_words(
         {words: list[{word: str, cells: list[list[int]]}]}
     """
     try:
-        board = Board(get_premiums_path())
-        for r, row in enumerate(board_grid):
-            for c, ch in enumerate(row):
-                if ch != ".":
-                    board.cells[r][c].letter = ch
+        board = _board_from_grid(board_grid)
         
         placement_objs = [
             Placement(row=p["row"], col=p["col"], letter=p["letter"])
@@ -392,83 +621,8 @@ def tool_scoring_score_words(
         {total_score: int, breakdowns: list[{word, base_points, ...}]}
     """
     try:
-        def _coerce_premium(prem_type_raw: Any) -> Premium | None:
-            if not isinstance(prem_type_raw, str):
-                return None
-            key = prem_type_raw.strip().upper()
-            return Premium.__members__.get(key)
-
-        def _coerce_bool(raw: Any) -> bool:
-            if isinstance(raw, bool):
-                return raw
-            if isinstance(raw, str):
-                return raw.strip().lower() in {"1", "true", "yes", "on"}
-            return bool(raw)
-
-        board = Board(get_premiums_path())
-        
-        # Reconstruct board with letters
-        for r, row in enumerate(board_grid):
-            for c, ch in enumerate(row):
-                if ch != ".":
-                    board.cells[r][c].letter = ch
-        
-        # Apply premiums if provided
-        if premium_grid is not None:
-            if isinstance(premium_grid, list) and premium_grid:
-                is_matrix = all(isinstance(row, list) for row in premium_grid)
-                is_flat = all(isinstance(item, dict) for item in premium_grid)
-
-                if is_matrix:
-                    # Matrix form: tolerate short rows/columns or partial grids.
-                    row_count = min(BOARD_SIZE, len(premium_grid))
-                    for r in range(row_count):
-                        row = premium_grid[r]
-                        if not isinstance(row, list):
-                            continue
-                        col_count = min(BOARD_SIZE, len(row))
-                        for c in range(col_count):
-                            premium_cell = row[c]
-                            if not isinstance(premium_cell, dict):
-                                continue
-                            prem_enum = _coerce_premium(premium_cell.get("type"))
-                            if prem_enum is None:
-                                continue
-                            board.cells[r][c].premium = prem_enum
-                            board.cells[r][c].premium_used = _coerce_bool(
-                                premium_cell.get("used", False)
-                            )
-                elif is_flat:
-                    # Flat form: list of {row, col, type, used}
-                    for item in premium_grid:
-                        if not isinstance(item, dict):
-                            continue
-                        row_raw = item.get("row")
-                        col_raw = item.get("col")
-                        try:
-                            r = int(row_raw)
-                            c = int(col_raw)
-                        except (TypeError, ValueError):
-                            continue
-                        if not (0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE):
-                            continue
-                        prem_enum = _coerce_premium(item.get("type"))
-                        if prem_enum is None:
-                            continue
-                        board.cells[r][c].premium = prem_enum
-                        board.cells[r][c].premium_used = _coerce_bool(item.get("used", False))
-                else:
-                    log.debug(
-                        "Ignoring unsupported premium_grid structure in tool_scoring_score_words"
-                    )
-            elif isinstance(premium_grid, list) and not premium_grid:
-                # Empty list: mark all premiums as used (no premiums active)
-                for r in range(BOARD_SIZE):
-                    for c in range(BOARD_SIZE):
-                        if board.cells[r][c].premium:
-                            board.cells[r][c].premium_used = True
-            else:
-                log.debug("Ignoring non-list premium_grid in tool_scoring_score_words")
+        # Reconstruct board with letters and premium state (cached per position)
+        board = _board_from_grid(board_grid, premium_grid)
         
         placement_objs = [
             Placement(row=p["row"], col=p["col"], letter=p["letter"])
@@ -520,20 +674,12 @@ def tool_get_board_state(board: Board | None = None) -> dict[str, Any]:
         if board is None:
             board = Board(get_premiums_path())
         
-        grid = []
-        blanks = []
-        
-        for r in range(BOARD_SIZE):
-            row_chars = []
-            for c in range(BOARD_SIZE):
-                cell = board.cells[r][c]
-                if cell.letter:
-                    row_chars.append(cell.letter)
-                    if cell.is_blank:
-                        blanks.append({"row": r, "col": c})
-                else:
-                    row_chars.append(".")
-            grid.append("".join(row_chars))
+        grid = board.grid_rows()
+        blanks = [
+            {"row": r, "col": c}
+            for r, c in board.positions_with_flag(FLAG_BLANK)
+            if board.get_letter(r, c)
+        ]
         
         return {"grid": grid, "blanks": blanks}
     except Exception as e:
@@ -663,12 +809,34 @@ def tool_validate_word_slovak(
     start_time = time.time()
     word_normalized = _normalize_word(word)
     
+    local_result = _validate_slovak_local(
+        word_normalized,
+        online_min_length=online_min_length,
+        start_time=start_time,
+    )
+    if local_result is not None:
+        return local_result
+    
+    return _validate_slovak_online(
+        word_normalized,
+        use_online=use_online,
+        retry_count=retry_count,
+        start_time=start_time,
+    )
+
+
+def _validate_slovak_local(
+    word_normalized: str,
+    *,
+    online_min_length: int | None,
+    start_time: float,
+) -> dict[str, Any] | None:
+    """Pattern, cache and local dictionary tiers; None means the word needs JULS."""
     # ========== Pre-validation: Pattern Check ==========
     is_valid_pattern, pattern_reason = _is_valid_word_pattern(word_normalized)
     if not is_valid_pattern:
         elapsed_ms = (time.time() - start_time) * 1000
-        _VALIDATION_STATS["slovak_pattern"]["count"] += 1
-        _VALIDATION_STATS["slovak_pattern"]["time_ms"] += elapsed_ms
+        _record_stat_time("slovak_pattern", elapsed_ms)
         
         return {
             "valid": False,
@@ -696,8 +864,7 @@ def tool_validate_word_slovak(
             is_in_dict = slovak_dict(word_normalized)
             tier1_time_ms = (time.time() - tier1_start) * 1000
             
-            _VALIDATION_STATS["slovak_tier1"]["count"] += 1
-            _VALIDATION_STATS["slovak_tier1"]["time_ms"] += tier1_time_ms
+            _record_stat_time("slovak_tier1", tier1_time_ms)
             
             if is_in_dict:
                 elapsed_ms = (time.time() - start_time) * 1000
@@ -732,7 +899,7 @@ def tool_validate_word_slovak(
         log.debug("⚡ Word '%s' too short (len=%d ≤ %d) for online validation, marking invalid", 
                  word_normalized, len(word_normalized), threshold)
         
-        _VALIDATION_STATS["slovak_short_skip"]["count"] += 1
+        _bump_stat("slovak_short_skip", "count")
         
         result = {
             "valid": False,
@@ -747,87 +914,94 @@ def tool_validate_word_slovak(
         _cache_validation(word_normalized, "slovak", result)
         return result
     
+    return None
+
+
+def _validate_slovak_online(
+    word_normalized: str,
+    *,
+    use_online: bool,
+    retry_count: int,
+    start_time: float,
+) -> dict[str, Any]:
+    """JULS tier with retries, then the needs-judge fallback."""
     # ========== Tier 2: JULS Online API with Retry ==========
+    outcome: bool | Exception | None = None
+    tier2_time_ms = 0.0
     if use_online:
         tier2_start = time.time()
-        last_error: Exception | None = None
-        
-        for attempt in range(1, retry_count + 1):
-            try:
-                timeout = 3.0 + (attempt - 1) * 1.0  # Increase timeout on retry
-                is_in_juls = is_word_in_juls(word_normalized, timeout=timeout)
-                tier2_time_ms = (time.time() - tier2_start) * 1000
-                
-                _VALIDATION_STATS["slovak_tier2"]["count"] += 1
-                _VALIDATION_STATS["slovak_tier2"]["time_ms"] += tier2_time_ms
-                
-                if is_in_juls:
-                    elapsed_ms = (time.time() - start_time) * 1000
-                    log.info("✓ Word '%s' found in JULS (Tier 2, %.1fms, attempt %d)", 
-                            word_normalized, tier2_time_ms, attempt)
-                    
-                    result = {
-                        "valid": True,
-                        "language": "slovak",
-                        "tier": 2,
-                        "reason": f"Found in JULS online dictionary (long word, attempt {attempt})",
-                        "source": "juls_api",
-                        "time_ms": elapsed_ms,
-                        "cached": False,
-                        "skipped_online": False,
-                    }
-                    _cache_validation(word_normalized, "slovak", result)
-                    return result
-                else:
-                    # Negative result - also cache it
-                    elapsed_ms = (time.time() - start_time) * 1000
-                    log.debug("✗ Word '%s' NOT in JULS (long word, attempt %d)", word_normalized, attempt)
-                    
-                    result = {
-                        "valid": False,
-                        "language": "slovak",
-                        "tier": 2,
-                        "reason": "Not found in local dictionary or JULS - needs AI judge verification",
-                        "source": "tier2_negative",
-                        "time_ms": elapsed_ms,
-                        "cached": False,
-                        "skipped_online": False,
-                    }
-                    _cache_validation(word_normalized, "slovak", result)
-                    return result
-                    
-            except httpx.TimeoutException as e:
-                last_error = e
-                log.warning("Tier 2 JULS timeout for '%s' (attempt %d/%d): %s", 
-                           word_normalized, attempt, retry_count, e)
-                if attempt < retry_count:
-                    time.sleep(0.5 * attempt)  # Exponential backoff
-                    
-            except httpx.HTTPError as e:
-                last_error = e
-                log.warning("Tier 2 JULS HTTP error for '%s' (attempt %d/%d): %s", 
-                           word_normalized, attempt, retry_count, e)
-                if attempt < retry_count:
-                    time.sleep(0.5 * attempt)
-                    
-            except Exception as e:
-                last_error = e
-                log.exception("Tier 2 JULS unexpected error for '%s' (attempt %d/%d)", 
-                             word_normalized, attempt, retry_count)
-                break  # Don't retry on unexpected errors
-        
-        # All retries failed
+        try:
+            # Retries back off inside the pooled async client (no blocking sleep)
+            outcome = is_word_in_juls(
+                word_normalized,
+                timeout=_JULS_TIMEOUT_SECONDS,
+                retries=max(0, retry_count - 1),
+            )
+        except (httpx.HTTPError, asyncio.TimeoutError) as e:
+            outcome = e
+        tier2_time_ms = (time.time() - tier2_start) * 1000
+    return _slovak_online_result(
+        word_normalized,
+        outcome,
+        retry_count=retry_count,
+        start_time=start_time,
+        tier2_time_ms=tier2_time_ms,
+    )
+
+
+def _slovak_online_result(
+    word_normalized: str,
+    outcome: bool | Exception | None,
+    *,
+    retry_count: int,
+    start_time: float,
+    tier2_time_ms: float,
+) -> dict[str, Any]:
+    """Turn a JULS outcome (found / not found / error / skipped) into a tool result."""
+    if isinstance(outcome, bool):
+        _record_stat_time("slovak_tier2", tier2_time_ms)
         elapsed_ms = (time.time() - start_time) * 1000
-        log.warning("✗ Tier 2 JULS failed after %d attempts for '%s': %s", 
-                   retry_count, word_normalized, last_error)
-    
+
+        if outcome:
+            log.info("✓ Word '%s' found in JULS (Tier 2, %.1fms)", word_normalized, tier2_time_ms)
+            result = {
+                "valid": True,
+                "language": "slovak",
+                "tier": 2,
+                "reason": "Found in JULS online dictionary (long word)",
+                "source": "juls_api",
+                "time_ms": elapsed_ms,
+                "cached": False,
+                "skipped_online": False,
+            }
+        else:
+            # Negative result - also cache it
+            log.debug("✗ Word '%s' NOT in JULS (long word)", word_normalized)
+            result = {
+                "valid": False,
+                "language": "slovak",
+                "tier": 2,
+                "reason": "Not found in local dictionary or JULS - needs AI judge verification",
+                "source": "tier2_negative",
+                "time_ms": elapsed_ms,
+                "cached": False,
+                "skipped_online": False,
+            }
+        _cache_validation(word_normalized, "slovak", result)
+        return result
+
+    if outcome is not None:
+        # All retries failed
+        log.warning("✗ Tier 2 JULS failed after %d attempts for '%s': %s",
+                   retry_count, word_normalized, outcome)
+
     # ========== Tier 3: Needs AI Judge ==========
     # NOTE: Not implemented here to keep tool stateless
     # Caller should use OpenAIClient.judge_words() if needed
     elapsed_ms = (time.time() - start_time) * 1000
     log.debug("Word '%s' not found in Tier 1-2, needs AI judge (Tier 3)", word_normalized)
     
-    _VALIDATION_STATS["slovak_tier3_needed"]["count"] += 1
+    _bump_stat("slovak_tier3_needed", "count")
     
     result = {
         "valid": False,
@@ -881,8 +1055,7 @@ def tool_validate_word_english(
     is_valid_pattern, pattern_reason = _is_valid_word_pattern(word_normalized)
     if not is_valid_pattern:
         elapsed_ms = (time.time() - start_time) * 1000
-        _VALIDATION_STATS["english_pattern"]["count"] += 1
-        _VALIDATION_STATS["english_pattern"]["time_ms"] += elapsed_ms
+        _record_stat_time("english_pattern", elapsed_ms)
         
         return {
             "valid": False,
@@ -910,8 +1083,7 @@ def tool_validate_word_english(
             is_in_dict = english_dict(word_normalized)
             tier1_time_ms = (time.time() - tier1_start) * 1000
             
-            _VALIDATION_STATS["english_tier1"]["count"] += 1
-            _VALIDATION_STATS["english_tier1"]["time_ms"] += tier1_time_ms
+            _record_stat_time("english_tier1", tier1_time_ms)
             
             elapsed_ms = (time.time() - start_time) * 1000
             
@@ -958,7 +1130,7 @@ def tool_validate_word_english(
     elapsed_ms = (time.time() - start_time) * 1000
     log.debug("Word '%s' not found in English dict, needs AI judge", word_normalized)
     
-    _VALIDATION_STATS["english_tier3_needed"]["count"] += 1
+    _bump_stat("english_tier3_needed", "count")
     
     return {
         "valid": False,
@@ -971,6 +1143,121 @@ def tool_validate_word_english(
     }
 
 
+def tool_validate_words_batch(
+    words: list[str],
+    language: str = "slovak",
+    use_online: bool = True,
+    retry_count: int = 2,
+    online_min_length: int | None = None,
+) -> dict[str, Any]:
+    """Validate many words in one call.
+    
+    All local tiers (pattern, cache, in-memory dictionary, short-word skip)
+    are resolved in a single pass; the remaining long Slovak words go to JULS
+    concurrently. Duplicate words are validated once.
+    
+    Args:
+        words: Words to validate
+        language: "slovak" or "english" (anything else is rejected with an error)
+        use_online: Whether to use JULS for long words missing locally (Slovak only)
+        retry_count: Number of retries per online lookup
+        online_min_length: Minimum word length for online validation (default: 7)
+    
+    Returns:
+        {
+            results: dict[str, dict],  # normalized word -> single-word result
+            language: str,  # "slovak" or "english"
+            valid: list[str],
+            invalid: list[str],
+            all_valid: bool,
+            count: int,
+            online_checked: int,
+            time_ms: float,
+            truncated: bool,  # only when more than 100 distinct words were sent
+            skipped_count: int,  # words not validated (resend them), with `skipped`
+        }
+    """
+    start_time = time.time()
+    try:
+        if not isinstance(words, list):
+            return {"results": {}, "valid": [], "invalid": [], "all_valid": False,
+                    "count": 0, "error": "words must be a list"}
+        language_name = language_key(str(language))
+        if language_name is None:
+            return {"results": {}, "valid": [], "invalid": [], "all_valid": False,
+                    "count": 0, "language": language,
+                    "error": f"Unsupported language '{language}' (use 'slovak' or 'english')"}
+        unique: list[str] = []
+        seen: set[str] = set()
+        for raw in words:
+            word_normalized = _normalize_word(str(raw))
+            if word_normalized not in seen:
+                seen.add(word_normalized)
+                unique.append(word_normalized)
+        # Words over the cap are reported back, never silently dropped
+        skipped = unique[_VALIDATE_BATCH_MAX_WORDS:]
+        unique = unique[:_VALIDATE_BATCH_MAX_WORDS]
+
+        results: dict[str, dict[str, Any]] = {}
+        pending_online: list[str] = []
+        for word_normalized in unique:
+            if language_name == "english":
+                results[word_normalized] = tool_validate_word_english(word_normalized)
+                continue
+            local_result = _validate_slovak_local(
+                word_normalized,
+                online_min_length=online_min_length,
+                start_time=time.time(),
+            )
+            if local_result is not None:
+                results[word_normalized] = local_result
+            else:
+                pending_online.append(word_normalized)
+
+        if pending_online:
+            batch_start = time.time()
+            outcomes: dict[str, bool | Exception] = {}
+            if use_online:
+                # One pooled HTTP/2 connection, lookups multiplexed concurrently
+                outcomes = juls_lookup_many(
+                    pending_online,
+                    timeout=_JULS_TIMEOUT_SECONDS,
+                    retries=max(0, retry_count - 1),
+                )
+            batch_ms = (time.time() - batch_start) * 1000
+            for word_normalized in pending_online:
+                results[word_normalized] = _slovak_online_result(
+                    word_normalized,
+                    outcomes.get(word_normalized),
+                    retry_count=retry_count,
+                    start_time=batch_start,
+                    tier2_time_ms=batch_ms,
+                )
+
+        valid = [w for w in unique if results[w].get("valid")]
+        invalid = [w for w in unique if not results[w].get("valid")]
+        response: dict[str, Any] = {
+            "results": results,
+            "language": language_name,
+            "valid": valid,
+            "invalid": invalid,
+            "all_valid": bool(unique) and not invalid and not skipped,
+            "count": len(unique),
+            "online_checked": len(pending_online) if use_online else 0,
+            "time_ms": (time.time() - start_time) * 1000,
+        }
+        if skipped:
+            response["truncated"] = True
+            response["max_words"] = _VALIDATE_BATCH_MAX_WORDS
+            response["skipped_count"] = len(skipped)
+            response["skipped"] = skipped
+        return response
+    except Exception as e:
+        log.exception("Error in tool_validate_words_batch")
+        return {"results": {}, "valid": [], "invalid": [], "all_valid": False,
+                "count": 0, "error": str(e)}
+
+
 def tool_get_validation_stats() -> dict[str, Any]:
     """Get validation performance statistics.
     
@@ -978,18 +1265,24 @@ def tool_get_validation_stats() -> dict[str, Any]:
         {
             stats: dict[str, dict],  # Per-tier statistics
             cache_size: int,
+            cache_partitions: dict[str, dict],  # Per-language size/hits/misses/evictions/expirations
             cache_hit_rate: float,
+            persistent_cache: dict | None,  # On-disk verdict store (None if disabled)
+            juls_requests: dict[str, int],  # JULS lookups sent vs. coalesced with one in flight
+            lexicons: dict,  # Loaded lexicons and move generators with their memory
         }
     """
+    with _VALIDATION_STATS_LOCK:
+        validation_stats = {key: dict(stat) for key, stat in _VALIDATION_STATS.items()}
     # Calculate cache hit rate
-    total_hits = sum(stat["hits"] for key, stat in _VALIDATION_STATS.items() if "cache" in key)
-    total_misses = sum(stat["misses"] for key, stat in _VALIDATION_STATS.items() if "cache" in key)
+    total_hits = sum(stat["hits"] for key, stat in validation_stats.items() if "cache" in key)
+    total_misses = sum(stat["misses"] for key, stat in validation_stats.items() if "cache" in key)
     total_requests = total_hits + total_misses
     cache_hit_rate = total_hits / total_requests if total_requests > 0 else 0.0
     
     # Calculate average times
     stats_summary = {}
-    for key, stat in _VALIDATION_STATS.items():
+    for key, stat in validation_stats.items():
         if stat["count"] > 0:
             avg_time_ms = stat["time_ms"] / stat["count"]
             stats_summary[key] = {
@@ -998,12 +1291,17 @@ def tool_get_validation_stats() -> dict[str, Any]:
                 "total_time_ms": round(stat["time_ms"], 2),
             }
     
+    store = get_validation_store()
     return {
         "stats": stats_summary,
         "cache_size": len(_VALIDATION_CACHE),
+        "cache_partitions": _VALIDATION_CACHE.stats(),
         "cache_hit_rate": round(cache_hit_rate, 3),
         "cache_hits": total_hits,
         "cache_misses": total_misses,
+        "persistent_cache": store.stats() if store is not None else None,
+        "juls_requests": juls_stats(),
+        "lexicons": get_lexicon_registry().stats(),
     }
 
 
@@ -1189,6 +1487,178 @@ def tool_calculate_move_score(
         }
 
 
+def _batch_candidate_placements(candidate: Any) -> list[dict[str, Any]] | None:
+    """Accept either a bare placement list or {placements: [...]} per candidate."""
+    if isinstance(candidate, dict):
+        candidate = candidate.get("placements")
+    if not isinstance(candidate, list):
+        return None
+    return [p for p in candidate if isinstance(p, dict)]
+
+
+def _score_batch_candidate(
+    index: int,
+    candidate: Any,
+    *,
+    board: Board,
+    board_grid: list[str],
+    is_first_move: bool,
+    validate_words: bool,
+    validator: Callable[..., dict[str, Any]],
+    word_validity: dict[str, dict[str, Any]],
+) -> dict[str, Any]:
+    """Evaluate one `tool_score_moves_batch` candidate on the shared batch board."""
+    placements = _batch_candidate_placements(candidate)
+    entry: dict[str, Any] = {
+        "index": index,
+        "legal": False,
+        "words": [],
+        "all_words_valid": False,
+        "total_score": 0,
+        "breakdowns": [],
+    }
+    if placements is None:
+        entry["reason"] = "Candidate has no placements list"
+        return entry
+
+    legality = tool_validate_move_legality(board_grid, placements, is_first_move)
+    entry["legal"] = bool(legality.get("valid"))
+    entry["reason"] = legality.get("reason", "")
+    entry["checks"] = legality.get("checks", {})
+    if not entry["legal"]:
+        return entry
+
+    placement_objs = [
+        Placement(row=int(p["row"]), col=int(p["col"]), letter=p["letter"])
+        for p in placements
+    ]
+    with board.applied(placement_objs):
+        words_found = extract_all_words(board, placement_objs)
+        if not words_found:
+            entry["legal"] = False
+            entry["reason"] = "No words formed"
+            return entry
+        total_score, breakdowns = score_words(
+            board,
+            placement_objs,
+            [(wf.word, wf.letters) for wf in words_found],
+        )
+
+    words_payload: list[dict[str, Any]] = []
+    for wf in words_found:
+        word_entry: dict[str, Any] = {
+            "word": wf.word,
+            "cells": [[r, c] for r, c in wf.letters],
+        }
+        if validate_words:
+            key = wf.word.upper()
+            verdict = word_validity.get(key)
+            if verdict is None:
+                verdict = validator(key, use_online=False)
+                word_validity[key] = verdict
+            word_entry["valid"] = bool(verdict.get("valid"))
+            word_entry["source"] = verdict.get("source", "")
+        words_payload.append(word_entry)
+
+    entry["words"] = words_payload
+    entry["all_words_valid"] = all(w.get("valid", True) for w in words_payload)
+    entry["total_score"] = total_score
+    entry["breakdowns"] = [
+        {
+            "word": bd.word,
+            "base_points": bd.base_points,
+            "letter_bonus_points": bd.letter_bonus_points,
+            "word_multiplier": bd.word_multiplier,
+            "total": bd.total,
+        }
+        for bd in breakdowns
+    ]
+    return entry
+
+
+def tool_score_moves_batch(
+    board_grid: list[str],
+    premium_grid: list[Any] | None,
+    candidates: list[Any],
+    is_first_move: bool = False,
+    language: str = "slovak",
+    validate_words: bool = True,
+) -> dict[str, Any]:
+    """Check legality, extract words, validate and score many candidates at once.
+    
+    Args:
+        board_grid: 15x15 grid as list of strings
+        premium_grid: 15x15 grid of premium info (same as calculate_move_score)
+        candidates: List of candidates; each is {placements: [...]} or a placement list
+        is_first_move: Whether this is the first move
+        language: "slovak" or "english" for dictionary checks
+        validate_words: Check each formed word against the local dictionary
+    
+    Returns:
+        {results: list[{index, legal, reason, checks, words, all_words_valid,
+         total_score, breakdowns}], count: int, best_index: int | None}
+    """
+    try:
+        if not isinstance(candidates, list):
+            return {"results": [], "count": 0, "best_index": None, "error": "candidates must be a list"}
+        truncated = len(candidates) > _SCORE_BATCH_MAX_CANDIDATES
+        candidates = candidates[:_SCORE_BATCH_MAX_CANDIDATES]
+
+        validator = (
+            tool_validate_word_english
+            if language.strip().lower().startswith("en")
+            else tool_validate_word_slovak
+        )
+        word_validity: dict[str, dict[str, Any]] = {}
+        # One private board per batch; candidates are applied and undone in turn.
+        board = _board_from_grid(board_grid, premium_grid)
+
+        results: list[dict[str, Any]] = []
+        best_index: int | None = None
+        best_score = -1
+        for index, candidate in enumerate(candidates):
+            try:
+                entry = _score_batch_candidate(
+                    index,
+                    candidate,
+                    board=board,
+                    board_grid=board_grid,
+                    is_first_move=is_first_move,
+                    validate_words=validate_words,
+                    validator=validator,
+                    word_validity=word_validity,
+                )
+            except Exception as e:
+                # A malformed candidate fails alone, not the whole batch
+                log.exception("Error scoring candidate %d in tool_score_moves_batch", index)
+                entry = {
+                    "index": index,
+                    "legal": False,
+                    "words": [],
+                    "all_words_valid": False,
+                    "total_score": 0,
+                    "breakdowns": [],
+                    "error": str(e),
+                }
+            results.append(entry)
+            if entry["legal"] and entry["all_words_valid"] and entry["total_score"] > best_score:
+                best_score = entry["total_score"]
+                best_index = index
+
+        response: dict[str, Any] = {
+            "results": results,
+            "count": len(results),
+            "best_index": best_index,
+        }
+        if truncated:
+            response["truncated"] = True
+            response["max_candidates"] = _SCORE_BATCH_MAX_CANDIDATES
+        return response
+    except Exception as e:
+        log.exception("Error in tool_score_moves_batch")
+        return {"results": [], "count": 0, "best_index": None, "error": str(e)}
+
+
 # ========== Tool Registry ==========
 
 
@@ -1206,8 +1676,10 @@ ALL_TOOLS = {
     "get_tile_values": tool_get_tile_values,
     "validate_word_slovak": tool_validate_word_slovak,
     "validate_word_english": tool_validate_word_english,
+    "validate_words_batch": tool_validate_words_batch,
     "validate_move_legality": tool_validate_move_legality,
     "calculate_move_score": tool_calculate_move_score,
+    "score_moves_batch": tool_score_moves_batch,
     "get_validation_stats": tool_get_validation_stats,
 }
 
@@ -9,10 +9,11 @@ import os
 import re
 from copy import deepcopy
 from dataclasses import asdict
-from typing import Any, Callable
+from typing import Any, Awaitable, Callable, Iterable
 
 from ..core.variant_store import VariantDefinition
 from ..core.board import Board
+from ..core.movegen import BINGO_BONUS, RACK_SIZE, GeneratedMove
 from ..core.types import Placement
 from ..core.rules import (
     extract_all_words,
@@ -22,9 +23,12 @@ from ..core.rules import (
     connected_to_existing,
 )
 from ..core.scoring import score_words
+from .hedging import LEG_HEDGE, get_latency_tracker, hedged_call
 from .openrouter import OpenRouterClient
 from .schema import parse_ai_move, to_move_payload
 from .player import _build_prompt
+from .rate_limiter import limiter_stats
+from .token_usage import prompt_cache_stats
 from .client import OpenAIClient
 
 log = logging.getLogger("scrabgpt.ai.multi_model")
@@ -51,8 +55,11 @@ _TOOL_WORKFLOW_INSTRUCTION = (
     "1) FIRST call get_board_state.\n"
     "2) SECOND call get_premium_squares.\n"
     "3) THEN evaluate multiple candidate words in a loop.\n"
-    "4) For each candidate, use validate_move_legality + calculate_move_score.\n"
-    "5) Validate candidate words with validate_word_slovak/validate_word_english.\n"
+    "4) Score candidates in bulk with score_moves_batch (legality, words, dictionary validity "
+    "and score for many candidates in ONE call); use validate_move_legality + "
+    "calculate_move_score only for single follow-up checks.\n"
+    "5) Validate doubtful words with validate_words_batch (many words per call) "
+    "or validate_word_slovak/validate_word_english.\n"
     "6) If rack contains '?', you MUST evaluate candidates that consume '?'.\n"
     "7) Evaluate at least 5 candidates when possible.\n"
     "8) Prioritize candidates that consume more rack letters; prefer legal 7-tile bingo when available.\n"
@@ -75,6 +82,21 @@ def _timeout_fallback_model(model_id: str) -> str | None:
     return chain.get(normalized)
 
 
+def _hedge_model_for(model_id: str) -> str | None:
+    """Fallback model used as the speculative hedge leg (same provider prefix)."""
+    fallback = _timeout_fallback_model(model_id)
+    if fallback is None:
+        return None
+    if model_id.startswith("google/"):
+        fallback = f"google/{fallback}"
+    return None if fallback == model_id else fallback
+
+
+def _call_succeeded(result: dict[str, Any]) -> bool:
+    status = result.get("status", "ok")
+    return status == "ok" and bool(str(result.get("content") or "").strip())
+
+
 def _extract_rack_letters(compact_state: str) -> list[str]:
     """Best-effort rack extraction from compact state."""
     rack_match = re.search(r"(?:ai_)?rack:\s*(?:\[(.*?)\]|(.*))", compact_state)
@@ -149,6 +171,63 @@ def _serialize_premium_squares(board: Board) -> list[dict[str, Any]]:
     return premiums
 
 
+def race_score_target(
+    threshold: int | None,
+    best_local_score: int | None = None,
+) -> int | None:
+    """Score that ends a multi-model race early (None = wait for all models).
+
+    A move worth `threshold` points is good enough; a move equal to the best
+    score the local move generator found cannot be beaten, so the lower of
+    the two wins.
+    """
+    targets = [t for t in (threshold, best_local_score) if t is not None and t > 0]
+    return min(targets) if targets else None
+
+
+def local_race_bound(moves: Iterable[GeneratedMove]) -> int | None:
+    """Best local move score on the scale model moves are scored on.
+
+    Model results are scored with `score_words` alone, so the bingo bonus the
+    move generator adds to full-rack plays is left out of the bound.
+    """
+    scores = [
+        move.score - BINGO_BONUS if len(move.placements) == RACK_SIZE else move.score
+        for move in moves
+    ]
+    return max(scores) if scores else None
+
+
+async def _race_for_score(
+    tasks: list[asyncio.Task[dict[str, Any]]],
+    race_score: int,
+) -> list[Any]:
+    """Wait until a judged-valid move reaches `race_score`, then cancel the rest.
+
+    Returns per-task outcomes like `gather(..., return_exceptions=True)`;
+    cancelled tasks yield `CancelledError`.
+    """
+    pending: set[asyncio.Task[dict[str, Any]]] = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if any(_reaches_score(task, race_score) for task in done):
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+    if pending:
+        log.info("Race won at >= %d points; cancelling %d model(s)", race_score, len(pending))
+    return list(await asyncio.gather(*tasks, return_exceptions=True))
+
+
+def _reaches_score(task: asyncio.Task[dict[str, Any]], race_score: int) -> bool:
+    if task.cancelled() or task.exception() is not None:
+        return False
+    result = task.result()
+    return result.get("status") == "ok" and int(result.get("score", -1)) >= race_score
+
+
 async def propose_move_multi_model(
     client: OpenRouterClient,
     models: list[dict[str, Any]],
@@ -162,11 +241,21 @@ async def propose_move_multi_model(
     tools: list[Any] | None = None,
     allow_model_fallback: bool = True,
     enforce_tool_workflow: bool = False,
+    race_score: int | None = None,
+    hedge_requests: bool = True,
 ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
     """Call multiple models concurrently and return best move + all results.
     
     Validates each move with the judge before selecting the winner.
     Each model is called exactly once - no retries or fallbacks.
+
+    With `race_score` set, the first judged-valid move scoring at least that
+    many points ends the turn: models still working are cancelled and reported
+    with status "cancelled" (see `race_score_target`).
+
+    With `hedge_requests`, a model that shows no activity within its learned
+    p90 latency gets a parallel request to its fallback model; the first
+    successful answer wins and the payload's "hedge" entry records the leg.
     """
     prompt = _build_prompt(compact_state, variant)
     
@@ -188,6 +277,7 @@ async def propose_move_multi_model(
         "premium_grid": _serialize_premium_grid(board),
         "premium_squares": _serialize_premium_squares(board),
         "rack_letters": _extract_rack_letters(compact_state),
+        "language": variant.language,
         "is_first_move": not any(
             board.cells[r][c].letter for r in range(15) for c in range(15)
         ),
@@ -208,6 +298,8 @@ async def propose_move_multi_model(
         active_model_id = model_id
         active_model_name = str(model_info.get("name", model_id))
         fallback_origin: str | None = None
+        hedge_record: dict[str, Any] | None = None
+        latency = get_latency_tracker()
         client_module = str(getattr(client.__class__, "__module__", "")).lower()
         is_vertex_client = "vertex" in client_module
         # Use provided timeout or default, but ensure we have a deadline
@@ -241,6 +333,57 @@ async def propose_move_multi_model(
                 log.exception("Progress callback failed for model %s", model_id)
             return payload
 
+        def _leg(
+            leg_model_id: str,
+            leg_kwargs: dict[str, Any],
+            *,
+            speculative: bool,
+        ) -> Callable[[asyncio.Event], Awaitable[dict[str, Any]]]:
+            """One call of `leg_model_id`; sets `activity` on its first progress/answer."""
+
+            async def run(activity: asyncio.Event) -> dict[str, Any]:
+                loop = asyncio.get_running_loop()
+                started = loop.time()
+
+                def seen() -> None:
+                    if not activity.is_set():
+                        activity.set()
+                        latency.record(leg_model_id, loop.time() - started)
+
+                def censored() -> None:
+                    # Timed out or cancelled (lost the hedge or the race) without a sign
+                    # of life: the elapsed time is a lower bound, but leaving it out
+                    # would keep the learned quantile too low.
+                    if not activity.is_set():
+                        latency.record(leg_model_id, loop.time() - started)
+
+                call_kwargs = dict(leg_kwargs)
+                if speculative and "messages" in call_kwargs:
+                    call_kwargs["messages"] = deepcopy(call_kwargs["messages"])
+                if "progress_callback" in call_kwargs:
+                    async def on_progress(payload: dict[str, Any]) -> dict[str, Any]:
+                        seen()
+                        return await _notify(payload)
+
+                    call_kwargs["progress_callback"] = on_progress
+                try:
+                    result = await client.call_model(
+                        leg_model_id,
+                        prompt,
+                        max_tokens=model_info.get("max_tokens") or client.ai_move_max_output_tokens,
+                        **call_kwargs,
+                    )
+                except asyncio.CancelledError:
+                    censored()
+                    raise
+                if _call_succeeded(result):
+                    seen()
+                elif result.get("status") == "timeout":
+                    censored()
+                return result
+
+            return run
+
         await _notify(
             {
                 "status": "pending",
@@ -336,15 +479,33 @@ async def propose_move_multi_model(
                     vertex_timeout_hint = kwargs.get("request_timeout_seconds")
                     if isinstance(vertex_timeout_hint, (int, float)):
                         call_timeout = max(5.0, min(float(remaining_time), float(vertex_timeout_hint)))
-                result = await asyncio.wait_for(
-                    client.call_model(
-                        active_model_id,
-                        prompt, 
-                        max_tokens=model_info.get("max_tokens") or client.ai_move_max_output_tokens, 
-                        **kwargs
-                    ), 
-                    timeout=call_timeout
+                hedge_model = _hedge_model_for(active_model_id) if hedge_requests else None
+                hedge_delay = latency.quantile_for(active_model_id) if hedge_model else None
+                result, leg, hedged = await asyncio.wait_for(
+                    hedged_call(
+                        _leg(active_model_id, kwargs, speculative=False),
+                        _leg(hedge_model, kwargs, speculative=True) if hedge_model else None,
+                        delay=hedge_delay,
+                        is_success=_call_succeeded,
+                    ),
+                    timeout=call_timeout,
                 )
+                if hedged:
+                    hedge_record = {
+                        "primary": active_model_id,
+                        "hedge": hedge_model,
+                        "winner": leg,
+                        "delay_seconds": round(hedge_delay or 0.0, 2),
+                    }
+                    log.info(
+                        "Hedged %s after %.1fs with %s; %s leg won",
+                        active_model_id, hedge_delay or 0.0, hedge_model, leg,
+                    )
+                    if leg == LEG_HEDGE and hedge_model:
+                        if fallback_origin is None:
+                            fallback_origin = active_model_id
+                        active_model_id = hedge_model
+                        active_model_name = hedge_model
             except asyncio.TimeoutError:
                 remaining_after_timeout = deadline - asyncio.get_event_loop().time()
                 if (
@@ -514,6 +675,8 @@ async def propose_move_multi_model(
                     payload["fallback_from"] = fallback_from
                 elif fallback_origin:
                     payload["fallback_from"] = fallback_origin
+                if hedge_record is not None:
+                    payload["hedge"] = hedge_record
                 return await _notify(payload)
             
             # 1. Parse
@@ -681,8 +844,8 @@ async def propose_move_multi_model(
                 else:
                     # Validate words
                     try:
-                        judge_response = await asyncio.to_thread(
-                            judge_client.judge_words, words, language=variant.language
+                        judge_response = await judge_client.judge_words_async(
+                            words, language=variant.language
                         )
                         judge_valid = judge_response.get("all_valid", False)
                         if not judge_valid:
@@ -718,6 +881,8 @@ async def propose_move_multi_model(
                     payload["fallback_from"] = fallback_from
                 elif fallback_origin:
                     payload["fallback_from"] = fallback_origin
+                if hedge_record is not None:
+                    payload["hedge"] = hedge_record
                 return await _notify(payload)
             
             # Failure - Prepare retry
@@ -790,14 +955,31 @@ async def propose_move_multi_model(
             **({"fallback_from": fallback_origin} if fallback_origin else {}),
         })
 
-    tasks = [call_one_model(model) for model in models]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    tasks = [asyncio.ensure_future(call_one_model(model)) for model in models]
+    if race_score is None:
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    else:
+        results = await _race_for_score(tasks, race_score)
+    for limiter_name, snapshot in limiter_stats().items():
+        if snapshot["queued"] or snapshot["throttled"]:
+            log.info("Provider limiter %s: %s", limiter_name, snapshot)
+    log.info("Prompt cache (session): %s", prompt_cache_stats())
     
     # Flatten results
     all_results = []
-    for r in results:
+    for model, r in zip(models, results):
         if isinstance(r, dict):
             all_results.append(r)
+        elif isinstance(r, asyncio.CancelledError):
+            all_results.append({
+                "model": model["id"],
+                "model_name": str(model.get("name", model["id"])),
+                "status": "cancelled",
+                "error": f"Zrušené – iný model už našiel ťah za aspoň {race_score} b.",
+                "move": None,
+                "score": -1,
+                "words": [],
+            })
         else:
             # Exception
             all_results.append({"status": "exception", "error": str(r)})
@@ -466,8 +466,7 @@ async def propose_move_novita_multi_model(
         
         try:
             log.info("Judge validating %s from %s...", words, model_name)
-            judge_response = await asyncio.to_thread(
-                judge_client.judge_words,
+            judge_response = await judge_client.judge_words_async(
                 words,
                 language=variant.language,
             )
@@ -8,14 +8,18 @@ import json
 import logging
 import os
 import time
+import weakref
 from contextlib import contextmanager
 from itertools import count
 from typing import Any, Callable, Iterator
 
-from openai import APITimeoutError, BadRequestError, OpenAI
+from openai import APITimeoutError, AsyncOpenAI, BadRequestError
 
 from ..logging_setup import TRACE_ID_VAR
-from .tool_adapter import execute_tool, get_openai_tools
+from .openai_transport import shared_async_http_client
+from .rate_limiter import get_limiter
+from .token_usage import record_prompt_usage
+from .tool_adapter import execute_tool, execute_tools, get_openai_tools
 
 log = logging.getLogger("scrabgpt.ai.openai_tools")
 
@@ -52,15 +56,31 @@ class OpenAIToolClient:
                 ", ".join(sorted(default_headers.keys())),
             )
 
-        self.client = OpenAI(
-            api_key=resolved_api_key if resolved_api_key else None,
-            timeout=self.timeout_seconds,
-            max_retries=0,
-            **client_kwargs,
+        self._api_key = resolved_api_key or None
+        self._client_kwargs = client_kwargs
+        # AsyncOpenAI per event loop; all of them share the loop's connection pool
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI] = (
+            weakref.WeakKeyDictionary()
         )
         self.ai_move_max_output_tokens = self._resolve_ai_move_max_tokens()
         self._call_counter = count(1)
 
+    @property
+    def client(self) -> AsyncOpenAI:
+        """AsyncOpenAI client of the running event loop (created on first use)."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = AsyncOpenAI(
+                api_key=self._api_key,
+                timeout=self.timeout_seconds,
+                max_retries=0,
+                http_client=shared_async_http_client(),
+                **self._client_kwargs,
+            )
+            self._clients[loop] = client
+        return client
+
     @staticmethod
     def _parse_positive_int(value: Any) -> int | None:
         if value is None:
@@ -200,7 +220,7 @@ class OpenAIToolClient:
             return conversation
         return [{"role": "user", "content": prompt}]
 
-    def _create_chat_completion(
+    async def _create_chat_completion(
         self,
         *,
         model_id: str,
@@ -218,20 +238,64 @@ class OpenAIToolClient:
         if tools:
             kwargs["tools"] = tools
             kwargs["tool_choice"] = "auto"
+        limiter = get_limiter(self._client_kwargs.get("base_url"), self._api_key)
         try:
-            return self.client.chat.completions.create(
-                max_completion_tokens=max_tokens,
-                **kwargs,
-            )
+            async with limiter.slot():
+                return await self.client.chat.completions.create(
+                    max_completion_tokens=max_tokens,
+                    **kwargs,
+                )
         except APITimeoutError:
             raise
         except Exception as exc:
             if not self._should_retry_with_max_tokens(exc):
                 raise
-            return self.client.chat.completions.create(
-                max_tokens=max_tokens,
-                **kwargs,
-            )
+            async with limiter.slot():
+                return await self.client.chat.completions.create(
+                    max_tokens=max_tokens,
+                    **kwargs,
+                )
+
+    @staticmethod
+    def _scored_candidate_signature(
+        total_score_raw: Any,
+        words_payload: Any,
+        placements_payload: Any,
+    ) -> str | None:
+        """Stable key of one scored candidate (words + placements), or None if unscored."""
+        words: list[str] = []
+        if isinstance(words_payload, list):
+            for item in words_payload:
+                if isinstance(item, str):
+                    word = item.strip().upper()
+                    if word:
+                        words.append(word)
+                elif isinstance(item, dict):
+                    word = str(item.get("word") or "").strip().upper()
+                    if word:
+                        words.append(word)
+        try:
+            total_score = int(total_score_raw)
+        except (TypeError, ValueError):
+            total_score = -1
+        if not words or total_score < 0:
+            return None
+        placement_bits: list[str] = []
+        if isinstance(placements_payload, list):
+            for placement in placements_payload:
+                if not isinstance(placement, dict):
+                    continue
+                row = placement.get("row")
+                col = placement.get("col")
+                letter = str(placement.get("letter") or "").strip().upper()
+                if not isinstance(row, int) or not isinstance(col, int):
+                    continue
+                if not letter:
+                    continue
+                placement_bits.append(f"{row}:{col}:{letter}")
+        words_part = "|".join(sorted(set(words)))
+        placements_part = ";".join(sorted(placement_bits))
+        return f"{words_part}#{placements_part}" if placements_part else words_part
 
     async def call_model(
         self,
@@ -289,6 +353,7 @@ class OpenAIToolClient:
             )
             session_deadline = time.monotonic() + session_timeout
             consecutive_timeouts = 0
+            cached_tokens = 0
             validated_word_calls = 0
             scored_candidates: set[str] = set()
             best_content_so_far: str | None = None
@@ -300,8 +365,7 @@ class OpenAIToolClient:
                     break
                 request_timeout = min(float(round_timeout), max(2.0, remaining_session))
                 try:
-                    response = await asyncio.to_thread(
-                        self._create_chat_completion,
+                    response = await self._create_chat_completion(
                         model_id=model_id,
                         messages=conversation,
                         max_tokens=resolved_max_tokens,
@@ -309,6 +373,10 @@ class OpenAIToolClient:
                         request_timeout_seconds=request_timeout,
                     )
                     consecutive_timeouts = 0
+                    round_usage = getattr(response, "usage", None)
+                    cached_tokens += record_prompt_usage(
+                        int(getattr(round_usage, "prompt_tokens", 0) or 0), round_usage,
+                    )
                 except APITimeoutError:
                     consecutive_timeouts += 1
                     remaining_after_timeout = session_deadline - time.monotonic()
@@ -475,56 +543,64 @@ class OpenAIToolClient:
                             }
                         )
 
-                        for idx, call_info in enumerate(assistant_tool_calls):
-                            tool_name = call_info["function"]["name"]
-                            args = tool_calls_data[idx]["args"] if idx < len(tool_calls_data) else {}
-                            result = execute_tool(tool_name, args, context=tool_context)
+                        # All calls of this round run concurrently; results keep call order
+                        round_calls = [
+                            (
+                                call_info["function"]["name"],
+                                tool_calls_data[idx]["args"] if idx < len(tool_calls_data) else {},
+                            )
+                            for idx, call_info in enumerate(assistant_tool_calls)
+                        ]
+                        round_results = await execute_tools(
+                            round_calls, context=tool_context, execute=execute_tool,
+                        )
+                        for call_info, (tool_name, args), result in zip(
+                            assistant_tool_calls, round_calls, round_results
+                        ):
                             tool_calls_executed.append(tool_name)
                             if tool_name in {"validate_word_slovak", "validate_word_english"}:
                                 validated_word_calls += 1
+                            elif tool_name == "validate_words_batch":
+                                batch_words = result.get("results") if isinstance(result, dict) else None
+                                if isinstance(batch_words, dict):
+                                    validated_word_calls += len(batch_words)
                             elif tool_name in {"calculate_move_score", "scoring_score_words"}:
-                                total_score_raw = result.get("total_score") if isinstance(result, dict) else None
                                 words_payload = result.get("words") if isinstance(result, dict) else None
                                 if not isinstance(words_payload, list):
                                     words_payload = args.get("words")
-                                words: list[str] = []
-                                if isinstance(words_payload, list):
-                                    for item in words_payload:
-                                        if isinstance(item, str):
-                                            word = item.strip().upper()
-                                            if word:
-                                                words.append(word)
-                                        elif isinstance(item, dict):
-                                            word = str(item.get("word") or "").strip().upper()
-                                            if word:
-                                                words.append(word)
-                                try:
-                                    total_score = int(total_score_raw)
-                                except (TypeError, ValueError):
-                                    total_score = -1
-                                if words and total_score >= 0:
-                                    placement_bits: list[str] = []
-                                    placements_payload = args.get("placements")
-                                    if isinstance(placements_payload, list):
-                                        for placement in placements_payload:
-                                            if not isinstance(placement, dict):
-                                                continue
-                                            row = placement.get("row")
-                                            col = placement.get("col")
-                                            letter = str(placement.get("letter") or "").strip().upper()
-                                            if not isinstance(row, int) or not isinstance(col, int):
-                                                continue
-                                            if not letter:
-                                                continue
-                                            placement_bits.append(f"{row}:{col}:{letter}")
-                                    words_part = "|".join(sorted(set(words)))
-                                    placements_part = ";".join(sorted(placement_bits))
-                                    signature = (
-                                        f"{words_part}#{placements_part}"
-                                        if placements_part
-                                        else words_part
-                                    )
+                                signature = self._scored_candidate_signature(
+                                    result.get("total_score") if isinstance(result, dict) else None,
+                                    words_payload,
+                                    args.get("placements"),
+                                )
+                                if signature:
                                     scored_candidates.add(signature)
+                            elif tool_name == "score_moves_batch":
+                                batch_results = result.get("results") if isinstance(result, dict) else None
+                                batch_candidates = args.get("candidates")
+                                if isinstance(batch_results, list) and isinstance(batch_candidates, list):
+                                    for item in batch_results:
+                                        if not isinstance(item, dict) or not item.get("legal"):
+                                            continue
+                                        index = item.get("index")
+                                        if not isinstance(index, int) or not 0 <= index < len(batch_candidates):
+                                            continue
+                                        candidate = batch_candidates[index]
+                                        placements_payload = (
+                                            candidate.get("placements") if isinstance(candidate, dict) else candidate
+                                        )
+                                        words_payload = item.get("words")
+                                        if isinstance(words_payload, list):
+                                            validated_word_calls += sum(
+                                                1 for w in words_payload if isinstance(w, dict) and "valid" in w
+                                            )
+                                        signature = self._scored_candidate_signature(
+                                            item.get("total_score"),
+                                            words_payload,
+                                            placements_payload,
+                                        )
+                                        if signature:
+                                            scored_candidates.add(signature)
                             await self._emit_progress(
                                 progress_callback,
                                 {
@@ -641,6 +717,7 @@ class OpenAIToolClient:
                     "content": content,
                     "prompt_tokens": prompt_tokens,
                     "completion_tokens": completion_tokens,
+                    "cached_tokens": cached_tokens,
                     "status": "ok",
                     "tool_calls_executed": tool_calls_executed,
                     "tools_unsupported": tools_disabled,
@@ -677,5 +754,5 @@ class OpenAIToolClient:
             }
 
     async def close(self) -> None:
-        """Compatibility no-op (OpenAI sync client has no async close hook)."""
-        return None
+        """Forget per-loop clients; the shared connection pool stays open for reuse."""
+        self._clients.clear()
@@ -0,0 +1,91 @@
+"""Shared HTTP transport for the OpenAI-compatible clients (OpenAI, LMStudio).
+
+Every `OpenAI`/`AsyncOpenAI` instance otherwise opens its own connection
+pool, so parallel models and the judge each pay their own TLS handshakes.
+The clients here share one pool with tuned limits and a long keep-alive:
+
+- async: one `httpx.AsyncClient` per event loop (pooled connections are
+  bound to the loop that opened them), reused by all `AsyncOpenAI` clients
+  running on that loop,
+- sync: one thread-safe `httpx.Client` for the blocking `OpenAI` clients.
+
+Limits can be tuned with ``OPENAI_MAX_CONNECTIONS`` and
+``OPENAI_MAX_KEEPALIVE_CONNECTIONS``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import weakref
+
+import httpx
+from openai import DefaultAsyncHttpxClient, DefaultHttpxClient
+
+log = logging.getLogger("scrabgpt.ai.openai_transport")
+
+DEFAULT_MAX_CONNECTIONS = 64
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 32
+# Model rounds can be tens of seconds apart; keep sockets warm between them
+KEEPALIVE_EXPIRY_SECONDS = 90.0
+
+_ASYNC_CLIENTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+_SYNC_CLIENT: httpx.Client | None = None
+_LOCK = threading.Lock()
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        log.warning("Ignoring invalid %s=%r", name, raw)
+        return default
+
+
+def connection_limits() -> httpx.Limits:
+    """Pool limits shared by all OpenAI-compatible clients."""
+    max_connections = _env_int("OPENAI_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS)
+    keepalive = _env_int("OPENAI_MAX_KEEPALIVE_CONNECTIONS", DEFAULT_MAX_KEEPALIVE_CONNECTIONS)
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=min(keepalive, max_connections),
+        keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+    )
+
+
+def shared_async_http_client() -> httpx.AsyncClient:
+    """Pooled async HTTP client of the running event loop (created on first use)."""
+    loop = asyncio.get_running_loop()
+    with _LOCK:
+        client = _ASYNC_CLIENTS.get(loop)
+        if client is None or client.is_closed:
+            client = DefaultAsyncHttpxClient(limits=connection_limits())
+            _ASYNC_CLIENTS[loop] = client
+        return client
+
+
+def shared_http_client() -> httpx.Client:
+    """Pooled blocking HTTP client shared across threads."""
+    global _SYNC_CLIENT
+    with _LOCK:
+        client = _SYNC_CLIENT
+        if client is None or client.is_closed:
+            client = DefaultHttpxClient(limits=connection_limits())
+            _SYNC_CLIENT = client
+        return client
+
+
+async def aclose_shared_async_http_client() -> None:
+    """Close the running loop's pooled client (e.g. before the loop shuts down)."""
+    loop = asyncio.get_running_loop()
+    with _LOCK:
+        client = _ASYNC_CLIENTS.pop(loop, None)
+    if client is not None:
+        await client.aclose()
@@ -6,6 +6,7 @@ Allows concurrent calls to multiple AI models and selection of best move.
 from __future__ import annotations
 
 import asyncio
+import inspect
 import json
 import logging
 import os
@@ -17,6 +18,9 @@ from typing import Any, Iterator
 import httpx
 
 from ..logging_setup import TRACE_ID_VAR
+from .rate_limiter import get_limiter
+from .streaming import ChatStream, ProgressCallback, stream_chat_completion, streaming_enabled
+from .token_usage import record_prompt_usage
 
 log = logging.getLogger("scrabgpt.ai.openrouter")
 
@@ -193,6 +197,9 @@ class OpenRouterClient:
         *,
         messages: list[dict[str, Any]] | None = None,
         max_tokens: int | None = None,
+        stream: bool | None = None,
+        stop_at_move: bool = True,
+        progress_callback: ProgressCallback | None = None,
     ) -> dict[str, Any]:
         """Call a specific model via OpenRouter.
         
@@ -201,9 +208,14 @@ class OpenRouterClient:
             prompt: Single prompt string (converted to user message if messages not provided)
             messages: Optional list of messages for chat protocol (overrides prompt)
             max_tokens: Maximum output tokens
+            stream: Stream the answer over SSE (default: AI_STREAM_COMPLETIONS, on)
+            stop_at_move: When streaming, stop reading once a complete move JSON closed
+            progress_callback: Receives "streaming" events (first token, progress, move ready)
         
         Returns:
             dict with keys: model, content, status, prompt_tokens, completion_tokens, etc.
+            Streamed calls add ttft, move_after, stopped_early, usage_unknown
+            and stream_chunks.
         """
         call_id = self._next_call_id("call")
         headers = {
@@ -253,7 +265,7 @@ class OpenRouterClient:
 
             start = time.perf_counter()
 
-            try:
+            async def post_chat() -> httpx.Response:
                 response = await self.client.post(
                     f"{self.base_url}/chat/completions",
                     headers=headers,
@@ -261,17 +273,55 @@ class OpenRouterClient:
                     timeout=self.timeout_seconds,
                 )
                 response.raise_for_status()
-                data = response.json()
+                return response
+
+            async def on_stream_progress(event: dict[str, Any]) -> None:
+                if progress_callback is not None:
+                    maybe = progress_callback({"model": model_id, "model_name": model_id, **event})
+                    if inspect.isawaitable(maybe):
+                        await maybe
+
+            async def post_stream() -> ChatStream:
+                return await stream_chat_completion(
+                    self.client,
+                    f"{self.base_url}/chat/completions",
+                    headers=headers,
+                    payload=payload,
+                    timeout=self.timeout_seconds,
+                    progress_callback=on_stream_progress,
+                    stop_at_move=stop_at_move,
+                )
+
+            use_stream = streaming_enabled() if stream is None else stream
+            stream_metrics: dict[str, Any] = {}
+            try:
+                # Per-key AIMD limit; a 429 with Retry-After is requeued once
+                limiter = get_limiter(self.base_url, self.api_key)
+                deadline = time.monotonic() + self.timeout_seconds
+                if use_stream:
+                    streamed = await limiter.call(post_stream, deadline=deadline)
+                    data = streamed.as_completion()
+                    status_code, response_headers = streamed.status_code, streamed.headers
+                    stream_metrics = streamed.metrics()
+                else:
+                    response = await limiter.call(post_chat, deadline=deadline)
+                    data = response.json()
+                    status_code, response_headers = response.status_code, dict(response.headers)
 
                 elapsed = time.perf_counter() - start
                 log.info(
-                    "[%s] Model %s responded HTTP %s in %.2fs",
+                    "[%s] Model %s responded HTTP %s in %.2fs%s",
                     trace_id,
                     model_id,
-                    response.status_code,
+                    status_code,
                     elapsed,
+                    (
+                        f" (streamed, ttft={stream_metrics['ttft']}s, "
+                        f"stopped_early={stream_metrics['stopped_early']})"
+                        if stream_metrics else ""
+                    ),
                 )
-                log.debug("[%s] Response headers=%s", trace_id, dict(response.headers))
+                log.debug("[%s] Response headers=%s", trace_id, response_headers)
                 log.debug("[%s] Raw response JSON: %s", trace_id, _format_json(data))
 
                 if "choices" not in data or not data["choices"]:
@@ -330,14 +380,16 @@ class OpenRouterClient:
                 usage = data.get("usage", {})
                 prompt_tokens = usage.get("prompt_tokens", 0)
                 completion_tokens = usage.get("completion_tokens", 0)
+                cached_tokens = record_prompt_usage(int(prompt_tokens or 0), usage)
 
                 log.info("[%s] Model %s raw content:\n%s", trace_id, model_id, content)
                 log.info("[%s] Model %s full JSON:\n%s", trace_id, model_id, _format_json(data))
                 log.info(
-                    "[%s] Parsed response from %s (prompt_tokens=%d, completion_tokens=%d)",
+                    "[%s] Parsed response from %s (prompt_tokens=%d, cached_tokens=%d, completion_tokens=%d)",
                     trace_id,
                     model_id,
                     prompt_tokens,
+                    cached_tokens,
                     completion_tokens,
                 )
 
@@ -346,6 +398,7 @@ class OpenRouterClient:
                     "content": content,
                     "prompt_tokens": prompt_tokens,
                     "completion_tokens": completion_tokens,
+                    "cached_tokens": cached_tokens,
                     "status": "ok",
                     "raw_json": data,
                     "trace_id": trace_id,
@@ -354,7 +407,8 @@ class OpenRouterClient:
                     "timeout_seconds": self.timeout_seconds,
                     "request_payload": payload,
                     "request_headers": _sanitize_headers(headers),
-                    "response_headers": dict(response.headers),
+                    "response_headers": response_headers,
+                    **stream_metrics,
                 }
             except httpx.TimeoutException:
                 elapsed = time.perf_counter() - start
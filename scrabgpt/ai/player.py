@@ -3,6 +3,8 @@ from __future__ import annotations
 import logging
 import json
 import os
+import re
+from functools import lru_cache
 from typing import Any, Callable, cast
 
 from openai.types.chat import ChatCompletionMessageParam
@@ -334,7 +336,9 @@ def reset_reasoning_context() -> None:
     _CONTEXT_SESSION = None
 
 
-_UNIFIED_MOVE_PROMPT_TEMPLATE = """You are an elite tournament Scrabble engine for {language}.
+# Statický prefix (závisí len od variantu) ide pred premenlivú časť ťahu,
+# aby ho provideri s prefixovým cachovaním účtovali ako cached tokeny.
+_UNIFIED_MOVE_PROMPT_PREFIX = """You are an elite tournament Scrabble engine for {language}.
 
 MISSION:
 - Play like a professional opponent: maximize game-winning expected value, not only raw turn score.
@@ -392,22 +396,18 @@ NO-SCORING FALLBACK:
 - If no legal scoring move exists, choose a strategic exchange.
 - Pass only as absolute last resort when exchange is impossible.
 
-RACK AND POSITION:
+TILE POINTS:
+{tile_summary}
+"""
+
+_UNIFIED_MOVE_PROMPT_TURN = """RACK AND POSITION:
 - Rack: {rack}
-- Tile points: {tile_summary}
 - Premium legend: {premium_legend}
 
 CURRENT STATE:
 {compact_state}
 """
 
-
-def _load_prompt_template(use_chat_protocol: bool = True) -> str:
-    """Return unified hardcoded prompt template for every opponent mode/provider."""
-    _ = use_chat_protocol  # Backward-compatible signature; prompt is unified now.
-    return _UNIFIED_MOVE_PROMPT_TEMPLATE
-
-
 def _format_tile_summary(variant: VariantDefinition) -> str:
     entries = []
     for letter in variant.letters:
@@ -444,80 +444,98 @@ def _strict_output_contract(language: str) -> str:
     )
 
 
-def _build_prompt(compact_state: str, variant: VariantDefinition) -> str:
-    """Zostaví unifikovaný hardcoded prompt pre AI hráča.
+@lru_cache(maxsize=1)
+def _premium_layout() -> tuple[tuple[str, ...], ...] | None:
+    """Rozloženie prémií z `premiums.json` (načíta sa len raz)."""
+    try:
+        with open(get_premiums_path(), "r", encoding="utf-8") as f:
+            layout: list[list[str]] = json.load(f)
+    except Exception:
+        return None
+    if len(layout) != 15 or any(len(row) != 15 for row in layout):
+        return None
+    return tuple(tuple(row) for row in layout)
+
 
-    Rovnaký prompt sa používa naprieč providermi a módmi.
+def _overlay_premiums(state: str) -> tuple[str, str] | None:
+    """Vráti stav s prémiami priamo v gride a legendu symbolov.
+
+    - Pre prázdne prémiové políčka nahradí '.' symbolom z legendy.
+    - Obsadené políčka nechá bez zmeny, aby ostali pôvodné písmená.
     """
-    def _overlay_premiums(state: str) -> tuple[str, str] | None:
-        """Vráti stav s prémiami priamo v gride a legendu symbolov.
 
-        - Pre prázdne prémiové políčka nahradí '.' symbolom z legendy.
-        - Obsadené políčka nechá bez zmeny, aby ostali pôvodné písmená.
-        """
+    trailing_newline = state.endswith("\n")
+    lines = state.splitlines()
 
-        trailing_newline = state.endswith("\n")
-        lines = state.splitlines()
+    try:
+        grid_idx = lines.index("grid:")
+    except ValueError:
+        return None
 
-        try:
-            grid_idx = lines.index("grid:")
-        except ValueError:
-            return None
+    grid_rows = lines[grid_idx + 1 : grid_idx + 16]
+    if len(grid_rows) != 15:
+        return None
 
-        grid_rows = lines[grid_idx + 1 : grid_idx + 16]
-        if len(grid_rows) != 15:
-            return None
+    premium_layout = _premium_layout()
+    if premium_layout is None:
+        return None
 
-        try:
-            with open(get_premiums_path(), "r", encoding="utf-8") as f:
-                premium_layout: list[list[str]] = json.load(f)
-        except Exception:
+    symbol_map: dict[str, str] = {"TW": "*", "DW": "~", "TL": "$", "DL": "^"}
+    new_grid_rows: list[str] = []
+    for r, row in enumerate(grid_rows):
+        if len(row) != 15:
             return None
+        new_row_chars: list[str] = []
+        for c, ch in enumerate(row):
+            if ch != ".":
+                new_row_chars.append(ch)
+                continue
 
-        if len(premium_layout) != 15 or any(len(row) != 15 for row in premium_layout):
-            return None
+            tag = premium_layout[r][c]
+            symbol = symbol_map.get(tag)
+            new_row_chars.append(symbol if symbol else ".")
 
-        symbol_map: dict[str, str] = {"TW": "*", "DW": "~", "TL": "$", "DL": "^"}
-        new_grid_rows: list[str] = []
-        for r, row in enumerate(grid_rows):
-            if len(row) != 15:
-                return None
-            new_row_chars: list[str] = []
-            for c, ch in enumerate(row):
-                if ch != ".":
-                    new_row_chars.append(ch)
-                    continue
+        new_grid_rows.append("".join(new_row_chars))
 
-                tag = premium_layout[r][c]
-                symbol = symbol_map.get(tag)
-                new_row_chars.append(symbol if symbol else ".")
+    lines[grid_idx + 1 : grid_idx + 16] = new_grid_rows
+    updated_state = "\n".join(lines)
+    if trailing_newline:
+        updated_state += "\n"
 
-            new_grid_rows.append("".join(new_row_chars))
+    legend = "*=TW (word*3), ~=DW (word*2), $=TL (letter*3), ^=DL (letter*2)"
+    return updated_state, legend
 
-        lines[grid_idx + 1 : grid_idx + 16] = new_grid_rows
-        updated_state = "\n".join(lines)
-        if trailing_newline:
-            updated_state += "\n"
 
-        legend = "*=TW (word*3), ~=DW (word*2), $=TL (letter*3), ^=DL (letter*2)"
-        return updated_state, legend
+@lru_cache(maxsize=8)
+def _static_prompt_prefix(variant: VariantDefinition) -> str:
+    """Statická časť promptu: inštrukcie, body kameňov a výstupný kontrakt.
 
-    # Process state to overlay premium symbols
+    Zostaví sa raz pre variant. Je vždy na začiatku promptu (aj ako system
+    správa pri retry konverzácii), takže OpenAI aj Gemini ju pri ďalších
+    volaniach počas hry vedia obslúžiť z prefixovej cache.
+    """
+    language = variant.language
+    head = _UNIFIED_MOVE_PROMPT_PREFIX.format(
+        language=language,
+        tile_summary=_format_tile_summary(variant),
+    )
+    return f"{head}\n{_strict_output_contract(language)}"
+
+
+@lru_cache(maxsize=64)
+def _turn_prompt_suffix(compact_state: str) -> str:
+    """Premenlivá časť promptu pre jeden stav hry (memoizovaná podľa stavu).
+
+    Všetky modely a pokusy v rámci ťahu dostanú rovnaký stav, takže prekrytie
+    prémií a extrakcia racku prebehnú len raz.
+    """
     overlay = _overlay_premiums(compact_state)
     if overlay:
         compact_state_with_premiums, premium_legend = overlay
     else:
         compact_state_with_premiums = compact_state
         premium_legend = "*=TW, ~=DW, $=TL, ^=DL"
-    
-    language = variant.language
-    tile_summary = _format_tile_summary(variant)
-    
-    # Load prompt template and substitute placeholders
-    template = _load_prompt_template()
-    
-    # Extract rack from compact_state if possible
-    import re
+
     # Match both "ai_rack:ABC" and "rack:[...]" formats
     rack_match = re.search(r"(?:ai_)?rack:\s*(?:\[(.*?)\]|(.*))", compact_state)
     if rack_match:
@@ -527,12 +545,10 @@ def _build_prompt(compact_state: str, variant: VariantDefinition) -> str:
     else:
         rack_str = "Neznáme (chyba v extrakcii)"
 
-    prompt = template.format(
-        language=language,
-        tile_summary=tile_summary,
-        compact_state=compact_state_with_premiums,
-        premium_legend=premium_legend or "",
+    turn = _UNIFIED_MOVE_PROMPT_TURN.format(
         rack=rack_str,
+        premium_legend=premium_legend,
+        compact_state=compact_state_with_premiums,
     )
 
     blank_focus_block = ""
@@ -545,8 +561,20 @@ def _build_prompt(compact_state: str, variant: VariantDefinition) -> str:
             "- When '?' is used, include `blanks` mapping for every wildcard placement.\n"
         )
 
-    # Always enforce strict JSON-only output even with custom prompt templates.
-    return f"{prompt}{blank_focus_block}\n\n{_strict_output_contract(language)}"
+    return (
+        f"{turn}{blank_focus_block}\n\n"
+        "Reply with exactly one JSON object as required by the STRICT OUTPUT CONTRACT above."
+    )
+
+
+def _build_prompt(compact_state: str, variant: VariantDefinition) -> str:
+    """Zostaví unifikovaný hardcoded prompt pre AI hráča.
+
+    Rovnaký prompt sa používa naprieč providermi a módmi. Skladá sa zo
+    statického prefixu variantu (cache per variant) a časti pre aktuálny
+    stav (memoizovaná podľa stavu); striktný JSON kontrakt je v prefixe.
+    """
+    return f"{_static_prompt_prefix(variant)}\n\n{_turn_prompt_suffix(compact_state)}"
 
 
 def propose_move(
@@ -686,16 +714,13 @@ async def propose_move_chat(
     
     # Pripraviť system prompt (len pri prvom volaní)
     if not session._base_prompt:
-        template = _load_prompt_template(use_chat_protocol=True)
-        tile_summary = _format_tile_summary(variant)
-        system_prompt = template.format(
-            language=variant.language,
-            tile_summary=tile_summary,
-            rack=", ".join(ai_rack),
-            premium_legend="*=TW (word*3), ~=DW (word*2), $=TL (letter*3), ^=DL (letter*2)",
-            compact_state="(State is streamed incrementally in subsequent user messages.)",
+        # Rovnaký prompt ako pri ostatných módoch (prefix + výstupný kontrakt);
+        # samotný stav dosky prichádza v delta správach.
+        initial_state = (
+            f"ai_rack: {','.join(ai_rack)}\n"
+            "(State is streamed incrementally in subsequent user messages.)\n"
         )
-        session._base_prompt = system_prompt
+        session._base_prompt = _build_prompt(initial_state, variant)
         
         log.info("Chat protocol: initialized system prompt for %s", variant.language)
     
@@ -0,0 +1,347 @@
+"""Adaptive (AIMD) concurrency limits per provider and API key.
+
+All selected models fire at once, so a large team can push one provider key
+past its rate limit and lose the whole turn to 429 / RESOURCE_EXHAUSTED
+errors. Each provider key gets an `AdaptiveLimiter` instead:
+
+- calls beyond the current limit wait in a FIFO queue (``queue_depth``),
+- every successful call raises the limit additively (+1 per window),
+- a throttled call halves it (at most once per cool-down) and a
+  ``Retry-After`` hint pauses the queue until the provider's deadline.
+
+The initial limit can be tuned with ``AI_PROVIDER_CONCURRENCY``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
+from urllib.parse import urlparse
+
+log = logging.getLogger("scrabgpt.ai.rate_limiter")
+
+T = TypeVar("T")
+
+DEFAULT_INITIAL_LIMIT = 8
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 32
+DECREASE_FACTOR = 0.5
+# Burst of 429s from one overload counts as a single congestion event
+DECREASE_COOLDOWN_SECONDS = 1.0
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+OUTCOME_OK = "ok"
+OUTCOME_THROTTLED = "throttled"
+OUTCOME_NEUTRAL = "neutral"
+
+_THROTTLE_MARKERS = (
+    "429",
+    "resource_exhausted",
+    "too many requests",
+    "rate limit",
+    "quota",
+)
+_RETRY_DELAY_RE = re.compile(r"retry[_ ]?delay['\"]?\s*[:=]\s*['\"]?(\d+(?:\.\d+)?)s", re.IGNORECASE)
+
+
+def is_throttle_text(text: str) -> bool:
+    """True if an error message looks like a rate-limit / quota rejection."""
+    lowered = str(text or "").lower()
+    return any(marker in lowered for marker in _THROTTLE_MARKERS)
+
+
+def _status_code(error: BaseException) -> int | None:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_throttle_error(error: BaseException) -> bool:
+    """True for HTTP 429 responses and errors whose text says so."""
+    if _status_code(error) == 429:
+        return True
+    return is_throttle_text(str(error))
+
+
+def parse_retry_after(value: str | None, *, now: float | None = None) -> float | None:
+    """Seconds from a ``Retry-After`` value (delta seconds or an HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    current = time.time() if now is None else now
+    return max(0.0, when.timestamp() - current)
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """Provider's back-off hint carried by an error, if any.
+
+    Reads ``retry-after-ms`` / ``Retry-After`` response headers (httpx and
+    OpenAI errors) and Google's ``retryDelay`` from the error text.
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is not None:
+        try:
+            millis = headers.get("retry-after-ms")
+            if millis:
+                return max(0.0, float(millis) / 1000.0)
+        except (TypeError, ValueError):
+            pass
+        try:
+            parsed = parse_retry_after(headers.get("retry-after"))
+        except (AttributeError, TypeError):
+            parsed = None
+        if parsed is not None:
+            return parsed
+    match = _RETRY_DELAY_RE.search(str(error))
+    return float(match.group(1)) if match else None
+
+
+def _env_limit() -> int:
+    raw = os.getenv("AI_PROVIDER_CONCURRENCY")
+    if raw is None:
+        return DEFAULT_INITIAL_LIMIT
+    try:
+        return max(DEFAULT_MIN_LIMIT, int(raw))
+    except ValueError:
+        log.warning("Ignoring invalid AI_PROVIDER_CONCURRENCY=%r", raw)
+        return DEFAULT_INITIAL_LIMIT
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit with a FIFO queue of waiting calls.
+
+    Waiters may live on different event loops; state is guarded by a thread
+    lock and grants are delivered with ``call_soon_threadsafe``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        initial: int | None = None,
+        min_limit: int = DEFAULT_MIN_LIMIT,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        start = _env_limit() if initial is None else initial
+        self.limit = float(min(self.max_limit, max(self.min_limit, start)))
+        self.in_flight = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._blocked_until = 0.0
+        self._last_decrease = float("-inf")
+        self.successes = 0
+        self.throttled = 0
+        self.queued = 0
+        self.peak_queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        with self._lock:
+            return len(self._waiters)
+
+    def _window(self) -> int:
+        return max(self.min_limit, int(self.limit))
+
+    def _has_capacity(self) -> bool:
+        return self._clock() >= self._blocked_until and self.in_flight < self._window()
+
+    def _wake(self) -> None:
+        """Hand free slots to queued waiters (caller holds the lock)."""
+        while self._waiters and self._has_capacity():
+            future = self._waiters.popleft()
+            self.in_flight += 1
+            future.get_loop().call_soon_threadsafe(self._grant, future)
+
+    def _grant(self, future: asyncio.Future[None]) -> None:
+        if future.cancelled():
+            # Waiter gave up after its slot was reserved; pass the slot on
+            with self._lock:
+                self.in_flight -= 1
+                self._wake()
+        elif not future.done():
+            future.set_result(None)
+
+    def _wake_later(self) -> None:
+        with self._lock:
+            self._wake()
+
+    async def acquire(self) -> None:
+        """Take a slot, waiting in the queue while the provider is saturated."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if not self._waiters and self._has_capacity():
+                self.in_flight += 1
+                return
+            future: asyncio.Future[None] = loop.create_future()
+            self._waiters.append(future)
+            self.queued += 1
+            depth = len(self._waiters)
+            self.peak_queue_depth = max(self.peak_queue_depth, depth)
+            blocked_for = self._blocked_until - self._clock()
+        log.debug("Limiter %s: queued call (depth=%d, limit=%d)", self.name, depth, self._window())
+        if blocked_for > 0:
+            loop.call_later(blocked_for, self._wake_later)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove(future)
+                    granted = False
+                except ValueError:
+                    granted = True
+            # A reserved slot whose grant already ran must be returned here;
+            # a still-pending grant sees the cancelled future and returns it.
+            if granted and future.done() and not future.cancelled():
+                self.release(OUTCOME_NEUTRAL)
+            raise
+
+    def release(self, outcome: str = OUTCOME_OK, *, retry_after: float | None = None) -> None:
+        """Return a slot and adapt the limit to the call's outcome."""
+        resume_in: float | None = None
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            now = self._clock()
+            if outcome == OUTCOME_OK:
+                self.successes += 1
+                self.limit = min(float(self.max_limit), self.limit + 1.0 / max(1.0, self.limit))
+            elif outcome == OUTCOME_THROTTLED:
+                self.throttled += 1
+                if now - self._last_decrease >= DECREASE_COOLDOWN_SECONDS:
+                    self.limit = max(float(self.min_limit), self.limit * DECREASE_FACTOR)
+                    self._last_decrease = now
+                if retry_after is not None and retry_after > 0:
+                    pause = min(retry_after, MAX_RETRY_AFTER_SECONDS)
+                    self._blocked_until = max(self._blocked_until, now + pause)
+                    resume_in = self._blocked_until - now
+                log.info(
+                    "Limiter %s: throttled, limit -> %d (retry_after=%s, queued=%d)",
+                    self.name, self._window(), retry_after, len(self._waiters),
+                )
+            self._wake()
+        if resume_in is not None:
+            try:
+                asyncio.get_running_loop().call_later(resume_in, self._wake_later)
+            except RuntimeError:
+                pass
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot for the body; a throttle error inside it shrinks the limit."""
+        await self.acquire()
+        outcome, retry_after = OUTCOME_OK, None
+        try:
+            yield
+        except Exception as e:
+            if is_throttle_error(e):
+                outcome, retry_after = OUTCOME_THROTTLED, retry_after_seconds(e)
+            else:
+                outcome = OUTCOME_NEUTRAL
+            raise
+        except BaseException:
+            outcome = OUTCOME_NEUTRAL
+            raise
+        finally:
+            self.release(outcome, retry_after=retry_after)
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        *,
+        retries: int = 1,
+        deadline: float | None = None,
+    ) -> T:
+        """Run `fn` in a slot, requeueing it when the provider sent ``Retry-After``.
+
+        Throttle errors without a back-off hint (or past `deadline`, in
+        ``time.monotonic`` seconds) are re-raised to the caller.
+        """
+        attempt = 0
+        while True:
+            try:
+                async with self.slot():
+                    return await fn()
+            except Exception as e:
+                if attempt >= retries or not is_throttle_error(e):
+                    raise
+                wait = retry_after_seconds(e)
+                if wait is None:
+                    raise
+                if deadline is not None and time.monotonic() + wait >= deadline:
+                    raise
+                attempt += 1
+                log.info("Limiter %s: requeueing throttled call after %.1fs", self.name, wait)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "limit": self._window(),
+                "in_flight": self.in_flight,
+                "queue_depth": len(self._waiters),
+                "peak_queue_depth": self.peak_queue_depth,
+                "queued": self.queued,
+                "successes": self.successes,
+                "throttled": self.throttled,
+                "blocked_for": round(max(0.0, self._blocked_until - self._clock()), 3),
+            }
+
+
+_LIMITERS: dict[tuple[str, str], AdaptiveLimiter] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def provider_name(base_url_or_name: str | None) -> str:
+    """Host of a base URL (``api.novita.ai``) or the given provider name."""
+    raw = (base_url_or_name or "").strip()
+    if "://" in raw:
+        host = urlparse(raw).hostname
+        if host:
+            return host.lower()
+    return raw.lower() or "openai"
+
+
+def get_limiter(provider: str | None, api_key: str | None = None) -> AdaptiveLimiter:
+    """Shared limiter of one provider key (API keys are only kept hashed)."""
+    name = provider_name(provider)
+    key_hash = hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:12]
+    with _REGISTRY_LOCK:
+        limiter = _LIMITERS.get((name, key_hash))
+        if limiter is None:
+            limiter = _LIMITERS[(name, key_hash)] = AdaptiveLimiter(f"{name}#{key_hash[:6]}")
+        return limiter
+
+
+def limiter_stats() -> dict[str, dict[str, Any]]:
+    """Snapshot of every provider limiter, keyed by its name."""
+    with _REGISTRY_LOCK:
+        limiters = list(_LIMITERS.values())
+    return {limiter.name: limiter.stats() for limiter in limiters}
+
+
+def reset_limiters() -> None:
+    """Forget all limiters (tests, or after the user changed API keys)."""
+    with _REGISTRY_LOCK:
+        _LIMITERS.clear()
@@ -170,6 +170,95 @@ def _extract_inline_json_object(text: str) -> str | None:
     return None
 
 
+class IncrementalMoveParser:
+    """Inkrementálny parser ťahu pre streamované odpovede.
+
+    Text prichádza po kúskoch (`feed`); parser si drží stav skenovania
+    (hĺbka zátvoriek, string, escape), takže každý znak prejde len raz.
+    Hneď ako sa uzavrie JSON objekt na najvyššej úrovni, ktorý prejde
+    validáciou `MoveModel`, je ťah k dispozícii – model ešte môže písať.
+    Obsah `<think>...</think>` blokov sa ignoruje.
+    """
+
+    _THINK_OPEN = "<think>"
+    _THINK_CLOSE = "</think>"
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.move: MoveModel | None = None
+        self.move_text: str | None = None
+        self._pos = 0
+        self._depth = 0
+        self._start = -1
+        self._in_string = False
+        self._escape = False
+        self._in_think = False
+
+    def feed(self, chunk: str) -> MoveModel | None:
+        """Pridá kúsok textu; vráti ťah, ak sa práve uzavrel platný objekt."""
+        if self.move is not None or not chunk:
+            return None
+        self.text += chunk
+        text = self.text
+        length = len(text)
+        idx = self._pos
+        while idx < length:
+            if self._in_think:
+                close = text.find(self._THINK_CLOSE, idx)
+                if close == -1:
+                    # Koncová značka môže byť rozdelená medzi kúsky
+                    idx = max(idx, length - len(self._THINK_CLOSE) + 1)
+                    break
+                self._in_think = False
+                idx = close + len(self._THINK_CLOSE)
+                continue
+            char = text[idx]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif self._depth == 0 and char == "<":
+                if length - idx < len(self._THINK_OPEN) and self._THINK_OPEN.startswith(text[idx:]):
+                    break  # neúplná značka, počkaj na ďalší kúsok
+                if text.startswith(self._THINK_OPEN, idx):
+                    self._in_think = True
+                    idx += len(self._THINK_OPEN)
+                    continue
+            elif char == '"':
+                if self._depth > 0:
+                    self._in_string = True
+            elif char == "{":
+                if self._depth == 0:
+                    self._start = idx
+                self._depth += 1
+            elif char == "}" and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    candidate = text[self._start : idx + 1]
+                    move = self._try_candidate(candidate)
+                    if move is not None:
+                        self._pos = idx + 1
+                        self.move, self.move_text = move, candidate
+                        return move
+            idx += 1
+        self._pos = idx
+        return None
+
+    @staticmethod
+    def _try_candidate(candidate: str) -> MoveModel | None:
+        import json
+
+        if "placements" not in candidate and '"pass"' not in candidate:
+            return None
+        try:
+            return MoveModel.model_validate(json.loads(candidate))
+        except ValueError:
+            return None
+
+
 def parse_ai_move(text: str) -> tuple[MoveModel, str]:
     """Napevno očakávaj JSON objekt; pri zlyhaní vyhoď výnimku s dôvodom.
 
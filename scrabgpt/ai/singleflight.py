@@ -0,0 +1,86 @@
+"""Single-flight coalescing of concurrent duplicate work (thread based).
+
+Callers that ask for the same key while a call for it is already running
+wait for that call's result instead of starting their own. Used to keep
+parallel models from sending the same word to the judge at the same time.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, Generic, Hashable, Sequence, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """Per-key in-flight registry; the first caller leads, the rest wait."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[K, Future[V]] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: K, fn: Callable[[], V]) -> V:
+        """Run `fn` for `key` unless a call for it is in flight; share its result."""
+        return self.do_many([key], lambda _keys: {key: fn()})[key]
+
+    def do_many(
+        self,
+        keys: Sequence[K],
+        fn: Callable[[list[K]], dict[K, V]],
+    ) -> dict[K, V]:
+        """Resolve many keys at once.
+
+        `fn` is called once with the keys this caller leads and must return a
+        value for each of them; keys already in flight elsewhere are awaited.
+        A leader's exception is re-raised in every caller waiting on it.
+        """
+        led: dict[K, Future[V]] = {}
+        waiting: dict[K, Future[V]] = {}
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                future = self._calls.get(key)
+                if future is None:
+                    future = Future()
+                    self._calls[key] = future
+                    led[key] = future
+                else:
+                    waiting[key] = future
+            self.executed += len(led)
+            self.coalesced += len(waiting)
+
+        results: dict[K, V] = {}
+        if led:
+            try:
+                produced = fn(list(led))
+                for key, future in led.items():
+                    if key in produced:
+                        future.set_result(produced[key])
+                        results[key] = produced[key]
+                    else:
+                        future.set_exception(KeyError(key))
+            except BaseException as e:
+                for future in led.values():
+                    if not future.done():
+                        future.set_exception(e)
+                raise
+            finally:
+                with self._lock:
+                    for key in led:
+                        self._calls.pop(key, None)
+            missing = [key for key in led if key not in results]
+            if missing:
+                raise KeyError(f"single-flight call returned no value for {missing!r}")
+
+        for key, future in waiting.items():
+            results[key] = future.result()
+        return results
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"executed": self.executed, "coalesced": self.coalesced,
+                    "in_flight": len(self._calls)}
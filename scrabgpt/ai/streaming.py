@@ -0,0 +1,250 @@
+"""Streamed (SSE) chat completions for the OpenAI-compatible HTTP clients.
+
+OpenRouter and Novita send ``stream: true`` completions as server-sent
+events. `stream_chat_completion` reads them incrementally, feeds the content
+into an `IncrementalMoveParser` and can stop reading as soon as a complete
+move JSON object has closed, instead of waiting for the rest of the answer.
+It measures time-to-first-token and reports progress while the model writes.
+After an early stop it still reads on briefly for the final usage chunk.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable
+
+import httpx
+
+from .schema import IncrementalMoveParser
+
+log = logging.getLogger("scrabgpt.ai.streaming")
+
+# Seconds between "still writing" progress events
+PROGRESS_INTERVAL_SECONDS = 1.0
+# How long to read on past an early-stopped move for the usage chunk
+USAGE_DRAIN_SECONDS = 1.0
+
+ProgressCallback = Callable[[dict[str, Any]], Any]
+
+
+class StreamError(httpx.HTTPError):
+    """Error event sent inside an HTTP 200 stream (e.g. the upstream provider failed)."""
+
+    def __init__(self, message: str, *, code: Any = None) -> None:
+        super().__init__(message)
+        self.code = code
+        self.status_code = code if isinstance(code, int) else None
+
+
+def streaming_enabled() -> bool:
+    """Default for the clients' `stream` flag (``AI_STREAM_COMPLETIONS``, on)."""
+    return os.getenv("AI_STREAM_COMPLETIONS", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+async def iter_sse_data(lines: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Yield the ``data`` payload of each server-sent event until ``[DONE]``."""
+    buffer: list[str] = []
+    async for line in lines:
+        line = line.rstrip("\r")
+        if not line:
+            if buffer:
+                data = "\n".join(buffer)
+                buffer = []
+                if data == "[DONE]":
+                    return
+                yield data
+            continue
+        if line.startswith(":"):
+            continue  # comment / keep-alive (e.g. ": OPENROUTER PROCESSING")
+        if line.startswith("data:"):
+            buffer.append(line[5:].lstrip(" "))
+    if buffer:
+        data = "\n".join(buffer)
+        if data != "[DONE]":
+            yield data
+
+
+@dataclass
+class ChatStream:
+    """Outcome of one streamed completion."""
+
+    status_code: int = 0
+    headers: dict[str, str] = field(default_factory=dict)
+    content: str = ""
+    reasoning: str = ""
+    usage: dict[str, Any] = field(default_factory=dict)
+    finish_reason: str | None = None
+    chunks: int = 0
+    ttft: float | None = None
+    move_text: str | None = None
+    move_after: float | None = None
+    stopped_early: bool = False
+
+    @property
+    def usage_unknown(self) -> bool:
+        """No usage chunk arrived, so the token counts are not zero but unknown."""
+        return not self.usage
+
+    def as_completion(self) -> dict[str, Any]:
+        """The stream folded into a non-streamed completion body.
+
+        When reading stopped at the move, the content is just the move JSON.
+        """
+        content = self.move_text if self.stopped_early and self.move_text else self.content
+        message: dict[str, Any] = {"role": "assistant", "content": content}
+        if self.reasoning:
+            message["reasoning"] = self.reasoning
+            message["reasoning_content"] = self.reasoning
+        return {
+            "choices": [{"index": 0, "message": message, "finish_reason": self.finish_reason}],
+            "usage": dict(self.usage),
+        }
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "streamed": True,
+            "ttft": round(self.ttft, 3) if self.ttft is not None else None,
+            "move_after": round(self.move_after, 3) if self.move_after is not None else None,
+            "stopped_early": self.stopped_early,
+            "usage_unknown": self.usage_unknown,
+            "stream_chunks": self.chunks,
+        }
+
+
+async def _emit(callback: ProgressCallback | None, payload: dict[str, Any]) -> None:
+    if callback is None:
+        return
+    try:
+        maybe = callback(payload)
+        if inspect.isawaitable(maybe):
+            await maybe
+    except Exception:
+        log.warning("Stream progress callback failed", exc_info=True)
+
+
+async def _read_usage(events: AsyncIterator[str], result: ChatStream) -> None:
+    """Skip the rest of the answer until the usage chunk (sent last)."""
+    async for data in events:
+        try:
+            event = json.loads(data)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(event, dict) and isinstance(event.get("usage"), dict):
+            result.usage = event["usage"]
+            return
+
+
+async def stream_chat_completion(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    headers: dict[str, str],
+    payload: dict[str, Any],
+    timeout: float | httpx.Timeout | None = None,
+    progress_callback: ProgressCallback | None = None,
+    stop_at_move: bool = True,
+) -> ChatStream:
+    """POST `payload` with ``stream: true`` and read the SSE answer.
+
+    Progress events (``status="streaming"``) are sent on the first token,
+    then at most every `PROGRESS_INTERVAL_SECONDS`, and when a move closes.
+    HTTP errors raise `httpx.HTTPStatusError` with the body already read;
+    error events inside the stream raise `StreamError`. After stopping at the
+    move, reading goes on for at most `USAGE_DRAIN_SECONDS` to pick up usage.
+    """
+    body = dict(payload)
+    body["stream"] = True
+    body.setdefault("stream_options", {"include_usage": True})
+    started = time.perf_counter()
+    result = ChatStream()
+    parser = IncrementalMoveParser()
+    last_progress = 0.0
+
+    async with client.stream("POST", url, headers=headers, json=body, timeout=timeout) as response:
+        result.status_code = response.status_code
+        result.headers = dict(response.headers)
+        if response.status_code >= 400:
+            await response.aread()
+            response.raise_for_status()
+
+        content_parts: list[str] = []
+        reasoning_parts: list[str] = []
+        events = iter_sse_data(response.aiter_lines())
+        async for data in events:
+            try:
+                event = json.loads(data)
+            except json.JSONDecodeError:
+                log.debug("Skipping malformed SSE chunk: %r", data[:200])
+                continue
+            if not isinstance(event, dict):
+                continue
+            if isinstance(event.get("error"), dict):
+                error = event["error"]
+                raise StreamError(
+                    f"{error.get('code', '')} {error.get('message', error)}".strip(),
+                    code=error.get("code"),
+                )
+            result.chunks += 1
+            if isinstance(event.get("usage"), dict):
+                result.usage = event["usage"]
+            choices = event.get("choices") or []
+            if not choices:
+                continue
+            choice = choices[0]
+            if choice.get("finish_reason"):
+                result.finish_reason = choice["finish_reason"]
+            delta = choice.get("delta") or {}
+            text = delta.get("content") or ""
+            thinking = delta.get("reasoning") or delta.get("reasoning_content") or ""
+            if not text and not thinking:
+                continue
+
+            now = time.perf_counter() - started
+            if result.ttft is None:
+                result.ttft = now
+                last_progress = now
+                await _emit(progress_callback, {
+                    "status": "streaming",
+                    "phase": "first_token",
+                    "ttft": round(now, 3),
+                    "chars": 0,
+                })
+            if thinking:
+                reasoning_parts.append(thinking)
+            if text:
+                content_parts.append(text)
+                if parser.feed(text) is not None:
+                    result.move_text = parser.move_text
+                    result.move_after = now
+                    await _emit(progress_callback, {
+                        "status": "streaming",
+                        "phase": "move_ready",
+                        "move_after": round(now, 3),
+                        "chars": len(parser.text),
+                    })
+                    if stop_at_move:
+                        result.stopped_early = True
+                        break
+            if now - last_progress >= PROGRESS_INTERVAL_SECONDS:
+                last_progress = now
+                await _emit(progress_callback, {
+                    "status": "streaming",
+                    "phase": "writing",
+                    "chars": len(parser.text),
+                    "reasoning_chars": sum(len(part) for part in reasoning_parts),
+                })
+
+        if result.stopped_early and not result.usage:
+            try:
+                await asyncio.wait_for(_read_usage(events, result), USAGE_DRAIN_SECONDS)
+            except (asyncio.TimeoutError, httpx.HTTPError):
+                log.debug("No usage chunk within %.1fs after the move", USAGE_DRAIN_SECONDS)
+        result.content = "".join(content_parts)
+        result.reasoning = "".join(reasoning_parts)
+    return result
@@ -0,0 +1,80 @@
+"""Provider-side prompt cache accounting.
+
+Move prompts start with a static per-variant prefix, so providers with
+prefix caching (OpenAI cached input tokens, Gemini implicit context caching,
+OpenRouter passing either through) bill part of every later prompt as cached.
+`cached_prompt_tokens` reads that count from any of their usage blocks and
+`PromptCacheStats` keeps a process-wide tally.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+
+def _field(obj: Any, name: str) -> Any:
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def cached_prompt_tokens(usage: Any) -> int:
+    """Cached input tokens of a usage block (dict or SDK object), 0 if none."""
+    candidates = (
+        _field(_field(usage, "prompt_tokens_details"), "cached_tokens"),  # OpenAI, OpenRouter
+        _field(usage, "cached_content_token_count"),  # Gemini
+        _field(usage, "cache_read_input_tokens"),  # Anthropic-style passthrough
+    )
+    for value in candidates:
+        try:
+            tokens = int(value or 0)
+        except (TypeError, ValueError):
+            continue
+        if tokens > 0:
+            return tokens
+    return 0
+
+
+class PromptCacheStats:
+    """Prompt and cached-prompt token totals across calls."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+
+    def record(self, prompt_tokens: int, cached_tokens: int) -> None:
+        with self._lock:
+            self.calls += 1
+            self.prompt_tokens += max(0, prompt_tokens)
+            self.cached_tokens += max(0, cached_tokens)
+
+    def snapshot(self) -> dict[str, float | int]:
+        with self._lock:
+            ratio = self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+            return {"calls": self.calls, "prompt_tokens": self.prompt_tokens,
+                    "cached_tokens": self.cached_tokens, "cached_ratio": round(ratio, 3)}
+
+
+_STATS = PromptCacheStats()
+
+
+def record_prompt_usage(prompt_tokens: int, usage: Any) -> int:
+    """Add one call's usage to the shared tally; returns its cached tokens.
+
+    Calls without a usage block (e.g. a stream closed before its usage chunk)
+    are left out rather than counted as zero prompt tokens.
+    """
+    if not usage:
+        return 0
+    cached = cached_prompt_tokens(usage)
+    _STATS.record(prompt_tokens, cached)
+    return cached
+
+
+def prompt_cache_stats() -> dict[str, float | int]:
+    return _STATS.snapshot()
@@ -2,6 +2,6 @@
 
 from __future__ import annotations
 
-from .mcp_adapter import execute_tool, get_gemini_tools, get_openai_tools
+from .mcp_adapter import execute_tool, execute_tools, get_gemini_tools, get_openai_tools
 
-__all__ = ["get_gemini_tools", "get_openai_tools", "execute_tool"]
+__all__ = ["get_gemini_tools", "get_openai_tools", "execute_tool", "execute_tools"]
@@ -18,10 +18,12 @@ from .mcp_tools import (
     tool_rules_first_move_must_cover_center,
     tool_rules_no_gaps_in_line,
     tool_rules_placements_in_line,
+    tool_score_moves_batch,
     tool_scoring_score_words,
     tool_validate_move_legality,
     tool_validate_word_english,
     tool_validate_word_slovak,
+    tool_validate_words_batch,
 )
 
 __all__ = [
@@ -40,8 +42,10 @@ __all__ = [
     "tool_rules_first_move_must_cover_center",
     "tool_rules_no_gaps_in_line",
     "tool_rules_placements_in_line",
+    "tool_score_moves_batch",
     "tool_scoring_score_words",
     "tool_validate_move_legality",
     "tool_validate_word_english",
     "tool_validate_word_slovak",
+    "tool_validate_words_batch",
 ]
@@ -270,6 +270,48 @@ TOOL_SCHEMAS: dict[str, dict[str, Any]] = {
             "required": ["word"],
         },
     },
+    "validate_words_batch": {
+        "name": "validate_words_batch",
+        "description": (
+            "Validate many words in one call (local dictionary in one pass, "
+            "long Slovak words checked online in parallel); returns a per-word result map. "
+            "At most 100 distinct words are checked; extra words come back in `skipped`"
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "words": {
+                    "type": "array",
+                    "items": {"type": "string", "minLength": 1},
+                    "minItems": 1,
+                    "maxItems": 100,
+                },
+                "language": {
+                    "type": "string",
+                    "enum": ["slovak", "english"],
+                    "default": "slovak",
+                },
+                "use_online": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "Allow online JULS lookup for long Slovak words",
+                },
+                "retry_count": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": 5,
+                    "default": 2,
+                },
+                "online_min_length": {
+                    "type": ["integer", "null"],
+                    "minimum": 2,
+                    "maximum": 32,
+                    "default": 7,
+                },
+            },
+            "required": ["words"],
+        },
+    },
     "validate_move_legality": {
         "name": "validate_move_legality",
         "description": "Validate complete move legality (combines all rule checks)",
@@ -314,6 +356,65 @@ TOOL_SCHEMAS: dict[str, dict[str, Any]] = {
             "required": ["board_grid", "premium_grid", "placements"],
         },
     },
+    "score_moves_batch": {
+        "name": "score_moves_batch",
+        "description": (
+            "Evaluate many candidate moves in one call: legality, formed words, "
+            "dictionary validity of each word and total score for every candidate"
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "board_grid": {"type": "array", "items": {"type": "string"}},
+                "premium_grid": {
+                    "type": "array",
+                    "items": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "type": {"type": "string"},
+                                "used": {"type": "boolean"},
+                            },
+                            "required": ["type", "used"],
+                            "additionalProperties": False,
+                        },
+                    },
+                },
+                "candidates": {
+                    "type": "array",
+                    "maxItems": 50,
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "placements": {
+                                "type": "array",
+                                "items": {
+                                    "type": "object",
+                                    "properties": {
+                                        "row": {"type": "integer"},
+                                        "col": {"type": "integer"},
+                                        "letter": {"type": "string"},
+                                    },
+                                    "required": ["row", "col", "letter"],
+                                },
+                            },
+                        },
+                        "required": ["placements"],
+                    },
+                    "description": "Candidate moves, each as {placements: [{row, col, letter}, ...]}",
+                },
+                "is_first_move": {"type": "boolean", "default": False},
+                "language": {
+                    "type": "string",
+                    "enum": ["slovak", "english"],
+                    "default": "slovak",
+                },
+                "validate_words": {"type": "boolean", "default": True},
+            },
+            "required": ["board_grid", "premium_grid", "candidates"],
+        },
+    },
     "get_validation_stats": {
         "name": "get_validation_stats",
         "description": "Get dictionary validation and cache statistics",
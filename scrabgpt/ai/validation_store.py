@@ -0,0 +1,231 @@
+"""Persistent word-validation cache shared across sessions (SQLite).
+
+Stores verdicts that are expensive to obtain again – JULS online lookups and
+LLM judge decisions – per language and word. Each tier has its own TTL.
+Live entries are warm-loaded into memory when the store opens, so lookups
+never touch the disk; writes go straight to SQLite. The table is compacted
+(expired rows dropped, oldest rows trimmed) when it grows past its bound.
+
+Location: ``~/.scrabgpt/validation_cache.sqlite3``; override with the
+``SCRABGPT_VALIDATION_CACHE`` environment variable (a path, or ``off``).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+
+log = logging.getLogger("scrabgpt.ai.validation_store")
+
+DEFAULT_PATH = Path.home() / ".scrabgpt" / "validation_cache.sqlite3"
+_DISABLED_VALUES = {"", "0", "off", "false", "none", "disabled"}
+
+TIER_JULS = "juls"
+TIER_JUDGE = "judge"
+
+_DAY = 24 * 3600
+# (tier, valid) -> TTL in seconds. JULS rarely drops words but does add them,
+# so negatives expire sooner; judge verdicts are re-asked after a month.
+TIER_TTL_SECONDS: dict[tuple[str, bool], float] = {
+    (TIER_JULS, True): 180 * _DAY,
+    (TIER_JULS, False): 7 * _DAY,
+    (TIER_JUDGE, True): 30 * _DAY,
+    (TIER_JUDGE, False): 30 * _DAY,
+}
+_DEFAULT_TTL_SECONDS = 7 * _DAY
+
+DEFAULT_MAX_ENTRIES = 50_000
+_COMPACT_EVERY_WRITES = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    language   TEXT NOT NULL,
+    word       TEXT NOT NULL,
+    valid      INTEGER NOT NULL,
+    tier       TEXT NOT NULL,
+    source     TEXT NOT NULL,
+    reason     TEXT NOT NULL,
+    stored_at  REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (language, word)
+)
+"""
+
+
+@dataclass(frozen=True)
+class StoredVerdict:
+    """One persisted verdict."""
+
+    valid: bool
+    tier: str
+    source: str
+    reason: str
+    stored_at: float
+    expires_at: float
+
+
+def _key(language: str, word: str) -> tuple[str, str]:
+    return language.strip().lower(), unicodedata.normalize("NFC", word.strip()).upper()
+
+
+class ValidationStore:
+    """SQLite-backed verdict cache with an in-memory warm copy."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttls: dict[tuple[str, bool], float] | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.max_entries = max(1, max_entries)
+        self.ttls = dict(TIER_TTL_SECONDS if ttls is None else ttls)
+        self._lock = threading.Lock()
+        self._memory: dict[tuple[str, str], StoredVerdict] = {}
+        self._writes_since_compact = 0
+        self.hits = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=5.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self.compact()
+        self._warm_load()
+
+    def _warm_load(self) -> None:
+        rows = self._conn.execute(
+            "SELECT language, word, valid, tier, source, reason, stored_at, expires_at "
+            "FROM verdicts WHERE expires_at > ? ORDER BY stored_at DESC LIMIT ?",
+            (time.time(), self.max_entries),
+        ).fetchall()
+        for language, word, valid, tier, source, reason, stored_at, expires_at in rows:
+            self._memory[(language, word)] = StoredVerdict(
+                bool(valid), tier, source, reason, stored_at, expires_at,
+            )
+        log.info("Validation store %s: warm-loaded %d verdicts", self.path, len(rows))
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def get(self, language: str, word: str) -> StoredVerdict | None:
+        """Live verdict for the word, or None."""
+        key = _key(language, word)
+        with self._lock:
+            verdict = self._memory.get(key)
+            if verdict is not None and verdict.expires_at <= time.time():
+                del self._memory[key]
+                verdict = None
+            if verdict is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return verdict
+
+    def put(
+        self,
+        language: str,
+        word: str,
+        *,
+        valid: bool,
+        tier: str,
+        source: str = "",
+        reason: str = "",
+    ) -> StoredVerdict:
+        """Persist a verdict (replaces any older verdict for the word)."""
+        now = time.time()
+        ttl = self.ttls.get((tier, valid), _DEFAULT_TTL_SECONDS)
+        verdict = StoredVerdict(bool(valid), tier, source or tier, reason, now, now + ttl)
+        key = _key(language, word)
+        with self._lock:
+            self._memory[key] = verdict
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO verdicts "
+                    "(language, word, valid, tier, source, reason, stored_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (*key, int(verdict.valid), verdict.tier, verdict.source, verdict.reason,
+                     verdict.stored_at, verdict.expires_at),
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                log.warning("Validation store write failed for '%s': %s", word, e)
+            self._writes_since_compact += 1
+            compact_due = self._writes_since_compact >= _COMPACT_EVERY_WRITES
+        if compact_due:
+            self.compact()
+        return verdict
+
+    def compact(self) -> int:
+        """Drop expired rows and trim to `max_entries` (oldest first); returns rows removed."""
+        with self._lock:
+            self._writes_since_compact = 0
+            try:
+                removed = self._conn.execute(
+                    "DELETE FROM verdicts WHERE expires_at <= ?", (time.time(),),
+                ).rowcount
+                (count,) = self._conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()
+                if count > self.max_entries:
+                    removed += self._conn.execute(
+                        "DELETE FROM verdicts WHERE rowid IN ("
+                        "SELECT rowid FROM verdicts ORDER BY stored_at ASC LIMIT ?)",
+                        (count - self.max_entries,),
+                    ).rowcount
+                self._conn.commit()
+            except sqlite3.Error as e:
+                log.warning("Validation store compaction failed: %s", e)
+                return 0
+            if len(self._memory) > self.max_entries:
+                oldest = sorted(self._memory, key=lambda k: self._memory[k].stored_at)
+                for key in oldest[: len(self._memory) - self.max_entries]:
+                    del self._memory[key]
+        if removed:
+            log.info("Validation store compacted: %d rows removed", removed)
+        return removed
+
+    def stats(self) -> dict[str, int | str]:
+        return {"path": str(self.path), "entries": len(self._memory),
+                "hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_STORE: ValidationStore | None = None
+_STORE_OPENED = False
+_STORE_LOCK = threading.Lock()
+
+
+def get_validation_store() -> ValidationStore | None:
+    """Process-wide store, opened (and warm-loaded) on first use.
+
+    Returns None when disabled via ``SCRABGPT_VALIDATION_CACHE=off`` or when
+    the database cannot be opened.
+    """
+    global _STORE, _STORE_OPENED
+    if _STORE_OPENED:
+        return _STORE
+    with _STORE_LOCK:
+        if not _STORE_OPENED:
+            configured = os.getenv("SCRABGPT_VALIDATION_CACHE")
+            if configured is not None and configured.strip().lower() in _DISABLED_VALUES:
+                _STORE = None
+            else:
+                path = Path(configured).expanduser() if configured else DEFAULT_PATH
+                try:
+                    _STORE = ValidationStore(path)
+                except (OSError, sqlite3.Error) as e:
+                    log.warning("Persistent validation cache unavailable (%s): %s", path, e)
+                    _STORE = None
+            _STORE_OPENED = True
+    return _STORE
@@ -21,6 +21,8 @@ from typing import Any, Callable, Iterator
 from google.genai import types
 
 from ..logging_setup import TRACE_ID_VAR
+from .rate_limiter import get_limiter, is_throttle_text, retry_after_seconds
+from .token_usage import record_prompt_usage
 from .vertex_genai_client import (
     build_client,
     is_gemini_3_preview_model,
@@ -154,15 +156,7 @@ class VertexClient:
 
     @staticmethod
     def _is_resource_exhausted_error(error_text: str) -> bool:
-        lowered = str(error_text or "").lower()
-        markers = (
-            "429",
-            "resource_exhausted",
-            "too many requests",
-            "rate limit",
-            "quota",
-        )
-        return any(marker in lowered for marker in markers)
+        return is_throttle_text(error_text)
     
     def _next_call_id(self, kind: str) -> str:
         """Return a unique identifier for logging scopes."""
@@ -323,7 +317,7 @@ class VertexClient:
                         del request_kwargs["system_instruction"]
                 
                 # --- Tool Execution Loop ---
-                from .tool_adapter import execute_tool
+                from .tool_adapter import execute_tools
                 tool_calls_executed: list[str] = []
                 
                 while True:
@@ -345,13 +339,15 @@ class VertexClient:
                                 f"Timeout during Vertex tool workflow ({request_timeout_budget}s)"
                             )
                         try:
-                            response = await asyncio.wait_for(
-                                loop.run_in_executor(
-                                    self._executor,
-                                    partial(call_client.models.generate_content, **request_kwargs),
-                                ),
-                                timeout=max(1.0, min(float(remaining_request), float(self.timeout_seconds))),
-                            )
+                            # Project-wide AIMD limit: excess parallel models queue here
+                            async with get_limiter("vertex", self.project_id).slot():
+                                response = await asyncio.wait_for(
+                                    loop.run_in_executor(
+                                        self._executor,
+                                        partial(call_client.models.generate_content, **request_kwargs),
+                                    ),
+                                    timeout=max(1.0, min(float(remaining_request), float(self.timeout_seconds))),
+                                )
                             break
                         except Exception as retry_exc:
                             if (
@@ -362,7 +358,8 @@ class VertexClient:
 
                             backoff_seconds = min(
                                 12.0,
-                                (2 ** (attempt - 1)) + random.uniform(0.0, 0.9),
+                                retry_after_seconds(retry_exc)
+                                or (2 ** (attempt - 1)) + random.uniform(0.0, 0.9),
                             )
                             log.warning(
                                 "[%s] Vertex model %s throttled (attempt %d/%d): %s. Backoff %.2fs",
@@ -463,11 +460,15 @@ class VertexClient:
                     if candidate_content is not None:
                         contents.append(candidate_content)
                     
-                    # Execute each tool and append result
+                    # Execute all tools of this round concurrently and append results in order
                     tool_outputs: list[Any] = []
-                    for tool_name, tool_args in tool_calls:
-                        log.info("[%s] Executing tool: %s", trace_id, tool_name)
-                        result = execute_tool(tool_name, tool_args, context=tool_context)
+                    log.info(
+                        "[%s] Executing tools: %s",
+                        trace_id,
+                        ", ".join(tool_name for tool_name, _ in tool_calls),
+                    )
+                    round_results = await execute_tools(tool_calls, context=tool_context)
+                    for (tool_name, tool_args), result in zip(tool_calls, round_results):
                         tool_calls_executed.append(tool_name)
                         
                         # Report result via progress callback
@@ -510,14 +511,16 @@ class VertexClient:
                 usage = getattr(response, "usage_metadata", None)
                 prompt_tokens = int(getattr(usage, "prompt_token_count", 0) or 0) if usage else 0
                 completion_tokens = int(getattr(usage, "candidates_token_count", 0) or 0) if usage else 0
+                cached_tokens = record_prompt_usage(prompt_tokens, usage)
                 
                 log.info(
-                    "[%s] Vertex model %s responded in %.2fs (tokens: %d/%d)",
+                    "[%s] Vertex model %s responded in %.2fs (tokens: %d/%d, cached: %d)",
                     trace_id,
                     model_id,
                     elapsed,
                     prompt_tokens,
-                    completion_tokens
+                    completion_tokens,
+                    cached_tokens,
                 )
                 
                 return {
@@ -525,6 +528,7 @@ class VertexClient:
                     "content": text_content,
                     "prompt_tokens": prompt_tokens,
                     "completion_tokens": completion_tokens,
+                    "cached_tokens": cached_tokens,
                     "status": "ok",
                     "tool_calls_executed": tool_calls_executed,
                     "trace_id": trace_id,
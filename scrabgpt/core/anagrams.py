@@ -0,0 +1,95 @@
+"""Anagramový index lexikónu (podpis zo zoradených písmen -> slová).
+
+Komentár (SK): Slová s rovnakou multimnožinou písmen majú rovnaký podpis
+(písmená zoradené). Otázka "ktoré slová zložím z racku" je potom len
+niekoľko vyhľadaní v slovníku – pre každú podmultimnožinu racku jedno,
+blanky sa rozvinú cez abecedu lexikónu. Netreba skúšať permutácie.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from itertools import combinations_with_replacement
+from typing import Iterable, Iterator
+
+from .board import BOARD_SIZE
+from .movegen import normalize_lexicon_word
+
+
+def signature(letters: Iterable[str]) -> str:
+    """Podpis slova/racku: písmená (ako na doske) zoradené."""
+
+    return "".join(sorted(normalize_lexicon_word(ch) for ch in letters))
+
+
+class AnagramIndex:
+    """Podpis -> zoradený zoznam slov lexikónu s týmito písmenami."""
+
+    def __init__(self, words: Iterable[str]) -> None:
+        buckets: dict[str, set[str]] = {}
+        letters: set[str] = set()
+        for raw in words:
+            word = normalize_lexicon_word(raw)
+            # rovnaky filter ako WordTrie.add
+            if len(word) < 2 or len(word) > BOARD_SIZE or not word.isalpha():
+                continue
+            letters.update(word)
+            buckets.setdefault("".join(sorted(word)), set()).add(word)
+        self._by_signature: dict[str, tuple[str, ...]] = {
+            sig: tuple(sorted(group)) for sig, group in buckets.items()
+        }
+        self._lengths = frozenset(len(sig) for sig in self._by_signature)
+        self.alphabet: tuple[str, ...] = tuple(sorted(letters))
+        self.word_count = sum(len(group) for group in self._by_signature.values())
+
+    def __len__(self) -> int:
+        """Počet rôznych podpisov."""
+        return len(self._by_signature)
+
+    def anagrams(self, letters: Iterable[str]) -> list[str]:
+        """Slová tvorené presne týmito písmenami (bez blankov)."""
+
+        return list(self._by_signature.get(signature(letters), ()))
+
+    def formable(
+        self,
+        rack: Iterable[str],
+        *,
+        min_length: int = 2,
+        max_length: int | None = None,
+    ) -> list[str]:
+        """Všetky slová zložiteľné z racku ('?' = blank), zoradené.
+
+        Pre každú podmultimnožinu písmen racku a každý počet použitých blankov
+        sa blanky doplnia všetkými kombináciami písmen abecedy a podpis sa
+        vyhľadá v indexe.
+        """
+
+        tiles = list(rack)
+        blanks = sum(1 for ch in tiles if ch == "?")
+        counts = Counter(normalize_lexicon_word(ch) for ch in tiles if ch != "?")
+        upper = len(tiles) if max_length is None else min(max_length, len(tiles))
+
+        found: set[str] = set()
+        for subset in _sub_multisets(sorted(counts.items())):
+            for used_blanks in range(blanks + 1):
+                length = len(subset) + used_blanks
+                if length < min_length or length > upper or length not in self._lengths:
+                    continue
+                for fill in combinations_with_replacement(self.alphabet, used_blanks):
+                    group = self._by_signature.get("".join(sorted(subset + list(fill))))
+                    if group:
+                        found.update(group)
+        return sorted(found)
+
+
+def _sub_multisets(items: list[tuple[str, int]]) -> Iterator[list[str]]:
+    """Všetky podmultimnožiny (každá raz) ako zoznamy písmen."""
+
+    if not items:
+        yield []
+        return
+    (letter, count), rest = items[0], items[1:]
+    for tail in _sub_multisets(rest):
+        for take in range(count + 1):
+            yield [letter] * take + tail
@@ -1,69 +1,352 @@
-
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import threading
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator, Sequence
 
 from .types import Direction, Placement, Premium, WordFound
 
 BOARD_SIZE = 15
+CELL_COUNT = BOARD_SIZE * BOARD_SIZE
+
+# Plocha reprezentacia: index bunky = row * BOARD_SIZE + col
+FLAG_BLANK = 0x01         # pismeno je blank
+FLAG_PREMIUM_USED = 0x02  # premia uz bola spotrebovana
+
+CENTER_INDEX = 7 * BOARD_SIZE + 7  # H8
+
+# ortogonalni susedia kazdeho pola (predpocitane, doska sa nemeni)
+NEIGHBORS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(
+        rr * BOARD_SIZE + cc
+        for rr, cc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1))
+        if 0 <= rr < BOARD_SIZE and 0 <= cc < BOARD_SIZE
+    )
+    for r in range(BOARD_SIZE)
+    for c in range(BOARD_SIZE)
+)
+
+# kod premie v `premium_codes` (0 = bez premie)
+PREMIUM_BY_CODE: tuple[Premium | None, ...] = (None, Premium.DL, Premium.TL, Premium.DW, Premium.TW)
+_CODE_BY_PREMIUM: dict[Premium, int] = {
+    prem: code for code, prem in enumerate(PREMIUM_BY_CODE) if prem is not None
+}
+
+# Spolocna tabulka kodov pismen pre vsetky dosky (0 = prazdne pole).
+# Kody sa pridelia pri prvom vyskyte pismena, takze funguju aj diakritika a lubovolny variant.
+_LETTER_BY_CODE: list[str | None] = [None]
+_CODE_BY_LETTER: dict[str, int] = {}
+_CODES_LOCK = threading.Lock()
+
+# Rozparsovane premium mapy podla cesty k suboru (staticke, citaju sa raz)
+_PREMIUM_TABLES: dict[str, bytes] = {}
+
+
+def encode_letter(letter: str | None) -> int:
+    """Vrati 1-bajtovy kod pismena (0 pre prazdne pole)."""
+    if not letter:
+        return 0
+    code = _CODE_BY_LETTER.get(letter)
+    if code is not None:
+        return code
+    with _CODES_LOCK:
+        code = _CODE_BY_LETTER.get(letter)
+        if code is None:
+            if len(_LETTER_BY_CODE) > 255:
+                raise ValueError("Prilis vela roznych pismen pre kompaktnu dosku")
+            code = len(_LETTER_BY_CODE)
+            _LETTER_BY_CODE.append(letter)
+            _CODE_BY_LETTER[letter] = code
+    return code
+
+
+def decode_letter(code: int) -> str | None:
+    """Opak `encode_letter`."""
+    return _LETTER_BY_CODE[code]
+
+
+def _premium_table(path: str) -> bytes:
+    table = _PREMIUM_TABLES.get(path)
+    if table is not None:
+        return table
+    with Path(path).open("r", encoding="utf-8") as f:
+        data = json.load(f)
+    codes = bytearray(CELL_COUNT)
+    for r in range(BOARD_SIZE):
+        for c in range(BOARD_SIZE):
+            prem = Premium.__members__.get(str(data[r][c]))
+            if prem is not None:
+                codes[r * BOARD_SIZE + c] = _CODE_BY_PREMIUM[prem]
+    table = bytes(codes)
+    _PREMIUM_TABLES[path] = table
+    return table
+
 
-@dataclass
 class Cell:
-    """Bunka na doske."""
-    letter: str | None = None  # 'A'..'Z' uz ulozene
-    is_blank: bool = False        # ci povodne bola '?'
-    premium: Premium | None = None  # DL/TL/DW/TW
-    premium_used: bool = False    # prémie sa uplatnia len pri prvom polozeni
+    """Bunka na doske – pohlad (view) do plochych poli `Board`.
+
+    Atributy letter/is_blank/premium/premium_used sa citaju aj zapisuju
+    priamo do dosky, takze existujuci kod `board.cells[r][c].letter = ...`
+    funguje bez zmeny.
+    """
+
+    __slots__ = ("_board", "_idx")
+
+    def __init__(self, board: Board, idx: int) -> None:
+        self._board = board
+        self._idx = idx
+
+    @property
+    def letter(self) -> str | None:  # 'A'..'Z' uz ulozene
+        return _LETTER_BY_CODE[self._board.letter_codes[self._idx]]
+
+    @letter.setter
+    def letter(self, value: str | None) -> None:
+        self._board._set_code(self._idx, encode_letter(value))
+
+    @property
+    def is_blank(self) -> bool:  # ci povodne bola '?'
+        return bool(self._board.flags[self._idx] & FLAG_BLANK)
+
+    @is_blank.setter
+    def is_blank(self, value: bool) -> None:
+        self._board._set_flag(self._idx, FLAG_BLANK, value)
+
+    @property
+    def premium(self) -> Premium | None:  # DL/TL/DW/TW
+        return PREMIUM_BY_CODE[self._board.premium_codes[self._idx]]
+
+    @premium.setter
+    def premium(self, value: Premium | None) -> None:
+        self._board.premium_codes[self._idx] = 0 if value is None else _CODE_BY_PREMIUM[value]
+
+    @property
+    def premium_used(self) -> bool:  # prémie sa uplatnia len pri prvom polozeni
+        return bool(self._board.flags[self._idx] & FLAG_PREMIUM_USED)
+
+    @premium_used.setter
+    def premium_used(self, value: bool) -> None:
+        self._board._set_flag(self._idx, FLAG_PREMIUM_USED, value)
+
+    def __repr__(self) -> str:
+        return (
+            f"Cell(letter={self.letter!r}, is_blank={self.is_blank}, "
+            f"premium={self.premium}, premium_used={self.premium_used})"
+        )
+
 
 class Board:
-    """Model scrabble dosky 15x15 s premiami."""
+    """Model scrabble dosky 15x15 s premiami.
+
+    Stav je ulozeny v troch 225-bajtovych poliach (kody pismen, priznaky
+    blank/premium_used, kody premii); `cells` je kompatibilny pohlad nad nimi.
+
+    Doska zaroven priebezne udrzuje anchor polia (prazdne polia susediace
+    s dlazdicou) – pismena preto menit len cez `place_letters`/`clear_letters`/
+    `push_move`/`pop_move` alebo `cells[r][c].letter`, nie priamo v `letter_codes`.
+    """
     def __init__(self, premiums_path: str) -> None:
-        self.cells: list[list[Cell]] = [
-            [Cell() for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)
-        ]
-        self._load_premiums(premiums_path)
-
-    def _load_premiums(self, path: str) -> None:
-        # Bez zmeny správania: použijeme Path a kontext manažér
-        p = Path(path)
-        with p.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        for r in range(BOARD_SIZE):
-            for c in range(BOARD_SIZE):
-                tag = data[r][c]
-                if tag == "DL":
-                    self.cells[r][c].premium = Premium.DL
-                elif tag == "TL":
-                    self.cells[r][c].premium = Premium.TL
-                elif tag == "DW":
-                    self.cells[r][c].premium = Premium.DW
-                elif tag == "TW":
-                    self.cells[r][c].premium = Premium.TW
+        self.letter_codes = bytearray(CELL_COUNT)
+        self.flags = bytearray(CELL_COUNT)
+        self.premium_codes = bytearray(_premium_table(premiums_path))
+        # pocet obsadenych ortogonalnych susedov kazdeho pola
+        self.neighbor_counts = bytearray(CELL_COUNT)
+        self._anchors: set[int] = set()
+        self._tile_count = 0
+        self._cells: list[list[Cell]] | None = None
+        # zasobnik docasnych tahov (make/unmake): povodny stav prepisanych buniek
+        self._undo_stack: list[list[tuple[int, int, int]]] = []
+
+    @property
+    def cells(self) -> list[list[Cell]]:
+        """Mriezka `Cell` pohladov (vytvori sa az pri prvom pristupe)."""
+        cells = self._cells
+        if cells is None:
+            cells = self._cells = [
+                [Cell(self, r * BOARD_SIZE + c) for c in range(BOARD_SIZE)]
+                for r in range(BOARD_SIZE)
+            ]
+        return cells
+
+    def _set_code(self, idx: int, code: int) -> None:
+        """Zapise kod pismena a aktualizuje anchor index (O(1))."""
+        codes = self.letter_codes
+        old = codes[idx]
+        codes[idx] = code
+        if bool(old) == bool(code):
+            return
+        counts = self.neighbor_counts
+        anchors = self._anchors
+        if code:
+            self._tile_count += 1
+            anchors.discard(idx)
+            for n in NEIGHBORS[idx]:
+                counts[n] += 1
+                if not codes[n]:
+                    anchors.add(n)
+        else:
+            self._tile_count -= 1
+            for n in NEIGHBORS[idx]:
+                counts[n] -= 1
+                if not counts[n]:
+                    anchors.discard(n)
+            if counts[idx]:
+                anchors.add(idx)
+
+    def _rebuild_anchors(self) -> None:
+        codes = self.letter_codes
+        counts = bytearray(CELL_COUNT)
+        for idx in range(CELL_COUNT):
+            if codes[idx]:
+                for n in NEIGHBORS[idx]:
+                    counts[n] += 1
+        self.neighbor_counts = counts
+        self._anchors = {idx for idx in range(CELL_COUNT) if counts[idx] and not codes[idx]}
+        self._tile_count = CELL_COUNT - codes.count(0)
+
+    def _set_flag(self, idx: int, flag: int, value: bool) -> None:
+        if value:
+            self.flags[idx] |= flag
+        else:
+            self.flags[idx] &= ~flag & 0xFF
+
+    # --- Kompaktne snimky --------------------------------------------------
+
+    def snapshot(self) -> bytes:
+        """Nemenny snimok stavu dosky (675 bajtov: pismena + priznaky + premie)."""
+        return bytes(self.letter_codes) + bytes(self.flags) + bytes(self.premium_codes)
+
+    def restore(self, snapshot: bytes) -> None:
+        """Obnovi stav zo `snapshot()` (views v `cells` ostavaju platne)."""
+        self.letter_codes[:] = snapshot[:CELL_COUNT]
+        self.flags[:] = snapshot[CELL_COUNT:2 * CELL_COUNT]
+        self.premium_codes[:] = snapshot[2 * CELL_COUNT:]
+        self._undo_stack.clear()
+        self._rebuild_anchors()
+
+    def copy(self) -> Board:
+        """Lacna nezavisla kopia (kopiruju sa len bajtove polia a anchor index)."""
+        clone = Board.__new__(Board)
+        clone.letter_codes = bytearray(self.letter_codes)
+        clone.flags = bytearray(self.flags)
+        clone.premium_codes = bytearray(self.premium_codes)
+        clone.neighbor_counts = bytearray(self.neighbor_counts)
+        clone._anchors = set(self._anchors)
+        clone._tile_count = self._tile_count
+        clone._cells = None
+        clone._undo_stack = [list(frame) for frame in self._undo_stack]
+        return clone
+
+    def __deepcopy__(self, memo: dict[int, object]) -> Board:
+        clone = self.copy()
+        memo[id(self)] = clone
+        return clone
+
+    # --- Dotazy -------------------------------------------------------------
 
     def inside(self, row: int, col: int) -> bool:
         return 0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE
 
     def get_letter(self, row: int, col: int) -> str | None:
-        return self.cells[row][col].letter
+        return _LETTER_BY_CODE[self.letter_codes[row * BOARD_SIZE + col]]
+
+    def has_letters(self) -> bool:
+        """Ci je na doske aspon jedno pismeno."""
+        return self._tile_count > 0
+
+    @property
+    def tile_count(self) -> int:
+        """Pocet obsadenych poli."""
+        return self._tile_count
+
+    def anchor_indices(self) -> list[int]:
+        """Zoradene indexy anchor poli; na prazdnej doske len stred."""
+        if not self._tile_count:
+            return [CENTER_INDEX]
+        return sorted(self._anchors)
+
+    def anchor_squares(self) -> list[tuple[int, int]]:
+        """Anchor polia ako (row, col) – prazdne polia susediace s dlazdicou."""
+        return [divmod(idx, BOARD_SIZE) for idx in self.anchor_indices()]
+
+    def is_anchor(self, row: int, col: int) -> bool:
+        idx = row * BOARD_SIZE + col
+        if not self._tile_count:
+            return idx == CENTER_INDEX
+        return idx in self._anchors
+
+    def touches_tiles(self, placements: Sequence[Placement]) -> bool:
+        """Ci niektore z poli susedi s dlazdicou na doske (O(pocet placements))."""
+        counts = self.neighbor_counts
+        return any(counts[p.row * BOARD_SIZE + p.col] for p in placements)
+
+    def grid_rows(self, empty: str = ".") -> list[str]:
+        """15 retazcov po 15 znakov; prazdne polia ako `empty`."""
+        letters = [_LETTER_BY_CODE[code] or empty for code in self.letter_codes]
+        return ["".join(letters[r * BOARD_SIZE:(r + 1) * BOARD_SIZE]) for r in range(BOARD_SIZE)]
+
+    def positions_with_flag(self, flag: int) -> list[tuple[int, int]]:
+        """Suradnice buniek s danym priznakom (FLAG_BLANK / FLAG_PREMIUM_USED)."""
+        return [divmod(idx, BOARD_SIZE) for idx, value in enumerate(self.flags) if value & flag]
+
+    # --- Zmeny --------------------------------------------------------------
 
     def place_letters(self, placements: list[Placement]) -> None:
         """Aplikuje pismena na dosku (bez validacii pravidiel)."""
         for p in placements:
-            cell = self.cells[p.row][p.col]
-            cell.letter = (p.blank_as or p.letter)
-            cell.is_blank = (p.letter == "?")
+            idx = p.row * BOARD_SIZE + p.col
+            self._set_code(idx, encode_letter(p.blank_as or p.letter))
+            self._set_flag(idx, FLAG_BLANK, p.letter == "?")
             # Prémie sa oznacia ako pouzite po tomto tahu v score(), nie tu.
 
     def clear_letters(self, placements: list[Placement]) -> None:
         """Odstrani pismena (pouzite pri 'Undo' pred potvrdenim')."""
         for p in placements:
-            cell = self.cells[p.row][p.col]
-            cell.letter = None
-            cell.is_blank = False
+            idx = p.row * BOARD_SIZE + p.col
+            self._set_code(idx, 0)
+            self._set_flag(idx, FLAG_BLANK, False)
             # premium_used nechavame bez zmeny, lebo sa aplikuje az po potvrdeni tahu
 
+    def push_move(self, placements: Sequence[Placement]) -> None:
+        """Docasne polozi pismena (make) a zapamata si povodny stav buniek.
+
+        Na rozdiel od `deepcopy(board)` sa nic nekopiruje; `pop_move` vrati
+        letter/is_blank/premium_used presne do stavu pred tymto volanim.
+        """
+        saved: list[tuple[int, int, int]] = []
+        codes = self.letter_codes
+        flags = self.flags
+        for p in placements:
+            idx = p.row * BOARD_SIZE + p.col
+            saved.append((idx, codes[idx], flags[idx]))
+            self._set_code(idx, encode_letter(p.blank_as or p.letter))
+            self._set_flag(idx, FLAG_BLANK, p.letter == "?")
+        self._undo_stack.append(saved)
+
+    def pop_move(self) -> None:
+        """Vrati posledny `push_move` (unmake)."""
+        saved = self._undo_stack.pop()
+        # v opacnom poradi, aby sa pri duplicitnych suradniciach obnovil povodny stav
+        for idx, code, flag in reversed(saved):
+            self._set_code(idx, code)
+            self.flags[idx] = flag
+
+    @property
+    def pushed_moves(self) -> int:
+        """Pocet docasnych tahov, ktore este neboli vratene."""
+        return len(self._undo_stack)
+
+    @contextmanager
+    def applied(self, placements: Sequence[Placement]) -> Iterator[Board]:
+        """Kontext, v ktorom su pismena docasne na doske: `with board.applied(ps): ...`."""
+        self.push_move(placements)
+        try:
+            yield self
+        finally:
+            self.pop_move()
+
     def letters_in_line(self, placements: list[Placement]) -> Direction | None:
         """Zisti, ci su vsetky nove pismena v jednom riadku alebo stlpci."""
         rows = {p.row for p in placements}
@@ -76,18 +359,25 @@ class Board:
 
     def extend_word(self, row: int, col: int, direction: Direction) -> list[tuple[int, int]]:
         """Vrati suradnice celeho slova prechadzajuceho danym polom v danom smere."""
-        dr, dc = (0,1) if direction == Direction.ACROSS else (1,0)
-        # posun dolava/nahor
-        r, c = row, col
-        while self.inside(r - dr, c - dc) and self.get_letter(r - dr, c - dc):
-            r -= dr
-            c -= dc
-        coords: list[tuple[int, int]] = []
-        # dopln doprava/nadol
-        while self.inside(r, c) and self.get_letter(r, c):
-            coords.append((r, c))
-            r += dr
-            c += dc
+        codes = self.letter_codes
+        if direction == Direction.ACROSS:
+            # posun dolava, potom dopln doprava (index arithmetic v ramci riadku)
+            c = col
+            while c > 0 and codes[row * BOARD_SIZE + c - 1]:
+                c -= 1
+            coords: list[tuple[int, int]] = []
+            while c < BOARD_SIZE and codes[row * BOARD_SIZE + c]:
+                coords.append((row, c))
+                c += 1
+            return coords
+        # posun nahor, potom dopln nadol
+        r = row
+        while r > 0 and codes[(r - 1) * BOARD_SIZE + col]:
+            r -= 1
+        coords = []
+        while r < BOARD_SIZE and codes[r * BOARD_SIZE + col]:
+            coords.append((r, col))
+            r += 1
         return coords
 
     def build_words_for_move(self, placements: list[Placement]) -> list[WordFound]:
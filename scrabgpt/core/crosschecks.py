@@ -0,0 +1,210 @@
+"""Inkrementálne udržiavané cross-checky pre prázdne polia dosky.
+
+Komentár (SK): Pre každé prázdne pole a každý smer ťahu si index pamätá
+bitovú masku písmen, ktoré s kolmými susedmi tvoria platné slovo, a súčet
+bodov týchto susedov (základ skóre krížového slova). Po zmene dosky sa
+prepočítajú len polia, ktorých krížové slovo sa mohlo zmeniť – zistí sa to
+porovnaním plochých polí dosky so zapamätaným stavom.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import TYPE_CHECKING, Sequence
+
+from .board import BOARD_SIZE, CELL_COUNT, FLAG_BLANK, Board, decode_letter
+from .types import Direction, Placement
+
+if TYPE_CHECKING:
+    from .movegen import WordTrie
+
+# index smeru v poliach: ACROSS tah -> kolme (zvisle) krizove slova, DOWN -> vodorovne
+_ACROSS = 0
+_DOWN = 1
+NO_CROSS_WORD = -1
+
+
+def _direction_index(direction: Direction) -> int:
+    return _ACROSS if direction == Direction.ACROSS else _DOWN
+
+
+class CrossCheckIndex:
+    """Cross-check masky a súčty pre jednu dosku a jeden lexikón."""
+
+    def __init__(self, board: Board, trie: WordTrie, tile_points: dict[str, int]) -> None:
+        # slaba referencia: index je hodnotou vo WeakKeyDictionary generatora
+        # a silny odkaz na kluc by dosku nikdy neuvolnil
+        self._board_ref = weakref.ref(board)
+        self.trie = trie
+        self.tile_points = dict(tile_points)
+        self.bit_of: dict[str, int] = {
+            letter: 1 << i for i, letter in enumerate(trie.alphabet)
+        }
+        self.all_mask = (1 << len(trie.alphabet)) - 1
+        # [smer][index pola]
+        self.allowed: tuple[list[int], list[int]] = (
+            [self.all_mask] * CELL_COUNT,
+            [self.all_mask] * CELL_COUNT,
+        )
+        self.cross_sum: tuple[list[int], list[int]] = (
+            [NO_CROSS_WORD] * CELL_COUNT,
+            [NO_CROSS_WORD] * CELL_COUNT,
+        )
+        self.parts: tuple[list[tuple[str, str]], list[tuple[str, str]]] = (
+            [("", "")] * CELL_COUNT,
+            [("", "")] * CELL_COUNT,
+        )
+        self._seen_letters = bytes(CELL_COUNT)
+        self._seen_flags = bytes(CELL_COUNT)
+        self._lock = threading.Lock()
+        self.recomputed_last = 0  # pocet prepocitanych poli pri poslednom refresh()
+        self.refresh()
+
+    @property
+    def board(self) -> Board:
+        board = self._board_ref()
+        if board is None:
+            raise ReferenceError("Board of this cross-check index was garbage collected")
+        return board
+
+    # --- Údržba -------------------------------------------------------------
+
+    def refresh(self) -> int:
+        """Zosynchronizuje index s doskou; vráti počet prepočítaných polí."""
+
+        with self._lock:
+            board = self.board
+            letters = bytes(board.letter_codes)
+            flags = bytes(board.flags)
+            if letters == self._seen_letters and flags == self._seen_flags:
+                self.recomputed_last = 0
+                return 0
+            changed = [
+                idx
+                for idx in range(CELL_COUNT)
+                if letters[idx] != self._seen_letters[idx]
+                or (flags[idx] ^ self._seen_flags[idx]) & FLAG_BLANK
+            ]
+            affected: set[int] = set()
+            for idx in changed:
+                affected.update(self._affected_squares(idx, letters))
+            for idx in affected:
+                self._recompute(idx, letters, flags)
+            self._seen_letters = letters
+            self._seen_flags = flags
+            self.recomputed_last = len(affected)
+            return len(affected)
+
+    @staticmethod
+    def _affected_squares(idx: int, letters: bytes) -> list[int]:
+        # zmena na idx ovplyvni samotne pole a prve prazdne pole za suvislym
+        # behom dlazdic v kazdom zo 4 smerov
+        out = [idx]
+        r, c = divmod(idx, BOARD_SIZE)
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            rr, cc = r + dr, c + dc
+            while 0 <= rr < BOARD_SIZE and 0 <= cc < BOARD_SIZE:
+                j = rr * BOARD_SIZE + cc
+                if not letters[j]:
+                    out.append(j)
+                    break
+                rr, cc = rr + dr, cc + dc
+        return out
+
+    def _recompute(self, idx: int, letters: bytes, flags: bytes) -> None:
+        if letters[idx]:
+            # obsadene pole: ziadne nove pismeno sem nepojde
+            for d in (_ACROSS, _DOWN):
+                self.allowed[d][idx] = 0
+                self.cross_sum[d][idx] = NO_CROSS_WORD
+                self.parts[d][idx] = ("", "")
+            return
+        r, c = divmod(idx, BOARD_SIZE)
+        for d, (dr, dc) in ((_ACROSS, (1, 0)), (_DOWN, (0, 1))):
+            before, before_sum = self._collect(r, c, -dr, -dc, letters, flags)
+            after, after_sum = self._collect(r, c, dr, dc, letters, flags)
+            if not before and not after:
+                self.allowed[d][idx] = self.all_mask
+                self.cross_sum[d][idx] = NO_CROSS_WORD
+                self.parts[d][idx] = ("", "")
+                continue
+            self.allowed[d][idx] = self._mask_for(before, after)
+            self.cross_sum[d][idx] = before_sum + after_sum
+            self.parts[d][idx] = (before, after)
+
+    def _collect(
+        self, r: int, c: int, dr: int, dc: int, letters: bytes, flags: bytes,
+    ) -> tuple[str, int]:
+        chars: list[str] = []
+        total = 0
+        rr, cc = r + dr, c + dc
+        while 0 <= rr < BOARD_SIZE and 0 <= cc < BOARD_SIZE:
+            j = rr * BOARD_SIZE + cc
+            code = letters[j]
+            if not code:
+                break
+            letter = decode_letter(code) or ""
+            chars.append(letter)
+            if not flags[j] & FLAG_BLANK:
+                total += self.tile_points.get(letter, 0)
+            rr, cc = rr + dr, cc + dc
+        if dr < 0 or dc < 0:
+            chars.reverse()
+        return "".join(chars), total
+
+    def _mask_for(self, before: str, after: str) -> int:
+        node = self.trie.walk(before)
+        if node is None:
+            return 0
+        mask = 0
+        for letter, child in node.children.items():
+            end = self.trie.walk(after, child)
+            if end is not None and end.terminal:
+                mask |= self.bit_of[letter]
+        return mask
+
+    # --- Dotazy -------------------------------------------------------------
+
+    def allows(self, row: int, col: int, direction: Direction, letter: str) -> bool:
+        """Či písmeno na (row, col) pri ťahu v smere `direction` tvorí platné krížové slovo."""
+
+        bit = self.bit_of.get(letter)
+        if bit is None:
+            return False
+        return bool(self.allowed[_direction_index(direction)][row * BOARD_SIZE + col] & bit)
+
+    def allowed_letters(self, row: int, col: int, direction: Direction) -> frozenset[str]:
+        mask = self.allowed[_direction_index(direction)][row * BOARD_SIZE + col]
+        return frozenset(letter for letter, bit in self.bit_of.items() if mask & bit)
+
+    def cross_word(self, row: int, col: int, direction: Direction, letter: str) -> str | None:
+        """Krížové slovo vzniknuté písmenom na (row, col), alebo None ak nevzniká."""
+
+        d = _direction_index(direction)
+        idx = row * BOARD_SIZE + col
+        if self.cross_sum[d][idx] == NO_CROSS_WORD:
+            return None
+        before, after = self.parts[d][idx]
+        return before + letter + after
+
+    def invalid_cross_words(
+        self, placements: Sequence[Placement], direction: Direction,
+    ) -> list[str]:
+        """Krížové slová ťahu, ktoré nie sú v lexikóne (rýchle odmietnutie návrhu).
+
+        Hlavné slovo sa tu nekontroluje; pri jednopísmenovom ťahu zavolaj pre oba smery.
+        """
+
+        d = _direction_index(direction)
+        invalid: list[str] = []
+        for p in placements:
+            idx = p.row * BOARD_SIZE + p.col
+            if self.cross_sum[d][idx] == NO_CROSS_WORD:
+                continue
+            letter = p.blank_as or p.letter
+            bit = self.bit_of.get(letter, 0)
+            if not self.allowed[d][idx] & bit:
+                before, after = self.parts[d][idx]
+                invalid.append(before + letter + after)
+        return invalid
@@ -100,7 +100,7 @@ class Game:
         return self.players[self.current_index]
 
     def _has_any_letters(self) -> bool:
-        return any(cell.letter for row in self.board.cells for cell in row)
+        return self.board.has_letters()
 
     def _advance_turn(self) -> None:
         self.current_index = (self.current_index + 1) % len(self.players)
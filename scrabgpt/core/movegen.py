@@ -0,0 +1,661 @@
+"""Generator všetkých legálnych ťahov (Appel–Jacobson nad prefixovým stromom).
+
+Komentár (SK): Modul je bez UI/AI závislostí. Lexikón sa dodá ako zoznam slov,
+z ktorého sa raz postaví trie. Pre danú dosku a rack (vrátane blankov '?')
+generator vyenumeruje všetky legálne ťahy a ohodnotí ich rovnako ako
+`score_words` (+ bingo bonus za 7 písmen).
+"""
+
+from __future__ import annotations
+
+import threading
+import unicodedata
+import weakref
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Sequence
+
+from .board import BOARD_SIZE, Board
+from .crosschecks import NO_CROSS_WORD, CrossCheckIndex
+from .tiles import get_tile_points
+from .types import Direction, Placement, Premium
+
+if TYPE_CHECKING:
+    from .anagrams import AnagramIndex
+
+BINGO_BONUS = 50
+RACK_SIZE = 7
+# voľné pole vo vzore pre WordTrie.matching ('?' je alias, ako blank v racku)
+PATTERN_WILDCARDS = frozenset(".?")
+# odhad pamäte (CPython): uzol stromu s dict potomkov, slovo v anagramovom indexe
+_NODE_BYTES = 180
+_ANAGRAM_WORD_BYTES = 200
+
+_LETTER_MULT = {Premium.DL: 2, Premium.TL: 3}
+_WORD_MULT = {Premium.DW: 2, Premium.TW: 3}
+
+
+def normalize_lexicon_word(word: str) -> str:
+    """Zjednotí slovo z lexikónu na tvar písmen na doske (NFC + veľké písmená)."""
+
+    return unicodedata.normalize("NFC", word.strip()).upper()
+
+
+class _Node:
+    __slots__ = ("children", "terminal")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.terminal = False
+
+
+class WordTrie:
+    """Prefixový strom slov lexikónu (písmená ako na doske, t.j. veľké)."""
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.root = _Node()
+        self._size = 0
+        self.node_count = 1
+        self._letters: set[str] = set()
+        # trie otočených slov pre dotazy na príponu (postaví sa pri prvom dotaze)
+        self._reversed: WordTrie | None = None
+        self._reversed_lock = threading.Lock()
+        for raw in words:
+            self.add(raw)
+
+    def add(self, word: str) -> None:
+        normalized = normalize_lexicon_word(word)
+        # jednopismenne slova sa v Scrabble nehraju; viacznakove velke tvary (napr. 'ß') preskocime
+        if len(normalized) < 2 or len(normalized) > BOARD_SIZE or not normalized.isalpha():
+            return
+        node = self.root
+        self._letters.update(normalized)
+        for ch in normalized:
+            child = node.children.get(ch)
+            if child is None:
+                child = _Node()
+                node.children[ch] = child
+                self.node_count += 1
+            node = child
+        if not node.terminal:
+            node.terminal = True
+            self._size += 1
+            self._reversed = None
+
+    @property
+    def alphabet(self) -> tuple[str, ...]:
+        """Všetky písmená vyskytujúce sa v lexikóne (zoradené)."""
+        return tuple(sorted(self._letters))
+
+    def walk(self, letters: str, node: _Node | None = None) -> _Node | None:
+        """Prejde strom po písmenách `letters`; vráti uzol alebo None."""
+
+        current = self.root if node is None else node
+        for ch in letters:
+            nxt = current.children.get(ch)
+            if nxt is None:
+                return None
+            current = nxt
+        return current
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        node = self.walk(normalize_lexicon_word(word))
+        return node is not None and node.terminal
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def size_bytes(self) -> int:
+        """Odhad pamäte stromu (vrátane otočeného stromu, ak už je postavený)."""
+        reversed_trie = self._reversed
+        size = self.node_count * _NODE_BYTES
+        return size + (reversed_trie.size_bytes if reversed_trie is not None else 0)
+
+    def __iter__(self) -> Iterator[str]:
+        return self._iter_from(self.root, [])
+
+    # --- Dotazy -------------------------------------------------------------
+
+    def _iter_from(self, node: _Node, prefix: list[str]) -> Iterator[str]:
+        # DFS v abecednom poradi; prefix sa zdiela a po navrate sa skrati
+        if node.terminal:
+            yield "".join(prefix)
+        for ch in sorted(node.children):
+            prefix.append(ch)
+            yield from self._iter_from(node.children[ch], prefix)
+            prefix.pop()
+
+    @staticmethod
+    def _take(words: Iterator[str], limit: int | None) -> list[str]:
+        out: list[str] = []
+        for word in words:
+            if limit is not None and len(out) >= limit:
+                break
+            out.append(word)
+        return out
+
+    def with_prefix(self, prefix: str, *, limit: int | None = None) -> list[str]:
+        """Slová začínajúce na `prefix` (vrátane samotného prefixu, ak je slovom)."""
+
+        normalized = normalize_lexicon_word(prefix)
+        node = self.walk(normalized)
+        if node is None:
+            return []
+        return self._take(self._iter_from(node, list(normalized)), limit)
+
+    def with_suffix(self, suffix: str, *, limit: int | None = None) -> list[str]:
+        """Slová končiace na `suffix` (cez trie otočených slov)."""
+
+        reversed_words = self._reversed_trie().with_prefix(
+            normalize_lexicon_word(suffix)[::-1], limit=limit,
+        )
+        return sorted(word[::-1] for word in reversed_words)
+
+    def _reversed_trie(self) -> WordTrie:
+        with self._reversed_lock:
+            if self._reversed is None:
+                self._reversed = WordTrie(word[::-1] for word in self)
+            return self._reversed
+
+    def matching(self, pattern: str, *, limit: int | None = None) -> list[str]:
+        """Slová presnej dĺžky vzoru; '.' alebo '?' je ľubovoľné písmeno (napr. '.A..E')."""
+
+        slots = [
+            ch if ch in PATTERN_WILDCARDS else normalize_lexicon_word(ch)
+            for ch in pattern.strip()
+        ]
+        return self._take(self._match_from(self.root, slots, 0, []), limit)
+
+    def _match_from(
+        self, node: _Node, slots: list[str], pos: int, prefix: list[str],
+    ) -> Iterator[str]:
+        if pos == len(slots):
+            if node.terminal:
+                yield "".join(prefix)
+            return
+        slot = slots[pos]
+        if slot in PATTERN_WILDCARDS:
+            branches = sorted(node.children.items())
+        else:
+            child = node.children.get(slot)
+            branches = [(slot, child)] if child is not None else []
+        for ch, child in branches:
+            prefix.append(ch)
+            yield from self._match_from(child, slots, pos + 1, prefix)
+            prefix.pop()
+
+    def formable_from_rack(
+        self, rack: Iterable[str], *, min_length: int = 2, limit: int | None = None,
+    ) -> list[str]:
+        """Slová zložiteľné z písmen racku; '?' je blank (zastúpi ľubovoľné písmeno).
+
+        Prehľadáva strom a vetví sa len po písmenách, ktoré v racku ešte ostali,
+        takže netreba skúšať permutácie.
+        """
+
+        tiles = [normalize_lexicon_word(ch) if ch != "?" else ch for ch in rack]
+        counts = Counter(ch for ch in tiles if ch != "?")
+        blanks = tiles.count("?")
+        found = self._rack_from(self.root, counts, blanks, [], min_length)
+        return self._take(iter(sorted(set(found))), limit)
+
+    def _rack_from(
+        self, node: _Node, counts: Counter[str], blanks: int, prefix: list[str], min_length: int,
+    ) -> Iterator[str]:
+        if node.terminal and len(prefix) >= min_length:
+            yield "".join(prefix)
+        for ch, child in node.children.items():
+            if counts[ch] > 0:
+                counts[ch] -= 1
+                prefix.append(ch)
+                yield from self._rack_from(child, counts, blanks, prefix, min_length)
+                prefix.pop()
+                counts[ch] += 1
+            elif blanks > 0:
+                prefix.append(ch)
+                yield from self._rack_from(child, counts, blanks - 1, prefix, min_length)
+                prefix.pop()
+
+
+@dataclass(frozen=True)
+class GeneratedMove:
+    """Jeden legálny ťah nájdený generátorom."""
+
+    placements: tuple[Placement, ...]
+    direction: Direction
+    word: str  # hlavne slovo
+    words: tuple[str, ...]  # hlavne + krizove slova
+    score: int
+
+    @property
+    def uses_blank(self) -> bool:
+        return any(p.letter == "?" for p in self.placements)
+
+    def to_move_dict(self) -> dict[str, Any]:
+        """Serializuje ťah do formátu používaného AI schémou (placements + blanks)."""
+
+        first = self.placements[0]
+        return {
+            "start": {"row": first.row, "col": first.col},
+            "direction": self.direction.name,
+            "placements": [
+                {"row": p.row, "col": p.col, "letter": p.blank_as or p.letter}
+                for p in self.placements
+            ],
+            "blanks": [
+                {"row": p.row, "col": p.col, "as": p.blank_as}
+                for p in self.placements
+                if p.letter == "?" and p.blank_as
+            ],
+            "word": self.word,
+            "pass": False,
+            "exchange": [],
+        }
+
+
+class _LineContext:
+    """Pomocné dáta pre jednu líniu (riadok pri ACROSS, stĺpec pri DOWN)."""
+
+    __slots__ = (
+        "cross_after",
+        "cross_allowed",
+        "cross_before",
+        "cross_sum",
+        "letter_mult",
+        "letters",
+        "values",
+        "word_mult",
+    )
+
+    def __init__(self) -> None:
+        self.letters: list[str | None] = [None] * BOARD_SIZE
+        self.values: list[int] = [0] * BOARD_SIZE  # body existujucich dlazdic (blank = 0)
+        self.letter_mult: list[int] = [1] * BOARD_SIZE
+        self.word_mult: list[int] = [1] * BOARD_SIZE
+        # bitova maska povolenych pismen (z CrossCheckIndex)
+        self.cross_allowed: list[int] = [0] * BOARD_SIZE
+        self.cross_sum: list[int] = [NO_CROSS_WORD] * BOARD_SIZE
+        self.cross_before: list[str] = [""] * BOARD_SIZE
+        self.cross_after: list[str] = [""] * BOARD_SIZE
+
+
+class MoveGenerator:
+    """Vyenumeruje všetky legálne ťahy pre dosku a rack nad daným lexikónom."""
+
+    def __init__(self, trie: WordTrie) -> None:
+        self.trie = trie
+        # cross-check index pre kazdu dosku, na ktorej sa generovalo (udrziava sa inkrementalne)
+        self._indexes: weakref.WeakKeyDictionary[Board, CrossCheckIndex] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._indexes_lock = threading.Lock()
+        self._anagrams: AnagramIndex | None = None
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> MoveGenerator:
+        return cls(WordTrie(words))
+
+    @property
+    def anagrams(self) -> AnagramIndex:
+        """Anagramový index nad tým istým lexikónom (postaví sa pri prvom použití)."""
+
+        from .anagrams import AnagramIndex  # cyklicky import (anagrams -> movegen)
+
+        with self._indexes_lock:
+            if self._anagrams is None:
+                self._anagrams = AnagramIndex(self.trie)
+            return self._anagrams
+
+    @property
+    def size_bytes(self) -> int:
+        """Odhad pamäte stromu (a anagramového indexu, ak už je postavený)."""
+
+        size = self.trie.size_bytes
+        if self._anagrams is not None:
+            size += self._anagrams.word_count * _ANAGRAM_WORD_BYTES
+        return size
+
+    # --- Verejné API ------------------------------------------------------
+
+    def generate(
+        self,
+        board: Board,
+        rack: Sequence[str],
+        *,
+        tile_points: dict[str, int] | None = None,
+    ) -> list[GeneratedMove]:
+        """Vráti všetky legálne ťahy (poradie nie je definované)."""
+
+        points = tile_points if tile_points is not None else get_tile_points()
+        rack_counts = Counter(ch for ch in rack if ch != "?")
+        blanks = sum(1 for ch in rack if ch == "?")
+        if not rack_counts and not blanks:
+            return []
+
+        index = self.cross_checks(board, tile_points=points)
+        if not board.tile_count:
+            return self._opening_moves(board, index, rack, rack_counts, blanks, points)
+        return self._line_moves(board, index, rack_counts, blanks, points)
+
+    def _line_moves(
+        self,
+        board: Board,
+        index: CrossCheckIndex,
+        rack_counts: Counter[str],
+        blanks: int,
+        points: dict[str, int],
+    ) -> list[GeneratedMove]:
+        """Prehľadávanie stromu z každej kotvy (všeobecná cesta)."""
+
+        # anchor polia udrziava doska; rozdelime ich podla riadkov/stlpcov
+        rows: dict[int, list[int]] = {}
+        cols: dict[int, list[int]] = {}
+        for idx in board.anchor_indices():
+            r, c = divmod(idx, BOARD_SIZE)
+            rows.setdefault(r, []).append(c)
+            cols.setdefault(c, []).append(r)
+
+        out: list[GeneratedMove] = []
+        for direction, by_line in ((Direction.ACROSS, rows), (Direction.DOWN, cols)):
+            for line_idx in sorted(by_line):
+                anchors = by_line[line_idx]
+                ctx = self._line_context(board, index, direction, line_idx, points)
+                _LineSearch(
+                    self.trie, ctx, direction, line_idx, rack_counts, blanks, points, out,
+                    index.bit_of,
+                ).run(anchors)
+        return out
+
+    def _opening_moves(
+        self,
+        board: Board,
+        index: CrossCheckIndex,
+        rack: Sequence[str],
+        rack_counts: Counter[str],
+        blanks: int,
+        points: dict[str, int],
+    ) -> list[GeneratedMove]:
+        """Prvý ťah: slová z racku cez anagramový index, každé cez stred.
+
+        Na prázdnej doske nie sú krížové slová, takže stačí vyhľadať slová
+        zložiteľné z racku a položiť ich všetkými spôsobmi cez jedinú kotvu.
+        Výsledok je ten istý ako z `_line_moves` (vrátane voľby blankov).
+        """
+
+        words = self.anagrams.formable(rack)
+        out: list[GeneratedMove] = []
+        for anchor_idx in board.anchor_indices():
+            r, c = divmod(anchor_idx, BOARD_SIZE)
+            for direction, line_idx, anchor in ((Direction.ACROSS, r, c), (Direction.DOWN, c, r)):
+                search = _LineSearch(
+                    self.trie,
+                    self._line_context(board, index, direction, line_idx, points),
+                    direction, line_idx, rack_counts, blanks, points, out, index.bit_of,
+                )
+                for word in words:
+                    size = len(word)
+                    assignments = list(_blank_assignments(word, rack_counts, blanks))
+                    for start in range(max(0, anchor - size + 1), min(anchor, BOARD_SIZE - size) + 1):
+                        for is_blank in assignments:
+                            search.tiles = [
+                                (start + k, letter, is_blank[k]) for k, letter in enumerate(word)
+                            ]
+                            search.record(start, start + size)
+        return out
+
+    def cross_checks(
+        self,
+        board: Board,
+        *,
+        tile_points: dict[str, int] | None = None,
+    ) -> CrossCheckIndex:
+        """Cross-check index pre dosku, zosynchronizovaný s jej aktuálnym stavom."""
+
+        points = tile_points if tile_points is not None else get_tile_points()
+        with self._indexes_lock:
+            index = self._indexes.get(board)
+            if index is None or index.tile_points != points:
+                index = CrossCheckIndex(board, self.trie, points)
+                self._indexes[board] = index
+                return index
+        index.refresh()
+        return index
+
+    def best_move(
+        self,
+        board: Board,
+        rack: Sequence[str],
+        *,
+        tile_points: dict[str, int] | None = None,
+    ) -> GeneratedMove | None:
+        """Najlepší ťah podľa skóre (pri zhode viac použitých písmen, potom slovo)."""
+
+        moves = self.generate(board, rack, tile_points=tile_points)
+        if not moves:
+            return None
+        return max(moves, key=_move_rank)
+
+    # --- Interné helpery --------------------------------------------------
+
+    def _line_context(
+        self,
+        board: Board,
+        index: CrossCheckIndex,
+        direction: Direction,
+        line_idx: int,
+        points: dict[str, int],
+    ) -> _LineContext:
+        ctx = _LineContext()
+        d = 0 if direction == Direction.ACROSS else 1
+        allowed = index.allowed[d]
+        cross_sum = index.cross_sum[d]
+        parts = index.parts[d]
+        for i in range(BOARD_SIZE):
+            r, c = _coords(direction, line_idx, i)
+            cell = board.cells[r][c]
+            letter = cell.letter
+            if letter:
+                ctx.letters[i] = letter
+                ctx.values[i] = 0 if cell.is_blank else points.get(letter, 0)
+                continue
+            if cell.premium is not None and not cell.premium_used:
+                ctx.letter_mult[i] = _LETTER_MULT.get(cell.premium, 1)
+                ctx.word_mult[i] = _WORD_MULT.get(cell.premium, 1)
+            idx = r * BOARD_SIZE + c
+            ctx.cross_allowed[i] = allowed[idx]
+            ctx.cross_sum[i] = cross_sum[idx]
+            ctx.cross_before[i], ctx.cross_after[i] = parts[idx]
+        return ctx
+
+
+class _LineSearch:
+    """Rekurzívne prehľadávanie (LeftPart/ExtendRight) v jednej línii."""
+
+    def __init__(
+        self,
+        trie: WordTrie,
+        ctx: _LineContext,
+        direction: Direction,
+        line_idx: int,
+        rack: Counter[str],
+        blanks: int,
+        points: dict[str, int],
+        out: list[GeneratedMove],
+        bit_of: dict[str, int],
+    ) -> None:
+        self.trie = trie
+        self.bit_of = bit_of
+        self.ctx = ctx
+        self.direction = direction
+        self.line_idx = line_idx
+        self.rack = rack
+        self.blanks = blanks
+        self.points = points
+        self.out = out
+        self.rack_size = sum(rack.values()) + blanks
+        # nove dlazdice: (index v linii, pismeno, je_blank)
+        self.tiles: list[tuple[int, str, bool]] = []
+        self.anchor = 0
+
+    def run(self, anchors: list[int]) -> None:
+        letters = self.ctx.letters
+        anchor_set = set(anchors)
+        for anchor in anchors:
+            self.anchor = anchor
+            if anchor > 0 and letters[anchor - 1]:
+                start = anchor - 1
+                while start > 0 and letters[start - 1]:
+                    start -= 1
+                prefix = "".join(letters[i] or "" for i in range(start, anchor))
+                node = self.trie.walk(prefix)
+                if node is not None:
+                    self.tiles = []
+                    self._extend_right(node, anchor, start)
+                continue
+            limit = 0
+            i = anchor - 1
+            while i >= 0 and not letters[i] and i not in anchor_set:
+                limit += 1
+                i -= 1
+            self._left_part(self.trie.root, min(limit, self.rack_size - 1), [])
+
+    def _left_part(self, node: _Node, limit: int, prefix: list[tuple[str, bool]]) -> None:
+        # prefix sa ulozi nalavo od kotvy az ked je znama jeho dlzka
+        start = self.anchor - len(prefix)
+        self.tiles = [(start + k, letter, is_blank) for k, (letter, is_blank) in enumerate(prefix)]
+        self._extend_right(node, self.anchor, start)
+        if limit <= 0:
+            return
+        for letter, child in node.children.items():
+            if self.rack[letter] > 0:
+                self.rack[letter] -= 1
+                prefix.append((letter, False))
+                self._left_part(child, limit - 1, prefix)
+                prefix.pop()
+                self.rack[letter] += 1
+            if self.blanks > 0:
+                self.blanks -= 1
+                prefix.append((letter, True))
+                self._left_part(child, limit - 1, prefix)
+                prefix.pop()
+                self.blanks += 1
+
+    def _extend_right(self, node: _Node, pos: int, start: int) -> None:
+        letters = self.ctx.letters
+        if pos >= BOARD_SIZE or not letters[pos]:
+            if node.terminal and pos > self.anchor and self.tiles:
+                self.record(start, pos)
+            if pos >= BOARD_SIZE:
+                return
+            allowed = self.ctx.cross_allowed[pos]
+            bit_of = self.bit_of
+            for letter, child in node.children.items():
+                if not allowed & bit_of[letter]:
+                    continue
+                if self.rack[letter] > 0:
+                    self.rack[letter] -= 1
+                    self.tiles.append((pos, letter, False))
+                    self._extend_right(child, pos + 1, start)
+                    self.tiles.pop()
+                    self.rack[letter] += 1
+                if self.blanks > 0:
+                    self.blanks -= 1
+                    self.tiles.append((pos, letter, True))
+                    self._extend_right(child, pos + 1, start)
+                    self.tiles.pop()
+                    self.blanks += 1
+            return
+        existing = letters[pos] or ""
+        nxt = node.children.get(existing)
+        if nxt is not None:
+            self._extend_right(nxt, pos + 1, start)
+
+    def record(self, start: int, end: int) -> None:
+        """Zaznamená ťah z `self.tiles` (slovo v línii od `start` po `end`)."""
+        ctx = self.ctx
+        tiles = self.tiles
+        # jednopismenny tah s krizovym slovom uz nasiel ACROSS prechod
+        if len(tiles) == 1 and self.direction == Direction.DOWN and ctx.cross_sum[tiles[0][0]] >= 0:
+            return
+        new_at = {idx: (letter, is_blank) for idx, letter, is_blank in tiles}
+        main_sum = 0
+        main_mult = 1
+        cross_total = 0
+        word_chars: list[str] = []
+        cross_words: list[str] = []
+        for i in range(start, end):
+            placed = new_at.get(i)
+            if placed is None:
+                word_chars.append(ctx.letters[i] or "")
+                main_sum += ctx.values[i]
+                continue
+            letter, is_blank = placed
+            word_chars.append(letter)
+            value = 0 if is_blank else self.points.get(letter, 0)
+            lm = ctx.letter_mult[i]
+            wm = ctx.word_mult[i]
+            main_sum += value * lm
+            main_mult *= wm
+            if ctx.cross_sum[i] >= 0:
+                cross_total += (ctx.cross_sum[i] + value * lm) * wm
+                cross_words.append(ctx.cross_before[i] + letter + ctx.cross_after[i])
+        score = main_sum * main_mult + cross_total
+        if len(tiles) == RACK_SIZE:
+            score += BINGO_BONUS
+        word = "".join(word_chars)
+        placements = tuple(
+            Placement(
+                row=r,
+                col=c,
+                letter="?" if is_blank else letter,
+                blank_as=letter if is_blank else None,
+            )
+            for idx, letter, is_blank in sorted(tiles)
+            for r, c in (_coords(self.direction, self.line_idx, idx),)
+        )
+        self.out.append(
+            GeneratedMove(
+                placements=placements,
+                direction=self.direction,
+                word=word,
+                words=(word, *cross_words),
+                score=score,
+            )
+        )
+
+
+def _blank_assignments(
+    word: str, rack: Counter[str], blanks: int,
+) -> Iterator[tuple[bool, ...]]:
+    """Všetky spôsoby, ktorými písmená slova pokryjú dlaždice racku (True = blank)."""
+
+    remaining = Counter(rack)
+
+    def walk(i: int, blanks_left: int, chosen: list[bool]) -> Iterator[tuple[bool, ...]]:
+        if i == len(word):
+            yield tuple(chosen)
+            return
+        letter = word[i]
+        if remaining[letter] > 0:
+            remaining[letter] -= 1
+            chosen.append(False)
+            yield from walk(i + 1, blanks_left, chosen)
+            chosen.pop()
+            remaining[letter] += 1
+        if blanks_left > 0:
+            chosen.append(True)
+            yield from walk(i + 1, blanks_left - 1, chosen)
+            chosen.pop()
+
+    yield from walk(0, blanks, [])
+
+
+def _coords(direction: Direction, line_idx: int, i: int) -> tuple[int, int]:
+    return (line_idx, i) if direction == Direction.ACROSS else (i, line_idx)
+
+
+def _move_rank(move: GeneratedMove) -> tuple[int, int, str]:
+    return (move.score, len(move.placements), move.word)
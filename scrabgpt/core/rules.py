@@ -23,17 +23,10 @@ def placements_in_line(placements: list[Placement]) -> Direction | None:
 def connected_to_existing(board: Board, placements: list[Placement]) -> bool:
     """Po prvom tahu musia nove pismena susedit s existujucimi (aspon jednou stranou)."""
     # Ak je doska prazdna, nepotrebujeme kontrolu spojitosti (bude kontrola centra)
-    has_any = any(board.cells[r][c].letter for r in range(BOARD_SIZE) for c in range(BOARD_SIZE))
-    if not has_any:
+    if not board.has_letters():
         return True
-    # Over aspon jednu ortogonalnu susednost k existujucej dlazdici
-    for p in placements:
-        r, c = p.row, p.col
-        for dr, dc in [(-1,0),(1,0),(0,-1),(0,1)]:
-            rr, cc = r+dr, c+dc
-            if 0 <= rr < BOARD_SIZE and 0 <= cc < BOARD_SIZE and board.cells[rr][cc].letter:
-                return True
-    return False
+    # Over aspon jednu ortogonalnu susednost k existujucej dlazdici (anchor index dosky)
+    return board.touches_tiles(placements)
 
 def no_gaps_in_line(
     board: Board,
@@ -46,11 +39,13 @@ def no_gaps_in_line(
     """
     rows = [p.row for p in placements]
     cols = [p.col for p in placements]
+    codes = board.letter_codes
+    new_cells = {(p.row, p.col) for p in placements}
     if direction == Direction.ACROSS:
         r = rows[0]
         cmin, cmax = min(cols), max(cols)
         for c in range(cmin, cmax + 1):
-            if not board.cells[r][c].letter and (r, c) not in {(p.row, p.col) for p in placements}:
+            if not codes[r * BOARD_SIZE + c] and (r, c) not in new_cells:
                 # prazdna bunka a nie je medzi novymi?
                 # povolime len ak existujuca bude po place() zaplnena
                 return False
@@ -58,7 +53,7 @@ def no_gaps_in_line(
         c = cols[0]
         rmin, rmax = min(rows), max(rows)
         for r in range(rmin, rmax + 1):
-            if not board.cells[r][c].letter and (r, c) not in {(p.row, p.col) for p in placements}:
+            if not codes[r * BOARD_SIZE + c] and (r, c) not in new_cells:
                 return False
     return True
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from .board import Board
+from .board import BOARD_SIZE, FLAG_BLANK, FLAG_PREMIUM_USED, PREMIUM_BY_CODE, Board, decode_letter
 from .tiles import get_tile_points
 from .types import Placement, Premium, ScoreBreakdown
 
@@ -28,18 +28,20 @@ def score_words(
         word_points = 0
         letter_bonus = 0
         for (r,c) in coords:
-            cell = board.cells[r][c]
-            letter = cell.letter or ""
-            base = 0 if cell.is_blank else tile_points.get(letter, 0)
+            idx = r * BOARD_SIZE + c
+            flags = board.flags[idx]
+            letter = decode_letter(board.letter_codes[idx]) or ""
+            base = 0 if flags & FLAG_BLANK else tile_points.get(letter, 0)
             # ak je to nova bunka, mozeme uplatnit prémie poli
-            if (r,c) in new_cells and cell.premium and not cell.premium_used:
-                if cell.premium == Premium.DL:
+            premium = PREMIUM_BY_CODE[board.premium_codes[idx]]
+            if (r,c) in new_cells and premium and not flags & FLAG_PREMIUM_USED:
+                if premium == Premium.DL:
                     letter_bonus += base  # +1x dalsi nasobok (2x celkovo)
-                elif cell.premium == Premium.TL:
+                elif premium == Premium.TL:
                     letter_bonus += base * 2  # +2x (3x celkovo)
-                elif cell.premium == Premium.DW:
+                elif premium == Premium.DW:
                     word_multiplier *= 2
-                elif cell.premium == Premium.TW:
+                elif premium == Premium.TW:
                     word_multiplier *= 3
             word_points += base
         total = (word_points + letter_bonus) * word_multiplier
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from typing import Any, Literal, TypedDict
 
-from .board import Board
+from .board import FLAG_BLANK, FLAG_PREMIUM_USED, Board
 from .tiles import TileBag, get_tile_distribution
 from .variant_store import get_active_variant_slug
 
@@ -40,19 +40,12 @@ def build_ai_state_dict(
     - ai_rack: retazec pismen na racku AI
     - skore hracov a kto je na tahu
     """
-    grid: list[str] = []
-    blanks: list[BlankPos] = []
-    for r in range(15):
-        row_chars: list[str] = []
-        for c in range(15):
-            cell = board.cells[r][c]
-            if cell.letter:
-                row_chars.append(cell.letter)
-                if cell.is_blank:
-                    blanks.append({"row": r, "col": c})
-            else:
-                row_chars.append(".")
-        grid.append("".join(row_chars))
+    grid = board.grid_rows()
+    blanks: list[BlankPos] = [
+        {"row": r, "col": c}
+        for r, c in board.positions_with_flag(FLAG_BLANK)
+        if board.get_letter(r, c)
+    ]
 
     return AIState(
         grid=grid,
@@ -182,22 +175,15 @@ def build_save_state_dict(
 
     Pozn.: Neobsahuje dočasné rozloženia (pending placements).
     """
-    grid: list[str] = []
-    blanks: list[_Pos] = []
-    premium_used: list[_Pos] = []
-    for r in range(15):
-        row_chars: list[str] = []
-        for c in range(15):
-            cell = board.cells[r][c]
-            if getattr(cell, "premium_used", False):
-                premium_used.append({"row": r, "col": c})
-            if cell.letter:
-                row_chars.append(cell.letter)
-                if cell.is_blank:
-                    blanks.append({"row": r, "col": c})
-            else:
-                row_chars.append(".")
-        grid.append("".join(row_chars))
+    grid = board.grid_rows()
+    blanks: list[_Pos] = [
+        {"row": r, "col": c}
+        for r, c in board.positions_with_flag(FLAG_BLANK)
+        if board.get_letter(r, c)
+    ]
+    premium_used: list[_Pos] = [
+        {"row": r, "col": c} for r, c in board.positions_with_flag(FLAG_PREMIUM_USED)
+    ]
 
     variant = variant_slug or getattr(bag, "variant_slug", None) or get_active_variant_slug()
 
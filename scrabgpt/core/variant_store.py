@@ -2,11 +2,16 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
+import time
 import unicodedata
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import cached_property
 from pathlib import Path
-from typing import Iterable
+from types import MappingProxyType
+from typing import Iterable, Mapping
 
 from .assets import get_assets_path
 
@@ -18,6 +23,11 @@ _ROOT_DIR = Path(__file__).resolve().parents[2]
 _ENV_PATH = _ROOT_DIR / ".env"
 _ENV_LOADED = False
 
+# Ako casto (s) vlakno na pozadi overi subory cachovanych variantov.
+# Zmeny cez `save_variant`/`set_active_variant_slug` sa prejavia okamzite,
+# samotne `load_variant`/`get_active_variant_slug` pri zasahu nerobia I/O.
+_WATCH_INTERVAL = 2.0
+
 
 @dataclass(frozen=True)
 class VariantLetter:
@@ -41,13 +51,15 @@ class VariantDefinition:
     language_code: str | None = None
     source_url: str | None = None
 
-    @property
-    def distribution(self) -> dict[str, int]:
-        return {letter.letter: letter.count for letter in self.letters}
+    # Mapy sa vytvoria raz a zdieľajú, preto sú len na čítanie
+    # (upraviteľnú kópiu vracia `tiles.get_tile_points()`).
+    @cached_property
+    def distribution(self) -> Mapping[str, int]:
+        return MappingProxyType({letter.letter: letter.count for letter in self.letters})
 
-    @property
-    def tile_points(self) -> dict[str, int]:
-        return {letter.letter: letter.points for letter in self.letters}
+    @cached_property
+    def tile_points(self) -> Mapping[str, int]:
+        return MappingProxyType({letter.letter: letter.points for letter in self.letters})
 
     @property
     def total_tiles(self) -> int:
@@ -62,6 +74,20 @@ class VariantDefinition:
         return self.language
 
 
+@dataclass
+class _CachedVariant:
+    definition: VariantDefinition
+    stamp: tuple[int, int]  # (mtime_ns, size) suboru pri nacitani
+
+
+# Register rozparsovanych variantov (slug -> definicia) a posledne rozlisenie
+# aktivneho variantu: (hodnota SCRABBLE_VARIANT, vysledny slug).
+_VARIANT_CACHE: dict[str, _CachedVariant] = {}
+_ACTIVE_SLUG: tuple[str, str] | None = None
+_CACHE_LOCK = threading.Lock()
+_WATCHER: threading.Thread | None = None
+
+
 # --- Interné helpery -----------------------------------------------------
 
 
@@ -274,12 +300,102 @@ def variant_exists(slug: str) -> bool:
     return _variant_path(slug).exists()
 
 
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _check_variant_files() -> None:
+    """Zahodí cache variantov, ktorých súbor sa na disku zmenil alebo zmizol.
+
+    Volá ju sledovacie vlákno každých `_WATCH_INTERVAL` sekúnd; pri zmene
+    zmizne aj rozlíšenie aktívneho variantu, aby sa znova overilo.
+    """
+
+    global _ACTIVE_SLUG
+    with _CACHE_LOCK:
+        cached_items = list(_VARIANT_CACHE.items())
+        active = _ACTIVE_SLUG
+
+    stale = [key for key, cached in cached_items if _file_stamp(_variant_path(key)) != cached.stamp]
+    if active is not None:
+        # aktivny variant sa rozlisil podla existencie suboru – zmenila sa?
+        candidate = active[0] or _DEFAULT_VARIANT_SLUG
+        active_stale = _variant_path(candidate).exists() != (slugify(candidate) == active[1])
+    else:
+        active_stale = False
+    if not stale and not active_stale:
+        return
+
+    with _CACHE_LOCK:
+        for key in stale:
+            dropped = _VARIANT_CACHE.pop(key, None)
+            if dropped is not None:
+                log.debug("variant_changed_on_disk slug=%s", key)
+        _ACTIVE_SLUG = None
+
+
+def _watch_variant_files() -> None:
+    while True:
+        time.sleep(_WATCH_INTERVAL)
+        try:
+            _check_variant_files()
+        except Exception as exc:  # noqa: BLE001
+            log.warning("variant_watch_failed error=%s", exc)
+
+
+def _ensure_watcher() -> None:
+    """Spustí (raz za proces) daemon vlákno sledujúce súbory variantov."""
+
+    global _WATCHER
+    if _WATCHER is not None:
+        return
+    with _CACHE_LOCK:
+        if _WATCHER is not None:
+            return
+        _WATCHER = threading.Thread(
+            target=_watch_variant_files, name="scrabgpt-variant-watch", daemon=True
+        )
+        _WATCHER.start()
+
+
 def load_variant(slug: str) -> VariantDefinition:
+    """Načíta variant; rozparsovaná definícia sa drží v pamäti.
+
+    Opakované volania vrátia cachovanú definíciu bez akéhokoľvek I/O. Cache
+    sa zahodí pri `save_variant`/`set_active_variant_slug` a keď sledovacie
+    vlákno zistí zmenu súboru (`_check_variant_files`).
+    """
+
+    key = slugify(slug)
+    cached = _VARIANT_CACHE.get(key)
+    if cached is not None:
+        return cached.definition
+
     ensure_builtin_variant()
     path = _variant_path(slug)
-    if not path.exists():
+    stamp = _file_stamp(path)
+    if stamp is None:
         raise FileNotFoundError(f"Variant '{slug}' neexistuje")
-    return _load_variant_from_path(path)
+
+    definition = _load_variant_from_path(path)
+    with _CACHE_LOCK:
+        _VARIANT_CACHE[key] = _CachedVariant(definition, stamp)
+    _ensure_watcher()
+    log.debug("variant_cached slug=%s", key)
+    return definition
+
+
+def clear_variant_cache() -> None:
+    """Zahodí cachované varianty aj rozlíšenie aktívneho variantu."""
+
+    global _ACTIVE_SLUG
+    with _CACHE_LOCK:
+        _VARIANT_CACHE.clear()
+        _ACTIVE_SLUG = None
 
 
 def save_variant(defn: VariantDefinition) -> Path:
@@ -303,30 +419,37 @@ def save_variant(defn: VariantDefinition) -> Path:
         payload["source_url"] = defn.source_url
     path = _variant_path(defn.slug)
     path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    clear_variant_cache()
     return path
 
 
 def get_active_variant_slug() -> str:
-    ensure_builtin_variant()
+    global _ACTIVE_SLUG
     _ensure_env_loaded()
-    slug = slugify(Path(_variant_path(_DEFAULT_VARIANT_SLUG)).stem)
-    from os import getenv
+    env_value = os.environ.get("SCRABBLE_VARIANT", "")
+    active = _ACTIVE_SLUG
+    if active is not None and active[0] == env_value:
+        return active[1]
 
-    candidate = getenv("SCRABBLE_VARIANT", slug)
+    ensure_builtin_variant()
+    slug = slugify(Path(_variant_path(_DEFAULT_VARIANT_SLUG)).stem)
+    candidate = env_value or slug
     path = _variant_path(candidate)
     if path.exists():
-        return slugify(candidate)
-    log.warning("active_variant_missing slug=%s -> fallback=%s", candidate, slug)
-    return slug
+        resolved = slugify(candidate)
+    else:
+        log.warning("active_variant_missing slug=%s -> fallback=%s", candidate, slug)
+        resolved = slug
+    _ACTIVE_SLUG = (env_value, resolved)
+    _ensure_watcher()
+    return resolved
 
 
 def set_active_variant_slug(slug: str) -> VariantDefinition:
     ensure_builtin_variant()
     _ensure_env_loaded()
     definition = load_variant(slug)
-    from os import environ
-
-    environ["SCRABBLE_VARIANT"] = definition.slug
+    os.environ["SCRABBLE_VARIANT"] = definition.slug
 
     try:
         from dotenv import set_key as _dotenv_set_key
@@ -1,6 +1,5 @@
 
 from __future__ import annotations
-import asyncio
 import re
 import os
 import sys
@@ -10,8 +9,8 @@ import logging
 import time
 import html
 from itertools import permutations
-from copy import deepcopy
 from collections.abc import Callable
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from typing import Any, Literal, Optional, Sequence, cast
 from pathlib import Path
@@ -73,6 +72,7 @@ from ..core.rules import placements_in_line
 from ..core.rules import first_move_must_cover_center, connected_to_existing, no_gaps_in_line, extract_all_words
 from ..core.scoring import score_words, apply_premium_consumption
 from ..core.types import Placement, Premium
+from ..core.movegen import GeneratedMove
 from ..ai.client import OpenAIClient, JudgeBatchResponse
 from ..ai.player import (
     propose_move as ai_propose_move,
@@ -82,11 +82,13 @@ from ..ai.player import (
     get_context_transcript,
 )
 from ..ai.openrouter import OpenRouterClient
+from ..ai.async_runtime import AsyncRuntime
 from ..ai.openai_tools_client import OpenAIToolClient
 from ..ai.vertex import VertexClient
 from ..ai.vertex_genai_client import build_client as build_vertex_genai_client
-from ..ai.multi_model import propose_move_multi_model
-from ..ai.mcp_tools import tool_validate_word_english, tool_validate_word_slovak
+from ..ai.multi_model import local_race_bound, propose_move_multi_model, race_score_target
+from ..ai.lexicon import language_key
+from ..ai.mcp_tools import get_move_generator, tool_validate_word_english, tool_validate_word_slovak
 from .agents_dialog import AgentsDialog, AsyncAgentWorker, AgentActivityWidget
 from .agent_status_widget import AgentStatusWidget
 from .chat_dialog import ChatDialog
@@ -184,6 +186,44 @@ class _WordScoreDetail:
 # Použi centralizovanú konfiguráciu (zabráni duplicitám handlerov)
 log = configure_logging()
 
+
+# ---------- Dlhožijúci klienti providerov (na runtime slučke aplikácie) ----------
+
+def _runtime_tool_client(
+    runtime: AsyncRuntime,
+    *,
+    api_key: str | None,
+    base_url: str | None,
+    timeout_seconds: int,
+    default_headers: dict[str, str] | None,
+) -> OpenAIToolClient:
+    """OpenAI-kompatibilný klient pre danú konfiguráciu, zdieľaný medzi ťahmi."""
+    key = (
+        "openai_tools",
+        api_key or "",
+        base_url or "",
+        int(timeout_seconds),
+        tuple(sorted((default_headers or {}).items())),
+    )
+    return runtime.client(
+        key,
+        lambda: OpenAIToolClient(
+            api_key=api_key or None,
+            base_url=base_url,
+            timeout_seconds=timeout_seconds,
+            default_headers=default_headers,
+        ),
+    )
+
+
+def _runtime_vertex_client(runtime: AsyncRuntime, *, timeout_seconds: int) -> VertexClient:
+    """Vertex klient (bez fallback modelu), zdieľaný medzi ťahmi."""
+    return runtime.client(
+        ("vertex", int(timeout_seconds)),
+        lambda: VertexClient(timeout_seconds=timeout_seconds, allow_model_fallback=False),
+    )
+
+
 # ---------- Jednoduché UI prvky ----------
 
 class NewVariantDialog(QDialog):
@@ -1550,6 +1590,8 @@ class MainWindow(QMainWindow):
         self._single_model_seen_attempt_words: set[str] = set()
         self._single_model_attempt_eval_count: int = 0
         self._single_model_attempt_eval_limit: int = 32
+        # vysledok generatora tahov pre poslednu poziciu (kluc = doska + rack AI)
+        self._local_moves_cache: tuple[tuple[Any, ...], list[GeneratedMove]] | None = None
         self._ai_waiting_worker: bool = False
         self._ai_turn_timeout_seconds: int = 0
         self._ai_turn_started_monotonic: float = 0.0
@@ -1574,6 +1616,9 @@ class MainWindow(QMainWindow):
 
         # OpenAI klient (lazy init po prvom pouziti ak treba)
         self.ai_client: Optional[OpenAIClient] = None
+
+        # Jedna asyncio slučka pre všetky volania providerov (klienti prežijú ťahy)
+        self._async_runtime = AsyncRuntime()
         
         # OpenRouter klient (pre chat protokol)
         self.openrouter_client: Optional[OpenRouterClient] = None
@@ -2206,21 +2251,17 @@ class MainWindow(QMainWindow):
 
         async def run_provider_call() -> dict[str, Any]:
             if provider == OpponentMode.GEMINI:
-                vertex_client = VertexClient(
-                    timeout_seconds=timeout_seconds,
-                    allow_model_fallback=False,
+                vertex_client = _runtime_vertex_client(
+                    self._async_runtime, timeout_seconds=timeout_seconds,
+                )
+                return await vertex_client.call_model(
+                    model_id,
+                    prompt=prompt_with_schema,
+                    max_tokens=capped_tokens,
+                    thinking_mode=False,
+                    tools=[],
+                    request_timeout_seconds=timeout_seconds,
                 )
-                try:
-                    return await vertex_client.call_model(
-                        model_id,
-                        prompt=prompt_with_schema,
-                        max_tokens=capped_tokens,
-                        thinking_mode=False,
-                        tools=[],
-                        request_timeout_seconds=timeout_seconds,
-                    )
-                finally:
-                    await vertex_client.close()
 
             api_key: str | None = None
             base_url: str | None = None
@@ -2248,23 +2289,21 @@ class MainWindow(QMainWindow):
             else:
                 raise RuntimeError(f"Nepodporovaný provider rozhodcu: {provider.value}")
 
-            tool_client = OpenAIToolClient(
-                api_key=api_key or None,
+            tool_client = _runtime_tool_client(
+                self._async_runtime,
+                api_key=api_key,
                 base_url=base_url,
                 timeout_seconds=timeout_seconds,
                 default_headers=default_headers,
             )
-            try:
-                return await tool_client.call_model(
-                    model_id,
-                    prompt=prompt_with_schema,
-                    max_tokens=capped_tokens,
-                    tools=[],
-                    request_timeout_seconds=timeout_seconds,
-                    round_timeout_seconds=min(25, timeout_seconds),
-                )
-            finally:
-                await tool_client.close()
+            return await tool_client.call_model(
+                model_id,
+                prompt=prompt_with_schema,
+                max_tokens=capped_tokens,
+                tools=[],
+                request_timeout_seconds=timeout_seconds,
+                round_timeout_seconds=min(25, timeout_seconds),
+            )
 
         log.info(
             "Judge provider=%s model=%s words=%s",
@@ -2272,7 +2311,7 @@ class MainWindow(QMainWindow):
             model_id,
             words,
         )
-        response = asyncio.run(run_provider_call())
+        response = self._async_runtime.run(run_provider_call())
         if str(response.get("status") or "").lower() != "ok":
             error_text = str(response.get("error") or "Neznáma chyba providera.")
             raise RuntimeError(
@@ -2985,8 +3024,11 @@ class MainWindow(QMainWindow):
             "_ai_judge_thread": "_ai_judge_worker",
         }
         for thread_attr, worker_attr in thread_workers.items():
-            self._stop_thread(thread_attr)
             worker = getattr(self, worker_attr, None)
+            cancel = getattr(worker, "cancel", None)
+            if callable(cancel):
+                cancel()
+            self._stop_thread(thread_attr)
             if isinstance(worker, QObject):
                 try:
                     worker.deleteLater()
@@ -3656,11 +3698,7 @@ class MainWindow(QMainWindow):
         self._spinner_phase += 1
 
     def _has_any_letters(self) -> bool:
-        for r in range(15):
-            for c in range(15):
-                if self.board.cells[r][c].letter:
-                    return True
-        return False
+        return self.board.has_letters()
 
     def _parse_blank_map(
         self, blanks_obj: object
@@ -3797,6 +3835,42 @@ class MainWindow(QMainWindow):
                 return False
         return True
 
+    def _generated_local_moves(self) -> list[GeneratedMove] | None:
+        """All legal AI moves for the current position from the local move generator.
+
+        Returns None when the active variant has no bundled word list.
+        """
+        language = (self.variant_language or getattr(self.variant_definition, "language", "")).lower()
+        lexicon_language = language_key(language)
+        generator = get_move_generator(lexicon_language) if lexicon_language else None
+        if generator is None:
+            return None
+
+        key = (
+            language,
+            tuple(self.ai_rack),
+            bytes(self.board.letter_codes),
+        )
+        if self._local_moves_cache is not None and self._local_moves_cache[0] == key:
+            return self._local_moves_cache[1]
+        started = time.perf_counter()
+        moves = generator.generate(self.board, self.ai_rack)
+        log.debug(
+            "[AI] move generator: %d legal moves in %.1f ms",
+            len(moves),
+            (time.perf_counter() - started) * 1000,
+        )
+        self._local_moves_cache = (key, moves)
+        return moves
+
+    @staticmethod
+    def _move_from_generated(generated: GeneratedMove, *, reason: str) -> dict[str, Any]:
+        move = generated.to_move_dict()
+        if not move.get("blanks"):
+            move.pop("blanks", None)
+        move["reason"] = reason
+        return move
+
     @staticmethod
     def _infer_main_word_from_words(
         words_found: list[Any], placements: list[Placement]
@@ -3844,9 +3918,54 @@ class MainWindow(QMainWindow):
             "reason": "local_low_score_fallback",
         }
 
+    def _race_score_for_turn(self) -> int | None:
+        """Score at which parallel models stop racing (see `race_score_target`).
+
+        `AI_RACE_SCORE` sets a "good enough" threshold; the best move of the
+        local generator is always a bound, since no model can beat it. Runs
+        on the ProposeWorker thread, since move generation is too slow for
+        the UI thread.
+        """
+        raw = (os.getenv("AI_RACE_SCORE") or "").strip()
+        try:
+            threshold = int(raw) if raw else None
+        except ValueError:
+            log.warning("Ignoring invalid AI_RACE_SCORE=%r", raw)
+            threshold = None
+        best_local: int | None = None
+        try:
+            generated = self._generated_local_moves()
+        except Exception as e:  # noqa: BLE001
+            log.debug("[AI] race bound skipped, move generator failed: %s", e)
+            generated = None
+        if generated:
+            best_local = local_race_bound(generated)
+        return race_score_target(threshold, best_local)
+
     def _try_local_low_score_move(self) -> dict[str, Any] | None:
         """Try a fast local fallback move before exchanging tiles.
 
+        Uses the exhaustive move generator when the variant has a word list;
+        otherwise falls back to the capped hook search below.
+        """
+        generated = self._generated_local_moves()
+        if generated is not None:
+            if not generated:
+                log.info("[AI] local fallback found no legal move (generator)")
+                return None
+            best = max(generated, key=lambda m: (m.score, len(m.placements), m.word))
+            log.info(
+                "[AI] local fallback move selected word=%s score=%d (generator, %d moves)",
+                best.word,
+                best.score,
+                len(generated),
+            )
+            return self._move_from_generated(best, reason="local_low_score_fallback")
+        return self._try_local_capped_hook_move()
+
+    def _try_local_capped_hook_move(self) -> dict[str, Any] | None:
+        """Capped local search for variants without a bundled word list.
+
         Strategy:
         - Prefer short legal scoring moves validated by local dictionary tools.
         - Search single-tile hooks first, then two-tile hooks near existing letters.
@@ -3873,6 +3992,8 @@ class MainWindow(QMainWindow):
         best_move: dict[str, Any] | None = None
         checked = 0
         max_candidates = 6000
+        # Private copy for make/unmake: workers may read self.board meanwhile
+        scratch = self.board.copy()
 
         def consider(placements: list[Placement]) -> None:
             nonlocal best_score, best_move, checked
@@ -3902,17 +4023,16 @@ class MainWindow(QMainWindow):
             if not fits_rack:
                 return
 
-            board_snapshot = deepcopy(self.board)
-            board_snapshot.place_letters(placements)
-            words_found = extract_all_words(board_snapshot, placements)
-            words = [wf.word for wf in words_found]
-            if not words:
-                return
-            if not self._all_words_locally_valid(words):
-                return
+            with scratch.applied(placements):
+                words_found = extract_all_words(scratch, placements)
+                words = [wf.word for wf in words_found]
+                if not words:
+                    return
+                if not self._all_words_locally_valid(words):
+                    return
 
-            words_coords = [(wf.word, wf.letters) for wf in words_found]
-            score, _ = score_words(board_snapshot, placements, words_coords)
+                words_coords = [(wf.word, wf.letters) for wf in words_found]
+                score, _ = score_words(scratch, placements, words_coords)
             move = self._build_move_from_placements(placements, words_found)
             if move is None:
                 return
@@ -3954,21 +4074,11 @@ class MainWindow(QMainWindow):
                     break
             return best_move
 
-        occupied_cells = [
-            (r, c)
-            for r in range(15)
-            for c in range(15)
-            if self.board.cells[r][c].letter
-        ]
-        if not occupied_cells:
+        if not self.board.has_letters():
             return None
 
-        anchor_empties: set[tuple[int, int]] = set()
-        for r, c in occupied_cells:
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                rr, cc = r + dr, c + dc
-                if 0 <= rr < 15 and 0 <= cc < 15 and not self.board.cells[rr][cc].letter:
-                    anchor_empties.add((rr, cc))
+        # anchor polia (prazdne polia pri dlazdiciach) udrziava doska priebezne
+        anchor_empties = self.board.anchor_squares()
 
         for rr, cc in anchor_empties:
             for letter in candidate_letters_single:
@@ -4552,6 +4662,8 @@ class MainWindow(QMainWindow):
                 timeout_seconds: int,
                 *,
                 provider_type: str = "openrouter",
+                race_score: Callable[[], int | None] | None = None,
+                runtime: AsyncRuntime,
             ) -> None:
                 super().__init__()
                 self.client = client
@@ -4563,10 +4675,31 @@ class MainWindow(QMainWindow):
                 self.board = board
                 self.timeout_seconds = timeout_seconds
                 self.provider_type = provider_type
+                self._race_score_fn = race_score
+                self.race_score: int | None = None
+                self.runtime = runtime
+                self._future: Future[Any] | None = None
+            def cancel(self) -> None:
+                """Cancel the turn's coroutine on the shared runtime loop."""
+                future = self._future
+                if future is not None:
+                    future.cancel()
+            def _run_async(self, coro: Any) -> Any:
+                if self.runtime.in_runtime_thread():
+                    coro.close()
+                    raise RuntimeError("ProposeWorker must not run on the runtime loop")
+                self._future = self.runtime.submit(coro)
+                try:
+                    return self._future.result()
+                finally:
+                    self._future = None
             def run(self) -> None:
                 try:
                     TRACE_ID_VAR.set(self.trace_id)
                     if self.use_multi_model and self.selected_models:
+                        if self._race_score_fn is not None:
+                            # Move generation for the race bound runs here, off the UI thread
+                            self.race_score = self._race_score_fn()
                         if self.provider_type in {"openai_tools", "openrouter", "novita", "lmstudio"}:
                             api_key: str | None = None
                             base_url: str | None = None
@@ -4603,8 +4736,9 @@ class MainWindow(QMainWindow):
                                     f"{self.provider_type.upper()}_API_KEY nie je nastavený"
                                 )
 
-                            tool_client = OpenAIToolClient(
-                                api_key=api_key or None,
+                            tool_client = _runtime_tool_client(
+                                self.runtime,
+                                api_key=api_key,
                                 base_url=base_url,
                                 timeout_seconds=self.timeout_seconds,
                                 default_headers=default_headers,
@@ -4618,27 +4752,24 @@ class MainWindow(QMainWindow):
                                         # Worker/object can be deleted during shutdown.
                                         pass
 
-                                try:
-                                    from ..ai.tool_adapter import get_openai_tools
-
-                                    move, results = await propose_move_multi_model(
-                                        tool_client,  # type: ignore[arg-type]
-                                        self.selected_models,
-                                        self.state_str,
-                                        self.variant,
-                                        self.board,
-                                        self.client,
-                                        progress_callback=on_partial,
-                                        timeout_seconds=self.timeout_seconds,
-                                        tools=get_openai_tools(),
-                                        allow_model_fallback=False,
-                                        enforce_tool_workflow=enforce_tool_workflow,
-                                    )
-                                finally:
-                                    await tool_client.close()
-                                return move, results
+                                from ..ai.tool_adapter import get_openai_tools
+
+                                return await propose_move_multi_model(
+                                    tool_client,  # type: ignore[arg-type]
+                                    self.selected_models,
+                                    self.state_str,
+                                    self.variant,
+                                    self.board,
+                                    self.client,
+                                    progress_callback=on_partial,
+                                    timeout_seconds=self.timeout_seconds,
+                                    tools=get_openai_tools(),
+                                    allow_model_fallback=False,
+                                    enforce_tool_workflow=enforce_tool_workflow,
+                                    race_score=self.race_score,
+                                )
 
-                            resp, results = asyncio.run(run_tool_multi())
+                            resp, results = self._run_async(run_tool_multi())
                             self.multi_model_results.emit(results)
                             if self.provider_type != "openrouter":
                                 self.finished.emit(resp)
@@ -4683,9 +4814,8 @@ class MainWindow(QMainWindow):
                             return
 
                         if self.provider_type == "vertex":
-                            vertex_client = VertexClient(
-                                timeout_seconds=self.timeout_seconds,
-                                allow_model_fallback=False,
+                            vertex_client = _runtime_vertex_client(
+                                self.runtime, timeout_seconds=self.timeout_seconds,
                             )
                             
                             async def run_vertex_multi() -> tuple[dict[str, Any], list[dict[str, Any]]]:
@@ -4695,44 +4825,42 @@ class MainWindow(QMainWindow):
                                     except RuntimeError:
                                         # Worker/object can be deleted during shutdown.
                                         pass
-                                try:
-                                    # Reuse propose_move_multi_model but with VertexClient
-                                    # VertexClient must implement call_model compatible with OpenRouterClient
-                                    # Load local Scrabble tools for Gemini
-                                    from ..ai.tool_adapter import get_gemini_tools
-                                    tools = get_gemini_tools()
-                                    
-                                    # Pass model_id to inner scope if needed, but we have self.selected_models
-                                    current_model_id = self.selected_models[0]["id"] if self.selected_models else "gemini-2.5-pro"
-
-                                    # Enable thinking only for models that support it (like 2.5 pro, 3.0 pro)
-                                    # We can assume all models we select here support it for now
-                                    # Or check model ID
-                                    use_thinking = (
-                                        "thinking" in current_model_id
-                                        or "pro" in current_model_id
-                                        or "flash" in current_model_id
-                                    )
+                                # Reuse propose_move_multi_model but with VertexClient
+                                # VertexClient must implement call_model compatible with OpenRouterClient
+                                # Load local Scrabble tools for Gemini
+                                from ..ai.tool_adapter import get_gemini_tools
+                                tools = get_gemini_tools()
+                                
+                                # Pass model_id to inner scope if needed, but we have self.selected_models
+                                current_model_id = self.selected_models[0]["id"] if self.selected_models else "gemini-2.5-pro"
+
+                                # Enable thinking only for models that support it (like 2.5 pro, 3.0 pro)
+                                # We can assume all models we select here support it for now
+                                # Or check model ID
+                                use_thinking = (
+                                    "thinking" in current_model_id
+                                    or "pro" in current_model_id
+                                    or "flash" in current_model_id
+                                )
 
-                                    move, results = await propose_move_multi_model(
-                                        vertex_client, # type: ignore
-                                        self.selected_models,
-                                        self.state_str,
-                                        self.variant,
-                                        self.board,
-                                        self.client,
-                                        progress_callback=on_partial,
-                                        timeout_seconds=self.timeout_seconds,
-                                        thinking_mode=use_thinking,
-                                        tools=tools, # Pass tools
-                                        allow_model_fallback=False,
-                                        enforce_tool_workflow=True,
-                                    )
-                                finally:
-                                    await vertex_client.close()
+                                move, results = await propose_move_multi_model(
+                                    vertex_client, # type: ignore
+                                    self.selected_models,
+                                    self.state_str,
+                                    self.variant,
+                                    self.board,
+                                    self.client,
+                                    progress_callback=on_partial,
+                                    timeout_seconds=self.timeout_seconds,
+                                    thinking_mode=use_thinking,
+                                    tools=tools, # Pass tools
+                                    allow_model_fallback=False,
+                                    enforce_tool_workflow=True,
+                                    race_score=self.race_score,
+                                )
                                 return move, results
 
-                            resp, results = asyncio.run(run_vertex_multi())
+                            resp, results = self._run_async(run_vertex_multi())
                             self.multi_model_results.emit(results)
                             self.finished.emit(resp)
                             return
@@ -4903,6 +5031,8 @@ class MainWindow(QMainWindow):
             self.board,
             timeout_seconds,
             provider_type=provider_type,
+            race_score=self._race_score_for_turn if use_multi else None,
+            runtime=self._async_runtime,
         )
         self._ai_worker.multi_model_results.connect(self._on_multi_model_results)
         self._ai_worker.partial_result.connect(self._on_multi_model_partial)
@@ -5011,6 +5141,17 @@ class MainWindow(QMainWindow):
             )
             return
 
+        if status == "streaming":
+            phase = str(result.get("phase") or "writing")
+            if phase == "first_token":
+                stream_msg = f"Prvý token po {result.get('ttft', '?')}s, model píše…"
+            elif phase == "move_ready":
+                stream_msg = f"Ťah prijatý po {result.get('move_after', '?')}s"
+            else:
+                stream_msg = f"Model píše… ({result.get('chars', 0)} znakov)"
+            self._set_agent_profile_status(model_key, model_name, stream_msg, is_working=True)
+            return
+
         if status == "pending":
             pending_msg = str(
                 result.get("message") or "Model štartuje samostatný agentický workflow."
@@ -5462,7 +5603,7 @@ class MainWindow(QMainWindow):
                         "Kandidát čaká na finálny výber",
                         is_working=False,
                     )
-            elif entry_status in {"timeout", "error", "parse_error", "invalid"}:
+            elif entry_status in {"timeout", "error", "parse_error", "invalid", "cancelled"}:
                 self._set_agent_profile_status(
                     model_id,
                     model_name,
@@ -6282,13 +6423,12 @@ class MainWindow(QMainWindow):
                     return None
             elif not first_move_must_cover_center(placements):
                 return None
-            board_snapshot = deepcopy(self.board)
-            board_snapshot.place_letters(placements)
-            words_found = extract_all_words(board_snapshot, placements)
-            words_coords = [(wf.word, wf.letters) for wf in words_found]
-            if not words_coords:
-                return None
-            score, _ = score_words(board_snapshot, placements, words_coords)
+            with self.board.copy().applied(placements) as scratch:
+                words_found = extract_all_words(scratch, placements)
+                words_coords = [(wf.word, wf.letters) for wf in words_found]
+                if not words_coords:
+                    return None
+                score, _ = score_words(scratch, placements, words_coords)
             if len(placements) == 7:
                 score += 50
             return int(score)
@@ -6315,6 +6455,14 @@ class MainWindow(QMainWindow):
         if len(normalized) < 2:
             return -1, None
 
+        generated = self._generated_local_moves()
+        if generated is not None:
+            matching = [m for m in generated if m.word == normalized]
+            if not matching:
+                return -1, None
+            best = max(matching, key=lambda m: (m.score, len(m.placements)))
+            return best.score, self._move_from_generated(best, reason="tracked_best_local_word")
+
         board_has_letters = self._has_any_letters()
         letters = list(normalized)
         length = len(letters)
@@ -6322,6 +6470,8 @@ class MainWindow(QMainWindow):
         best_move: dict[str, Any] | None = None
         max_candidates = 4000
         checked = 0
+        # Private copy for make/unmake: workers may read self.board meanwhile
+        scratch = self.board.copy()
 
         for direction in ("ACROSS", "DOWN"):
             if direction == "ACROSS":
@@ -6383,17 +6533,16 @@ class MainWindow(QMainWindow):
                     elif not first_move_must_cover_center(placements):
                         continue
 
-                    board_snapshot = deepcopy(self.board)
-                    board_snapshot.place_letters(placements)
-                    words_found = extract_all_words(board_snapshot, placements)
+                    with scratch.applied(placements):
+                        words_found = extract_all_words(scratch, placements)
+                        words_coords = [(wf.word, wf.letters) for wf in words_found]
+                        score, _ = score_words(scratch, placements, words_coords)
                     words = [wf.word for wf in words_found]
                     if not words:
                         continue
                     if not self._all_words_locally_valid(words):
                         continue
 
-                    words_coords = [(wf.word, wf.letters) for wf in words_found]
-                    score, _ = score_words(board_snapshot, placements, words_coords)
                     if len(placements) == 7:
                         score += 50
                     if int(score) <= best_score:
@@ -6527,6 +6676,54 @@ class MainWindow(QMainWindow):
         tool_args = tool_args_raw if isinstance(tool_args_raw, dict) else {}
         tool_result = tool_result_raw if isinstance(tool_result_raw, dict) else {}
 
+        if tool_name == "validate_words_batch":
+            # kazde slovo z batchu sledujeme ako samostatne validate_word_*
+            batch_words = tool_result.get("results")
+            if not isinstance(batch_words, dict):
+                return
+            batch_language = str(
+                tool_result.get("language") or tool_args.get("language") or "slovak"
+            )
+            for word, word_result in batch_words.items():
+                if not isinstance(word_result, dict):
+                    continue
+                word_language = language_key(str(word_result.get("language") or batch_language))
+                if word_language is None:
+                    continue
+                self._update_attempt_tracking_from_tool_result(
+                    {
+                        **result,
+                        "tool_name": f"validate_word_{word_language}",
+                        "tool_args": {"word": word},
+                        "result": word_result,
+                    }
+                )
+            return
+
+        if tool_name == "score_moves_batch":
+            # batch rozbijeme na jednotlive kandidaty, sleduju sa ako calculate_move_score
+            batch_candidates = tool_args.get("candidates")
+            batch_results = tool_result.get("results")
+            if not isinstance(batch_candidates, list) or not isinstance(batch_results, list):
+                return
+            for item in batch_results:
+                if not isinstance(item, dict) or not item.get("legal"):
+                    continue
+                index = item.get("index")
+                if not isinstance(index, int) or not 0 <= index < len(batch_candidates):
+                    continue
+                candidate = batch_candidates[index]
+                placements = candidate.get("placements") if isinstance(candidate, dict) else candidate
+                self._update_attempt_tracking_from_tool_result(
+                    {
+                        **result,
+                        "tool_name": "calculate_move_score",
+                        "tool_args": {"placements": placements},
+                        "result": item,
+                    }
+                )
+            return
+
         state = self._attempt_state_for_model(model_id)
         validated_words = cast(set[str], state["validated_words"])
         invalid_words = cast(set[str], state["invalid_words"])
@@ -6609,9 +6806,8 @@ class MainWindow(QMainWindow):
             if normalize_err is not None:
                 return
 
-            board_snapshot = deepcopy(self.board)
-            board_snapshot.place_letters(placements)
-            words_found = extract_all_words(board_snapshot, placements)
+            with self.board.copy().applied(placements) as scratch:
+                words_found = extract_all_words(scratch, placements)
             legal_words_payload = [
                 {
                     "word": wf.word,
@@ -8140,9 +8336,8 @@ class MainWindow(QMainWindow):
             word = self._normalize_attempt_word(move.get("word"))
             return [word] if word else []
 
-        board_snapshot = deepcopy(self.board)
-        board_snapshot.place_letters(placements)
-        words_found = extract_all_words(board_snapshot, placements)
+        with self.board.copy().applied(placements) as scratch:
+            words_found = extract_all_words(scratch, placements)
         words: list[str] = []
         for item in words_found:
             word = self._normalize_attempt_word(getattr(item, "word", ""))
@@ -8169,6 +8364,14 @@ class MainWindow(QMainWindow):
             words = self._extract_words_from_tool_payload(words_payload)
             words_text = ", ".join(words[:3]) if words else "?"
             return f"{tool_name}(words={words_text})"
+        if lower == "validate_words_batch":
+            words_arg = tool_args.get("words")
+            count = len(words_arg) if isinstance(words_arg, list) else 0
+            return f"{tool_name}(words={count})"
+        if lower == "score_moves_batch":
+            candidates = tool_args.get("candidates")
+            count = len(candidates) if isinstance(candidates, list) else 0
+            return f"{tool_name}(candidates={count})"
         args_text = self._format_profile_payload(tool_args, max_len=120)
         return f"{tool_name}({args_text})" if args_text else tool_name
 
@@ -8212,6 +8415,25 @@ class MainWindow(QMainWindow):
             words_text = ", ".join(words[:3]) if words else "?"
             score_text = f"{total_score} b" if total_score is not None else "?"
             return f"scoring: {words_text} -> {score_text}"
+        if lower == "validate_words_batch":
+            valid_words = result_data.get("valid")
+            invalid_words = result_data.get("invalid")
+            valid_count = len(valid_words) if isinstance(valid_words, list) else 0
+            invalid_text = ""
+            if isinstance(invalid_words, list) and invalid_words:
+                invalid_text = f", neplatné: {', '.join(str(w) for w in invalid_words[:5])}"
+            return f"overenie slov: validných {valid_count}{invalid_text}"
+        if lower == "score_moves_batch":
+            batch_results = result_data.get("results")
+            items = [item for item in batch_results if isinstance(item, dict)] if isinstance(batch_results, list) else []
+            legal_count = sum(1 for item in items if item.get("legal"))
+            best_text = ""
+            best_index = result_data.get("best_index")
+            if isinstance(best_index, int) and 0 <= best_index < len(items):
+                best = items[best_index]
+                best_words = self._extract_words_from_tool_payload(best.get("words"))
+                best_text = f", najlepší: {', '.join(best_words[:3]) or '?'} -> {best.get('total_score', '?')} b"
+            return f"batch scoring: {len(items)} kandidátov, legálnych {legal_count}{best_text}"
         summary = self._format_profile_payload(result_data, max_len=140)
         return summary or "hotovo"
 
@@ -8375,6 +8597,10 @@ class MainWindow(QMainWindow):
 
         self._ai_waiting_worker = False
         self._ai_ignore_worker_updates = True
+        # Zvyšok ťahu beží na zdieľanej slučke – zruš ho, nech neblokuje ďalší ťah
+        worker_cancel = getattr(self._ai_worker, "cancel", None)
+        if callable(worker_cancel):
+            worker_cancel()
         timeout_seconds = max(
             5,
             int(self._ai_turn_timeout_seconds or self.ai_move_timeout_seconds),
@@ -8693,6 +8919,10 @@ class MainWindow(QMainWindow):
             self._stop_all_threads()
         except Exception:
             log.exception("Failed to stop background threads during close")
+        try:
+            self._async_runtime.shutdown()
+        except Exception:
+            log.exception("Failed to shut down async runtime during close")
         super().closeEvent(event)
 
 def main() -> None:
@@ -783,11 +783,12 @@ class ChatDialog(QDialog):
         if normalized_tool in {
             "validate_word_slovak",
             "validate_word_english",
+            "validate_words_batch",
             "rules_extract_all_words",
             "validate_move_legality",
         }:
             return "word_check"
-        if normalized_tool in {"calculate_move_score", "scoring_score_words"}:
+        if normalized_tool in {"calculate_move_score", "scoring_score_words", "score_moves_batch"}:
             return "scoring"
         if normalized_tool in {"get_board_state", "get_rack_letters"}:
             return "planning"
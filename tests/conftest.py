@@ -23,6 +23,9 @@ def pytest_configure(config):
         print(f"✓ Loaded environment from {env_file}")
     else:
         print(f"⚠ No .env file found at {env_file}")
+
+    # Tests must not read or write the user's persistent validation cache
+    os.environ["SCRABGPT_VALIDATION_CACHE"] = "off"
     
     # Check for API keys
     if os.getenv("OPENAI_API_KEY"):
@@ -86,3 +86,65 @@ def test_judge_words_handles_word_keyed_payload() -> None:
     assert result["all_valid"] is True
     assert {entry["word"] for entry in result["results"]} == {"VODE", "DRIEME"}
     assert all(entry["valid"] for entry in result["results"])
+
+
+def test_concurrent_judges_share_llm_verdicts_per_word() -> None:
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    asked: list[list[str]] = []
+    started = threading.Event()
+
+    def slow_judge(words: list[str], language: str) -> dict:
+        asked.append(list(words))
+        started.set()
+        time.sleep(0.2)
+        return {"results": [{"word": w, "valid": True, "reason": "ok"} for w in words],
+                "all_valid": True}
+
+    class Dummy(OpenAIClient):
+        def __init__(self) -> None:
+            self._slovak_dict = None
+
+    judge = Dummy()
+
+    def first() -> dict:
+        return judge.judge_words(["DOM", "LES"], language="english", llm_validator=slow_judge)
+
+    def second() -> dict:
+        started.wait(1)
+        return judge.judge_words(["les", "MAK"], language="english", llm_validator=slow_judge)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        a, b = pool.submit(first), pool.submit(second)
+        first_result, second_result = a.result(), b.result()
+
+    assert asked == [["DOM", "LES"], ["MAK"]]
+    assert [r["word"] for r in second_result["results"]] == ["LES", "MAK"]
+    assert first_result["all_valid"] and second_result["all_valid"]
+
+
+async def test_judge_words_async_resolves_local_words_without_thread() -> None:
+    asked: list[list[str]] = []
+
+    def judge(words: list[str], language: str) -> dict:
+        asked.append(list(words))
+        return {"results": [{"word": w, "valid": False, "reason": "nie"} for w in words],
+                "all_valid": False}
+
+    class Dummy(OpenAIClient):
+        def __init__(self) -> None:
+            self._slovak_dict = lambda word: word.upper() == "DOM"
+
+        def _judge_words_uncached(self, words, **kwargs):  # type: ignore[no-untyped-def, override]
+            return kwargs["judge_llm"](words, kwargs["language"])
+
+    judge_client = Dummy()
+
+    local_only = await judge_client.judge_words_async(["DOM"], language="slovak", llm_validator=judge)
+    mixed = await judge_client.judge_words_async(["DOM", "XYZ"], language="slovak", llm_validator=judge)
+
+    assert local_only["all_valid"] and asked == [["XYZ"]]
+    assert [r["word"] for r in mixed["results"]] == ["DOM", "XYZ"]
+    assert not mixed["all_valid"]
@@ -4,7 +4,7 @@ import json
 
 import pytest
 
-from scrabgpt.ai.schema import parse_ai_move, to_move_payload
+from scrabgpt.ai.schema import IncrementalMoveParser, parse_ai_move, to_move_payload
 
 
 def test_parse_with_start_and_blanks_coords() -> None:
@@ -238,3 +238,39 @@ def test_parse_inline_json_without_code_block() -> None:
     assert can["row"] == 9 and can["col"] == 3
     assert can["direction"] == "ACROSS"
     assert len(can["placements"]) == 3
+
+
+def test_incremental_parser_detects_move_as_soon_as_it_closes() -> None:
+    """Streamovaný text: ťah je k dispozícii hneď po uzavretí objektu."""
+    payload = {
+        "start": {"row": 7, "col": 7},
+        "direction": "DOWN",
+        "placements": [{"row": 7, "col": 7, "letter": "A"}],
+        "word": "A{",
+    }
+    text = (
+        "<think>maybe {\"placements\": []} ?</think>Plan: {\"note\": 1}\n```json\n"
+        + json.dumps(payload)
+        + "\n```\nExtra commentary that keeps going..."
+    )
+    parser = IncrementalMoveParser()
+    closed_at = None
+    for idx in range(0, len(text), 3):
+        if parser.feed(text[idx : idx + 3]) is not None:
+            closed_at = idx
+            break
+
+    assert parser.move is not None
+    assert closed_at is not None and closed_at < text.index("Extra")
+    assert json.loads(parser.move_text or "") == payload
+    assert to_move_payload(parser.move)["direction"] == "DOWN"
+    # after a move was found further text is ignored
+    assert parser.feed("{}") is None
+
+
+def test_incremental_parser_waits_for_valid_move() -> None:
+    parser = IncrementalMoveParser()
+    assert parser.feed('{"placements": []}') is None  # nie je pass ani ťah
+    assert parser.feed(' {"pass": tr') is None
+    move = parser.feed("ue}")
+    assert move is not None and move.pass_ is True
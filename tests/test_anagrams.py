@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from scrabgpt.core.anagrams import AnagramIndex, signature
+from scrabgpt.core.movegen import MoveGenerator, WordTrie
+
+WORDS = [
+    "AT", "TA", "AS", "ES", "ET", "TE", "CAT", "ACT", "SAT", "SEA", "SET", "TEA", "EAT",
+    "ETA", "ATE", "CATS", "SCAT", "CAST", "SEAT", "EAST", "EATS", "TEAS", "CASE", "ACES",
+]
+
+
+def test_signature_groups_anagrams() -> None:
+    index = AnagramIndex(WORDS + ["a", "x1"])
+    assert signature("tea") == "AET"
+    assert index.anagrams("TAE") == ["ATE", "EAT", "ETA", "TEA"]
+    assert index.anagrams("XYZ") == []
+    assert index.word_count == len(WORDS)
+    assert index.alphabet == ("A", "C", "E", "S", "T")
+
+
+def test_formable_matches_trie_walk_with_blanks() -> None:
+    index = MoveGenerator.from_words(WORDS).anagrams
+    trie = WordTrie(WORDS)
+    for rack in ("TACS", "SEAT?", "C??", "TACSE"):
+        assert index.formable(rack) == trie.formable_from_rack(rack)
+    assert index.formable("SEAT", min_length=4) == ["EAST", "EATS", "SEAT", "TEAS"]
+    assert index.formable("?", max_length=1) == []
@@ -380,6 +380,9 @@ class _LocalJudge:
             )
         return {"results": results, "all_valid": all_valid}
 
+    async def judge_words_async(self, words: list[str], *, language: str) -> dict[str, Any]:
+        return self.judge_words(words, language=language)
+
 
 def _is_infra_failure(status: str, error: str) -> bool:
     status_norm = status.strip().lower()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from scrabgpt.ai.async_runtime import AsyncRuntime
+
+
+class _Client:
+    def __init__(self) -> None:
+        self.closed = False
+        self.loops: list[asyncio.AbstractEventLoop] = []
+
+    async def call(self) -> str:
+        self.loops.append(asyncio.get_running_loop())
+        return "ok"
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def test_runtime_reuses_one_loop_and_cached_clients_across_calls() -> None:
+    runtime = AsyncRuntime(name="test-runtime")
+    built: list[_Client] = []
+
+    def factory() -> _Client:
+        built.append(_Client())
+        return built[-1]
+
+    try:
+        first = runtime.client(("provider", "config"), factory)
+        assert runtime.run(first.call()) == "ok"
+        second = runtime.client(("provider", "config"), factory)
+        assert runtime.submit(second.call()).result(5) == "ok"
+
+        assert first is second and len(built) == 1
+        assert first.loops[0] is first.loops[1]
+        assert runtime.stats() == {"clients": 1, "client_hits": 1, "client_misses": 1}
+    finally:
+        runtime.shutdown()
+
+    assert built[0].closed
+    assert not runtime.running
+
+
+def test_runtime_run_refuses_to_block_its_own_loop() -> None:
+    runtime = AsyncRuntime(name="test-runtime")
+
+    async def nested() -> str:
+        assert threading.current_thread().name == "test-runtime"
+        with pytest.raises(RuntimeError):
+            runtime.run(asyncio.sleep(0))
+        return "done"
+
+    try:
+        assert runtime.run(nested()) == "done"
+    finally:
+        runtime.shutdown()
+
+
+def test_cancelling_submitted_future_cancels_coroutine() -> None:
+    runtime = AsyncRuntime(name="test-runtime")
+    cancelled = threading.Event()
+
+    async def slow() -> None:
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    try:
+        future = runtime.submit(slow())
+        with pytest.raises(TimeoutError):
+            future.result(0.05)
+        future.cancel()
+        assert cancelled.wait(2)
+    finally:
+        runtime.shutdown()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from scrabgpt.core.board import Board
+from scrabgpt.core.rules import connected_to_existing, extract_all_words
+from scrabgpt.core.scoring import apply_premium_consumption
+from scrabgpt.core.types import Placement
+
+PREMIUMS_PATH = str((Path(__file__).resolve().parents[1] / "scrabgpt" / "assets" / "premiums.json").resolve())
+
+
+def _cell_state(board: Board) -> list[tuple[str | None, bool, bool]]:
+    return [(cell.letter, cell.is_blank, cell.premium_used) for row in board.cells for cell in row]
+
+
+def test_push_pop_restores_board_exactly() -> None:
+    board = Board(PREMIUMS_PATH)
+    first = [Placement(7, 7, "C"), Placement(7, 8, "A"), Placement(7, 9, "T")]
+    board.place_letters(first)
+    apply_premium_consumption(board, first)
+    before = _cell_state(board)
+
+    trial = [Placement(8, 9, "?", blank_as="O"), Placement(9, 9, "N")]
+    board.push_move(trial)
+    assert board.pushed_moves == 1
+    assert board.cells[8][9].letter == "O" and board.cells[8][9].is_blank
+    apply_premium_consumption(board, trial)
+    assert [wf.word for wf in extract_all_words(board, trial)] == ["TON"]
+
+    board.pop_move()
+    assert board.pushed_moves == 0
+    assert _cell_state(board) == before
+
+
+def test_nested_applied_contexts_unwind_in_order() -> None:
+    board = Board(PREMIUMS_PATH)
+    before = _cell_state(board)
+
+    with board.applied([Placement(7, 7, "A")]):
+        with board.applied([Placement(7, 8, "T")]):
+            assert board.get_letter(7, 7) == "A"
+            assert board.get_letter(7, 8) == "T"
+        assert board.get_letter(7, 8) is None
+        assert board.pushed_moves == 1
+
+    assert _cell_state(board) == before
+
+
+def test_cell_views_write_through_flat_arrays() -> None:
+    board = Board(PREMIUMS_PATH)
+    cell = board.cells[3][4]
+    cell.letter = "Ô"
+    cell.is_blank = True
+
+    assert board.get_letter(3, 4) == "Ô"
+    assert board.letter_codes[3 * 15 + 4] != 0
+    assert board.grid_rows()[3] == "....Ô.........."
+    assert board.has_letters()
+
+    cell.letter = None
+    cell.is_blank = False
+    assert not board.has_letters()
+    assert board.cells[7][7].premium is not None  # DW v strede
+
+
+def test_snapshot_restore_and_copy_are_independent() -> None:
+    board = Board(PREMIUMS_PATH)
+    move = [Placement(7, 7, "C"), Placement(7, 8, "?", blank_as="A")]
+    board.place_letters(move)
+    apply_premium_consumption(board, move)
+    snap = board.snapshot()
+    assert len(snap) == 3 * 225
+
+    clone = board.copy()
+    clone.cells[0][0].letter = "Z"
+    board.place_letters([Placement(7, 9, "T")])
+    assert board.get_letter(0, 0) is None
+    assert clone.get_letter(7, 9) is None
+
+    board.restore(snap)
+    assert board.get_letter(7, 9) is None
+    assert board.cells[7][8].is_blank and board.cells[7][7].premium_used
+    assert board.snapshot() == snap
+
+
+def _brute_anchors(board: Board) -> list[tuple[int, int]]:
+    if not board.has_letters():
+        return [(7, 7)]
+    return [
+        (r, c)
+        for r in range(15)
+        for c in range(15)
+        if board.get_letter(r, c) is None
+        and any(
+            0 <= r + dr < 15 and 0 <= c + dc < 15 and board.get_letter(r + dr, c + dc)
+            for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+        )
+    ]
+
+
+def test_anchor_index_tracks_all_mutations() -> None:
+    board = Board(PREMIUMS_PATH)
+    assert board.anchor_squares() == [(7, 7)] == _brute_anchors(board)
+
+    word = [Placement(7, 7, "C"), Placement(7, 8, "A"), Placement(7, 9, "T")]
+    board.place_letters(word)
+    assert board.anchor_squares() == _brute_anchors(board)
+    assert board.tile_count == 3 and len(board.anchor_squares()) == 8
+    assert board.is_anchor(6, 8) and not board.is_anchor(7, 8)
+
+    with board.applied([Placement(8, 9, "O"), Placement(9, 9, "N")]):
+        assert board.anchor_squares() == _brute_anchors(board)
+    assert board.anchor_squares() == _brute_anchors(board)
+
+    board.cells[0][0].letter = "Z"
+    assert board.is_anchor(0, 1) and board.is_anchor(1, 0)
+    board.cells[0][0].letter = None
+    assert board.anchor_squares() == _brute_anchors(board)
+
+    snap = board.snapshot()
+    board.clear_letters(word)
+    assert board.anchor_squares() == [(7, 7)]
+    board.restore(snap)
+    assert board.anchor_squares() == _brute_anchors(board)
+    assert board.copy().anchor_squares() == board.anchor_squares()
+
+    assert connected_to_existing(board, [Placement(8, 7, "A")])
+    assert not connected_to_existing(board, [Placement(9, 7, "A")])
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import gc
+import weakref
+from pathlib import Path
+
+from scrabgpt.core.board import Board
+from scrabgpt.core.crosschecks import NO_CROSS_WORD, CrossCheckIndex
+from scrabgpt.core.movegen import MoveGenerator, WordTrie
+from scrabgpt.core.tiles import get_tile_points
+from scrabgpt.core.types import Direction, Placement
+
+PREMIUMS_PATH = str((Path(__file__).resolve().parents[1] / "scrabgpt" / "assets" / "premiums.json").resolve())
+
+WORDS = ["AT", "TA", "AS", "ES", "ET", "TE", "CAT", "CATS", "SEA", "SET", "TEA", "EAT", "EATS"]
+POINTS = get_tile_points("english")
+
+
+def _same_state(a: CrossCheckIndex, b: CrossCheckIndex) -> bool:
+    return a.allowed == b.allowed and a.cross_sum == b.cross_sum and a.parts == b.parts
+
+
+def test_cross_checks_follow_board_incrementally() -> None:
+    trie = WordTrie(WORDS)
+    board = Board(PREMIUMS_PATH)
+    index = CrossCheckIndex(board, trie, POINTS)
+
+    board.place_letters([Placement(7, 6, "C"), Placement(7, 7, "A"), Placement(7, 8, "T")])
+    recomputed = index.refresh()
+    assert 0 < recomputed <= 3 * 5
+    assert _same_state(index, CrossCheckIndex(board, trie, POINTS))
+
+    # pod 'A' (8,7): zvisle slovo A? -> AT, AS
+    assert index.allowed_letters(8, 7, Direction.ACROSS) == frozenset({"T", "S"})
+    assert index.cross_sum[0][8 * 15 + 7] == POINTS["A"]
+    assert index.cross_word(8, 7, Direction.ACROSS, "S") == "AS"
+    # za 'T' (7,9): vodorovne CAT? -> CATS
+    assert index.allowed_letters(7, 9, Direction.DOWN) == frozenset({"S"})
+    # pole bez susedov nema krizove slovo
+    assert index.cross_sum[0][0] == NO_CROSS_WORD
+
+    with board.applied([Placement(8, 7, "T")]):
+        index.refresh()
+        assert _same_state(index, CrossCheckIndex(board, trie, POINTS))
+    index.refresh()
+    assert _same_state(index, CrossCheckIndex(board, trie, POINTS))
+    assert index.refresh() == 0
+
+
+def test_invalid_cross_words_rejects_bad_hooks() -> None:
+    board = Board(PREMIUMS_PATH)
+    board.place_letters([Placement(7, 6, "C"), Placement(7, 7, "A"), Placement(7, 8, "T")])
+    index = MoveGenerator.from_words(WORDS).cross_checks(board, tile_points=POINTS)
+
+    assert index.invalid_cross_words([Placement(8, 7, "T")], Direction.ACROSS) == []
+    assert index.invalid_cross_words([Placement(8, 7, "E")], Direction.ACROSS) == ["AE"]
+    assert index.invalid_cross_words([Placement(8, 7, "?", blank_as="S")], Direction.ACROSS) == []
+
+
+def test_generator_index_does_not_keep_discarded_boards_alive() -> None:
+    generator = MoveGenerator.from_words(WORDS)
+    board = Board(PREMIUMS_PATH)
+    generator.cross_checks(board, tile_points=POINTS)
+    board_ref = weakref.ref(board)
+    assert len(generator._indexes) == 1
+
+    del board
+    gc.collect()
+
+    assert board_ref() is None
+    assert len(generator._indexes) == 0
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+
+from scrabgpt.ai.hedging import (
+    LEG_HEDGE,
+    LEG_PRIMARY,
+    HedgeStats,
+    LatencyTracker,
+    hedged_call,
+)
+
+
+def _ok(result: str) -> bool:
+    return result.startswith("ok")
+
+
+def test_latency_tracker_needs_samples_and_uses_nearest_rank() -> None:
+    tracker = LatencyTracker(window=10, min_samples=3)
+    tracker.record("m", 1.0)
+    tracker.record("m", 2.0)
+    assert tracker.quantile_for("m") is None
+
+    for seconds in (3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0):
+        tracker.record("m", seconds)
+
+    # window keeps the last 10 samples (2..11); p90 by nearest rank is the 9th
+    assert tracker.quantile_for("m") == 10.0
+    assert tracker.snapshot()["m"]["samples"] == 10
+
+
+async def test_hedge_wins_when_primary_shows_no_activity() -> None:
+    stats = HedgeStats()
+    cancelled: list[str] = []
+
+    async def primary(activity: asyncio.Event) -> str:
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append("primary")
+            raise
+        return "ok-primary"
+
+    async def hedge(activity: asyncio.Event) -> str:
+        return "ok-hedge"
+
+    result, leg, hedged = await hedged_call(primary, hedge, delay=0.01, is_success=_ok, stats=stats)
+
+    assert (result, leg, hedged) == ("ok-hedge", LEG_HEDGE, True)
+    await asyncio.sleep(0)  # let the loser observe its cancellation
+    assert cancelled == ["primary"]
+    assert stats.snapshot() == {"launched": 1, "primary_wins": 0, "hedge_wins": 1}
+
+
+async def test_no_hedge_once_primary_is_active() -> None:
+    stats = HedgeStats()
+    hedge_calls: list[str] = []
+
+    async def primary(activity: asyncio.Event) -> str:
+        activity.set()
+        await asyncio.sleep(0.05)
+        return "ok-primary"
+
+    async def hedge(activity: asyncio.Event) -> str:
+        hedge_calls.append("hedge")
+        return "ok-hedge"
+
+    result, leg, hedged = await hedged_call(primary, hedge, delay=0.01, is_success=_ok, stats=stats)
+
+    assert (result, leg, hedged) == ("ok-primary", LEG_PRIMARY, False)
+    assert hedge_calls == []
+    assert stats.snapshot()["launched"] == 0
+
+
+async def test_failed_hedge_waits_for_primary() -> None:
+    async def primary(activity: asyncio.Event) -> str:
+        await asyncio.sleep(0.05)
+        return "ok-primary"
+
+    async def hedge(activity: asyncio.Event) -> str:
+        return "error"
+
+    result, leg, hedged = await hedged_call(
+        primary, hedge, delay=0.01, is_success=_ok, stats=HedgeStats(),
+    )
+
+    assert (result, leg, hedged) == ("ok-primary", LEG_PRIMARY, True)
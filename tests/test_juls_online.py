@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from scrabgpt.ai import juls_online
+from scrabgpt.ai.juls_online import JulsClient
+
+FOUND = "<html><body><div class='result'>slovo</div></body></html>"
+NOT_FOUND = "<html><body><span class='notfound'>Nič nebolo nájdené.</span></body></html>"
+
+
+def _transport(calls: dict[str, int], in_flight: list[int]) -> httpx.MockTransport:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        word = request.url.params["w"]
+        calls[word] = calls.get(word, 0) + 1
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight[1], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        if word == "FLAKY" and calls[word] == 1:
+            return httpx.Response(503)
+        if word == "BROKEN":
+            return httpx.Response(404)
+        return httpx.Response(200, text=FOUND if word != "NESLOVO" else NOT_FOUND)
+
+    return httpx.MockTransport(handler)
+
+
+async def test_lookup_many_is_concurrent_bounded_and_retries() -> None:
+    calls: dict[str, int] = {}
+    in_flight = [0, 0]
+    client = JulsClient(max_concurrency=2, retry_backoff=0.0, transport=_transport(calls, in_flight))
+    try:
+        words = ["SLOVO", "NESLOVO", "FLAKY", "BROKEN", "SLOVO", "DOM", "LES"]
+        results = await client.lookup_many(words, retries=1)
+    finally:
+        await client.aclose()
+
+    assert results["SLOVO"] is True and results["DOM"] is True
+    assert results["NESLOVO"] is False
+    assert results["FLAKY"] is True and calls["FLAKY"] == 2
+    assert isinstance(results["BROKEN"], httpx.HTTPStatusError) and calls["BROKEN"] == 1
+    assert calls["SLOVO"] == 1
+    assert in_flight[1] == 2
+
+
+def test_blocking_facade_reuses_background_client(monkeypatch) -> None:
+    calls: dict[str, int] = {}
+    client = JulsClient(transport=_transport(calls, [0, 0]))
+    monkeypatch.setattr(juls_online, "_CLIENT", client)
+
+    assert juls_online.is_word_in_juls("SLOVO") is True
+    assert juls_online.juls_lookup_many(["NESLOVO", "DOM"]) == {"NESLOVO": False, "DOM": True}
+    assert juls_online.get_juls_client() is client
+
+
+async def test_concurrent_lookups_of_same_word_share_one_request() -> None:
+    calls: dict[str, int] = {}
+    client = JulsClient(transport=_transport(calls, [0, 0]))
+    try:
+        first, second, single = await asyncio.gather(
+            client.lookup_many(["SLOVO", "DOM"]),
+            client.lookup_many(["SLOVO", "LES"]),
+            client.lookup("SLOVO"),
+        )
+    finally:
+        await client.aclose()
+
+    assert first["SLOVO"] is second["SLOVO"] is single is True
+    assert calls == {"SLOVO": 1, "DOM": 1, "LES": 1}
+    assert client.coalesced == 2 and client.lookups == 3
+
+
+async def test_case_variants_share_a_lookup_and_waiters_keep_their_deadline() -> None:
+    calls: dict[str, int] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        word = request.url.params["w"]
+        calls[word] = calls.get(word, 0) + 1
+        await asyncio.sleep(0.3 if word == "Pomaly" else 0.01)
+        return httpx.Response(200, text=FOUND)
+
+    client = JulsClient(transport=httpx.MockTransport(handler))
+    try:
+        upper, lower = await asyncio.gather(client.lookup("Slovo"), client.lookup("slovo"))
+        leader = asyncio.ensure_future(client.lookup("Pomaly"))
+        await asyncio.sleep(0)
+        with pytest.raises(httpx.TimeoutException):
+            await client.lookup("pomaly", deadline=0.05)
+        leader_result = await leader
+    finally:
+        await client.aclose()
+
+    assert upper is lower is True
+    assert calls == {"Slovo": 1, "Pomaly": 1}
+    # the waiter gave up on its own deadline; the shared lookup still finished
+    assert leader_result is True
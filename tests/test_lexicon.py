@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from scrabgpt.ai import lexicon as lexicon_mod
+from scrabgpt.ai.lexicon import (
+    Lexicon,
+    LexiconRegistry,
+    compile_lexicon,
+    compiled_path_for,
+    open_lexicon,
+)
+
+
+def _write_words(path: Path, words: list[str]) -> None:
+    path.write_text("# komentar\n" + "\n".join(words) + "\n", encoding="utf-8")
+
+
+def test_compiled_lexicon_matches_source_words(tmp_path: Path) -> None:
+    source = tmp_path / "words.txt"
+    _write_words(source, ["dom", "Ďateľ", "óda", "dom", "ňufák", "abeceda"])
+    target = compile_lexicon(source, tmp_path / "words.lex")
+
+    lex = Lexicon(target)
+    try:
+        assert len(lex) == 5
+        assert list(lex) == sorted(lex, key=lambda w: w.encode("utf-8"))
+        assert "DOM" in lex and "ďateľ" in lex and "ÓDA" in lex
+        assert "oda" not in lex  # diakritika sa rozlisuje
+        assert "komentar" not in lex and "" not in lex and "zzz" not in lex
+        assert lex.contains("Ňufák")
+        assert lex.with_prefix("D") == ["dom"] and lex.with_prefix("Ďa") == ["ďateľ"]
+    finally:
+        lex.close()
+
+
+def test_open_lexicon_is_shared_and_recompiles_when_source_changes(tmp_path: Path) -> None:
+    source = tmp_path / "words.txt"
+    _write_words(source, ["mama", "tata"])
+    lexicon_mod._OPEN_LEXICONS.clear()
+    try:
+        first = open_lexicon(source)
+        assert open_lexicon(source) is first
+        assert compiled_path_for(source).exists()
+
+        # novy proces: iba namapuje existujuci subor, nekompiluje
+        lexicon_mod._OPEN_LEXICONS.clear()
+        mtime_before = compiled_path_for(source).stat().st_mtime_ns
+        reopened = open_lexicon(source)
+        assert "tata" in reopened
+        assert compiled_path_for(source).stat().st_mtime_ns == mtime_before
+
+        _write_words(source, ["mama", "tata", "babka"])
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        updated = open_lexicon(source)
+        assert updated is not reopened
+        assert "babka" in updated and len(updated) == 3
+    finally:
+        lexicon_mod._OPEN_LEXICONS.clear()
+
+
+def test_registry_shares_lexicons_by_variant_and_evicts_over_budget(tmp_path: Path) -> None:
+    _write_words(tmp_path / "sk.sorted.txt", ["mama", "tata"])
+    _write_words(tmp_path / "twl.txt", ["cat", "dog"])
+    registry = LexiconRegistry(tmp_path, memory_budget_bytes=1)
+
+    slovak = registry.get("slovak")
+    assert slovak is not None
+    assert registry.get("sk") is slovak and registry.get("Slovenčina") is slovak
+    assert registry.contains("english", "CAT") is True
+    assert registry.contains("german", "katze") is None
+    # rozpocet pojme len jeden lexikon: slovencina (najdlhsie nepouzita) vypadne
+    assert registry.loaded_languages() == ["english"]
+    assert registry.evictions == 1
+
+    lookup = registry.contains_fn("slovak")
+    assert lookup is not None and lookup("tata")
+    assert registry.loaded_languages() == ["slovak"]
+    assert registry.loads == 3
+    assert registry.contains_fn("german") is None
+
+
+def test_registry_budgets_derived_structures_and_evicts_them_first(tmp_path: Path) -> None:
+    _write_words(tmp_path / "sk.sorted.txt", ["mama", "tata"])
+    _write_words(tmp_path / "twl.txt", ["cat", "dog"])
+    built: list[tuple[str, str]] = []
+
+    class Trie:
+        size_bytes = 1000
+
+    def build(language: str, path: Path) -> Trie:
+        built.append((language, path.name))
+        return Trie()
+
+    registry = LexiconRegistry(tmp_path)
+    trie = registry.derived("sk", "move_generator", build)
+    assert registry.derived("Slovenčina", "move_generator", build) is trie
+    assert registry.derived("german", "move_generator", build) is None
+    assert built == [("slovak", "sk.sorted.txt")]
+    assert registry.stats()["derived"] == {"slovak:move_generator": 1000}
+
+    english = registry.get("english")
+    assert english is not None
+    assert registry.memory_in_use == english.size_bytes + 1000
+    # rozpocet na jeden lexikon: najprv vypadne starsia odvodena struktura, lexikon ostane
+    registry.memory_budget_bytes = english.size_bytes
+    registry.derived("english", "move_generator", build)
+    assert registry.stats()["derived"] == {"english:move_generator": 1000}
+    assert registry.loaded_languages() == ["english"]
+    assert registry.derived("slovak", "move_generator", build) is not trie
+    assert len(built) == 3
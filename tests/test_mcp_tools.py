@@ -432,6 +432,36 @@ class TestScoringTools:
         assert result["total_score"] == 7
 
 
+    def test_scoring_tools_reuse_cached_board_per_position(self) -> None:
+        """Given: Several tool calls for the same position
+        When: Tools rebuild the board from board_grid
+        Then: The parsed board is cached and placements never leak between calls
+        """
+        from scrabgpt.ai import mcp_tools
+
+        grid = ["." * 15 for _ in range(15)]
+        grid[7] = "." * 7 + "CAT" + "." * 5
+        mcp_tools._BOARD_SNAPSHOTS.clear()
+        hits_before = mcp_tools._BOARD_SNAPSHOT_STATS["hits"]
+
+        first = mcp_tools.tool_calculate_move_score(
+            board_grid=grid,
+            premium_grid=[],
+            placements=[{"row": 7, "col": 10, "letter": "S"}],
+        )
+        second = mcp_tools.tool_calculate_move_score(
+            board_grid=grid,
+            premium_grid=[],
+            placements=[{"row": 8, "col": 9, "letter": "O"}],
+        )
+
+        assert [w["word"] for w in first["words"]] == ["CATS"]
+        assert [w["word"] for w in second["words"]] == ["TO"]
+        assert mcp_tools._BOARD_SNAPSHOT_STATS["hits"] - hits_before >= 2
+        # premium state is part of the key
+        assert len(mcp_tools._BOARD_SNAPSHOTS) == 2
+
+
 class TestStateTools:
     """Test state/information tools that will be exposed via MCP."""
 
@@ -519,6 +549,149 @@ class TestDictionaryTools:
         
         assert result["valid"] is False
 
+    def test_validate_words_batch_returns_per_word_map(self, monkeypatch) -> None:
+        """Given: Mixed list of short, duplicate and long words
+        When: Agent validates them with one batch call
+        Then: Local hits resolve without JULS and only long misses go online
+        """
+        from scrabgpt.ai import mcp_tools
+
+        online_words: list[str] = []
+
+        def fake_juls_many(words: list[str], **_: object) -> dict[str, bool | Exception]:
+            online_words.extend(words)
+            return {word: word == "NEOLOGIZMUSOVÝ" for word in words}
+
+        monkeypatch.setattr(mcp_tools, "juls_lookup_many", fake_juls_many)
+        result = mcp_tools.tool_validate_words_batch(
+            words=["dom", "DOM", "xqz", "a", "NEOLOGIZMUSOVÝ", "QQQQQQQQQQ"],
+        )
+
+        assert result["count"] == 5
+        assert result["results"]["DOM"]["valid"] is True
+        assert result["results"]["XQZ"]["valid"] is False
+        assert result["results"]["A"]["tier"] == 0
+        assert result["results"]["NEOLOGIZMUSOVÝ"]["valid"] is True
+        assert sorted(online_words) == ["NEOLOGIZMUSOVÝ", "QQQQQQQQQQ"]
+        assert result["online_checked"] == 2
+        assert result["invalid"] == ["XQZ", "A", "QQQQQQQQQQ"]
+        assert result["all_valid"] is False
+
+    def test_validate_word_slovak_falls_back_to_judge_on_juls_error(self, monkeypatch) -> None:
+        """Given: JULS is unreachable
+        When: Tool validates a long word missing locally
+        Then: The word is left for the AI judge instead of raising
+        """
+        import httpx
+
+        from scrabgpt.ai import mcp_tools
+
+        def failing_juls(word: str, **_: object) -> bool:
+            raise httpx.ConnectError("connection refused")
+
+        monkeypatch.setattr(mcp_tools, "is_word_in_juls", failing_juls)
+        result = mcp_tools.tool_validate_word_slovak(word="QQQQQQQQQX")
+
+        assert result["valid"] is False
+        assert "needs AI judge" in result["reason"]
+
+    def test_move_generator_is_built_once_under_parallel_calls(self, monkeypatch, tmp_path) -> None:
+        """Given: No move generator built yet
+        When: Several tool threads ask for it at the same time
+        Then: The trie is built once and all callers share it
+        """
+        import threading
+        import time
+
+        from scrabgpt.ai import mcp_tools
+        from scrabgpt.ai.lexicon import LexiconRegistry
+
+        built: list[str] = []
+
+        class Generator:
+            size_bytes = 1
+
+        def slow_build(language: str, path: object) -> Generator:
+            built.append(language)
+            time.sleep(0.05)
+            return Generator()
+
+        (tmp_path / "sk.sorted.txt").write_text("mama\ntata\n", encoding="utf-8")
+        registry = LexiconRegistry(tmp_path)
+        monkeypatch.setattr(mcp_tools, "get_lexicon_registry", lambda: registry)
+        monkeypatch.setattr(mcp_tools, "_build_move_generator", slow_build)
+        results: list[object] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(mcp_tools.get_move_generator("slovak")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert built == ["slovak"]
+        assert len(results) == 8 and len({id(r) for r in results}) == 1
+
+    def test_validate_words_batch_rejects_unsupported_language(self) -> None:
+        """Given: A batch for a language without a validator
+        When: Agent validates it
+        Then: An error comes back instead of a silent Slovak/JULS check
+        """
+        from scrabgpt.ai import mcp_tools
+
+        result = mcp_tools.tool_validate_words_batch(words=["haus"], language="german")
+        english = mcp_tools.tool_validate_words_batch(
+            words=["cat"], language="English", use_online=False,
+        )
+
+        assert "error" in result and result["results"] == {}
+        assert english["language"] == "english" and "error" not in english
+
+    def test_validate_words_batch_reports_words_over_the_cap(self) -> None:
+        """Given: More distinct words than one batch accepts
+        When: Agent validates them with one batch call
+        Then: The overflow is reported as skipped instead of silently dropped
+        """
+        from scrabgpt.ai import mcp_tools
+
+        words = ["dom"] * 3 + ["DOM"] * mcp_tools._VALIDATE_BATCH_MAX_WORDS + ["les", "mak"]
+        words += [f"Q{index:03d}" for index in range(mcp_tools._VALIDATE_BATCH_MAX_WORDS)]
+        result = mcp_tools.tool_validate_words_batch(words=words, use_online=False)
+
+        assert result["count"] == mcp_tools._VALIDATE_BATCH_MAX_WORDS
+        assert result["truncated"] is True
+        assert result["skipped_count"] == 3
+        assert result["skipped"] == ["Q097", "Q098", "Q099"]
+        assert result["all_valid"] is False
+
+    def test_validation_cache_is_lru_with_ttl_per_language(self, monkeypatch) -> None:
+        """Given: A small validation cache with two language partitions
+        When: Entries are read, overflow the bound and outlive the TTL
+        Then: Least recently used entries go first and counters report it
+        """
+        from scrabgpt.ai import mcp_tools
+
+        cache = mcp_tools._ValidationCache(max_size=2, ttl_seconds=60)
+        cache.put("slovak", "DOM", {"valid": True})
+        cache.put("slovak", "LES", {"valid": True})
+        cache.put("english", "CAT", {"valid": True})
+        assert cache.get("slovak", "DOM") == {"valid": True}
+        cache.put("slovak", "MAK", {"valid": False})  # evicts LES (least recently used)
+
+        assert cache.get("slovak", "LES") is None
+        hit = cache.get("slovak", "DOM")
+        assert hit is not None
+        hit["cached"] = True  # callers get a copy
+        assert cache.get("slovak", "DOM") == {"valid": True}
+
+        clock = [mcp_tools.time.time() + 120]
+        monkeypatch.setattr(mcp_tools.time, "time", lambda: clock[0])
+        assert cache.get("english", "CAT") is None
+        stats = cache.stats()
+        assert stats["slovak"] == {"size": 2, "hits": 3, "misses": 1, "evictions": 1, "expirations": 0}
+        assert stats["english"]["expirations"] == 1 and stats["english"]["size"] == 0
+
     @pytest.mark.skip(reason="English validation not implemented yet")
     def test_validate_word_english_accepts_valid_word(self) -> None:
         """Given: Valid English word
@@ -609,6 +782,70 @@ class TestHighLevelTools:
         assert result["valid"] is False
         assert "occupied" in str(result["reason"]).lower()
 
+    def test_score_moves_batch_evaluates_all_candidates(self) -> None:
+        """Given: Several candidate moves for one position
+        When: Agent scores them with one batch call
+        Then: Each gets legality, words with dictionary validity and score
+        """
+        from scrabgpt.ai.mcp_tools import tool_calculate_move_score, tool_score_moves_batch
+
+        grid = ["." * 15 for _ in range(15)]
+        dom = [
+            {"row": 7, "col": 7, "letter": "D"},
+            {"row": 7, "col": 8, "letter": "O"},
+            {"row": 7, "col": 9, "letter": "M"},
+        ]
+        result = tool_score_moves_batch(
+            board_grid=grid,
+            premium_grid=[],
+            candidates=[
+                {"placements": dom},
+                {"placements": [{"row": 7, "col": 7, "letter": "X"}, {"row": 7, "col": 8, "letter": "Q"}]},
+                {"placements": [{"row": 0, "col": 0, "letter": "A"}, {"row": 0, "col": 1, "letter": "J"}]},
+                [{"row": 7, "col": 7, "letter": "D"}, {"row": 8, "col": 8, "letter": "O"}],
+            ],
+            is_first_move=True,
+        )
+
+        assert result["count"] == 4
+        first, invalid_word, off_center, diagonal = result["results"]
+        assert first["legal"] and first["all_words_valid"]
+        assert first["words"][0]["word"] == "DOM" and first["words"][0]["valid"]
+        single = tool_calculate_move_score(board_grid=grid, premium_grid=[], placements=dom)
+        assert first["total_score"] == single["total_score"]
+        assert invalid_word["legal"] and not invalid_word["all_words_valid"]
+        assert not off_center["legal"] and not diagonal["legal"]
+        assert result["best_index"] == 0
+
+    def test_score_moves_batch_isolates_malformed_candidate(self) -> None:
+        """Given: One candidate with a malformed placement among good ones
+        When: Agent scores the batch
+        Then: Only that candidate carries an error; the rest are scored
+        """
+        from scrabgpt.ai.mcp_tools import tool_score_moves_batch
+
+        grid = ["." * 15 for _ in range(15)]
+        dom = [
+            {"row": 7, "col": 7, "letter": "D"},
+            {"row": 7, "col": 8, "letter": "O"},
+            {"row": 7, "col": 9, "letter": "M"},
+        ]
+        result = tool_score_moves_batch(
+            board_grid=grid,
+            premium_grid=[],
+            candidates=[
+                {"placements": [{"row": 7, "col": 7, "letter": 5}, {"row": 7, "col": 8, "letter": "O"}]},
+                {"placements": dom},
+            ],
+            is_first_move=True,
+        )
+
+        assert "error" not in result
+        broken, good = result["results"]
+        assert broken["error"] and not broken["legal"]
+        assert good["legal"] and good["all_words_valid"]
+        assert result["best_index"] == 1
+
     def test_calculate_move_score_returns_total_with_breakdown(self) -> None:
         """Given: Valid move with placements
         When: Tool calculates score
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+
+from scrabgpt.core.board import Board
+from scrabgpt.core.movegen import BINGO_BONUS, GeneratedMove, MoveGenerator, WordTrie
+from scrabgpt.core.rules import (
+    connected_to_existing,
+    extract_all_words,
+    first_move_must_cover_center,
+    no_gaps_in_line,
+    placements_in_line,
+)
+from scrabgpt.core.scoring import apply_premium_consumption, score_words
+from scrabgpt.core.tiles import get_tile_points
+from scrabgpt.core.types import Placement
+
+PREMIUMS_PATH = str((Path(__file__).resolve().parents[1] / "scrabgpt" / "assets" / "premiums.json").resolve())
+
+WORDS = [
+    "AT", "TA", "AS", "ES", "ET", "TE", "CAT", "ACT", "SAT", "SEA", "SET", "TEA", "EAT",
+    "ETA", "ATE", "CATS", "SCAT", "CAST", "SEAT", "EAST", "EATS", "TEAS", "CASE", "ACES",
+]
+POINTS = get_tile_points("english")
+
+
+def _board_with(word: str, row: int, col: int) -> Board:
+    board = Board(PREMIUMS_PATH)
+    placements = [Placement(row, col + idx, letter) for idx, letter in enumerate(word)]
+    board.place_letters(placements)
+    apply_premium_consumption(board, placements)
+    return board
+
+
+def _assert_legal_and_scored(board: Board, move_placements: list[Placement], expected: int) -> None:
+    has_letters = any(cell.letter for row in board.cells for cell in row)
+    direction = placements_in_line(move_placements)
+    assert direction is not None
+    assert no_gaps_in_line(board, move_placements, direction)
+    if has_letters:
+        assert connected_to_existing(board, move_placements)
+    else:
+        assert first_move_must_cover_center(move_placements)
+    with board.applied(move_placements):
+        words = extract_all_words(board, move_placements)
+        assert words and all(wf.word in WORDS for wf in words)
+        total, _ = score_words(board, move_placements, [(wf.word, wf.letters) for wf in words])
+    if len(move_placements) == 7:
+        total += BINGO_BONUS
+    assert total == expected
+
+
+def test_opening_moves_cover_center_and_match_scoring() -> None:
+    board = Board(PREMIUMS_PATH)
+    moves = MoveGenerator.from_words(WORDS).generate(board, list("CATS"), tile_points=POINTS)
+
+    words = {move.word for move in moves}
+    assert {"CAT", "ACT", "CATS", "SCAT", "CAST", "AT", "TA", "AS", "SAT"} <= words
+    assert "TEA" not in words  # E nie je na racku
+    for move in moves:
+        _assert_legal_and_scored(board, list(move.placements), move.score)
+
+
+def test_opening_via_anagram_index_matches_trie_search() -> None:
+    generator = MoveGenerator.from_words(WORDS)
+    board = Board(PREMIUMS_PATH)
+    index = generator.cross_checks(board, tile_points=POINTS)
+
+    def key(move: GeneratedMove) -> str:
+        return repr((move.placements, move.direction, move.words, move.score))
+
+    for rack in ("TACSE", "SEAT?", "C?T?"):
+        counts = Counter(ch for ch in rack if ch != "?")
+        blanks = rack.count("?")
+        opening = generator.generate(board, rack, tile_points=POINTS)
+        searched = generator._line_moves(board, index, counts, blanks, POINTS)
+        assert opening and sorted(map(key, opening)) == sorted(map(key, searched))
+
+
+def test_hooks_extensions_and_cross_words() -> None:
+    board = _board_with("CAT", 7, 6)
+    moves = MoveGenerator.from_words(WORDS).generate(board, list("SE"), tile_points=POINTS)
+
+    by_cells = {tuple((p.row, p.col, p.letter) for p in move.placements): move for move in moves}
+    # CAT -> CATS (hook na konci)
+    assert (7, 9, "S") in {cell for key in by_cells for cell in key if len(key) == 1}
+    # paralelne/krizove slova musia byt v lexikone
+    for move in moves:
+        _assert_legal_and_scored(board, list(move.placements), move.score)
+    assert any(len(move.words) > 1 for move in moves)
+
+
+def test_blank_expands_to_lexicon_letters() -> None:
+    board = Board(PREMIUMS_PATH)
+    moves = MoveGenerator.from_words(WORDS).generate(board, list("C?T"), tile_points=POINTS)
+
+    cat_moves = [move for move in moves if move.word == "CAT"]
+    assert cat_moves
+    blank_placements = [p for move in cat_moves for p in move.placements if p.letter == "?"]
+    assert blank_placements and all(p.blank_as == "A" for p in blank_placements)
+    payload = cat_moves[0].to_move_dict()
+    assert payload["blanks"] == [
+        {"row": p.row, "col": p.col, "as": "A"} for p in cat_moves[0].placements if p.letter == "?"
+    ]
+    for move in moves:
+        _assert_legal_and_scored(board, list(move.placements), move.score)
+
+
+def test_best_move_and_no_duplicates() -> None:
+    board = _board_with("SEA", 7, 7)
+    generator = MoveGenerator.from_words(WORDS)
+    moves = generator.generate(board, list("TACS"), tile_points=POINTS)
+
+    keys = [frozenset((p.row, p.col, p.letter, p.blank_as) for p in move.placements) for move in moves]
+    assert len(keys) == len(set(keys))
+    best = generator.best_move(board, list("TACS"), tile_points=POINTS)
+    assert best is not None
+    assert best.score == max(move.score for move in moves)
+
+
+def test_empty_rack_yields_nothing() -> None:
+    board = Board(PREMIUMS_PATH)
+    assert MoveGenerator.from_words(WORDS).generate(board, [], tile_points=POINTS) == []
+
+
+def test_trie_pattern_prefix_suffix_and_rack_queries() -> None:
+    trie = WordTrie(WORDS)
+    assert list(trie) == sorted(WORDS)
+
+    assert trie.matching(".A.") == ["CAT", "EAT", "SAT"]
+    assert trie.matching("?e?") == ["SEA", "SET", "TEA"]
+    assert trie.matching("C..E") == ["CASE"]
+    assert trie.with_prefix("ca") == ["CASE", "CAST", "CAT", "CATS"]
+    assert trie.with_prefix("CA", limit=2) == ["CASE", "CAST"]
+    assert trie.with_suffix("AT") == ["AT", "CAT", "EAT", "SAT", "SCAT", "SEAT"]
+    assert trie.with_prefix("Q") == [] and trie.matching("....") != []
+
+    brute = sorted(
+        w for w in WORDS if all(w.count(ch) <= "TACS".count(ch) for ch in w)
+    )
+    assert trie.formable_from_rack("TACS") == brute
+    with_blank = trie.formable_from_rack(["T", "A", "?"], min_length=3)
+    assert with_blank == ["ACT", "ATE", "CAT", "EAT", "ETA", "SAT", "TEA"]
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 import pytest
 
-from scrabgpt.ai.multi_model import propose_move_multi_model
+from scrabgpt.ai import multi_model
+from scrabgpt.ai.hedging import LatencyTracker, get_latency_tracker
+from scrabgpt.ai.multi_model import (
+    local_race_bound,
+    propose_move_multi_model,
+    race_score_target,
+)
 from scrabgpt.ai.novita_multi_model import propose_move_novita_multi_model
 from scrabgpt.core.board import Board
+from scrabgpt.core.movegen import GeneratedMove
+from scrabgpt.core.types import Direction, Placement
 from scrabgpt.core.variant_store import VariantDefinition
 
 
@@ -42,6 +51,47 @@ class _StubJudge:
     def judge_words(self, words: list[str], *, language: str) -> dict[str, object]:
         return {"results": [], "all_valid": False}
 
+    async def judge_words_async(self, words: list[str], *, language: str) -> dict[str, object]:
+        return self.judge_words(words, language=language)
+
+
+class _RacingClient:
+    """Model "fast" answers at once with a legal opening move; "slow" hangs."""
+
+    ai_move_max_output_tokens = 800
+
+    def __init__(self) -> None:
+        self.cancelled: list[str] = []
+
+    async def call_model(self, model_id: str, prompt: str, max_tokens: int | None = None) -> dict[str, object]:
+        if model_id == "slow":
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                self.cancelled.append(model_id)
+                raise
+        content = (
+            '{"start":{"row":7,"col":7},"direction":"ACROSS","word":"ON",'
+            '"placements":[{"row":7,"col":7,"letter":"O"},{"row":7,"col":8,"letter":"N"}]}'
+        )
+        return {"status": "ok", "model": model_id, "content": content}
+
+    async def close(self) -> None:
+        return None
+
+
+class _HedgingClient(_RacingClient):
+    """Gemini Pro hangs; its fallback Flash answers at once."""
+
+    async def call_model(self, model_id: str, prompt: str, max_tokens: int | None = None) -> dict[str, object]:
+        return await super().call_model("slow" if model_id.endswith("2.5-pro") else model_id, prompt)
+
+
+class _AcceptingJudge(_StubJudge):
+    def judge_words(self, words: list[str], *, language: str) -> dict[str, object]:
+        return {"results": [{"word": w, "valid": True, "reason": "ok"} for w in words],
+                "all_valid": True}
+
 
 def _make_board() -> Board:
     return Board(str(PREMIUMS_PATH))
@@ -98,3 +148,96 @@ async def test_novita_multi_model_returns_exchange_on_all_errors() -> None:
     assert "Simulated failure" in reason
     assert len(results) == len(models)
     assert all(r.get("status") != "ok" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_multi_model_race_cancels_slow_models_once_score_is_reached() -> None:
+    client = _RacingClient()
+    models = [{"id": "slow", "name": "Slow"}, {"id": "fast", "name": "Fast"}]
+
+    move, results = await asyncio.wait_for(
+        propose_move_multi_model(
+            client,  # type: ignore[arg-type]
+            models,
+            compact_state="state",
+            variant=_make_variant(),
+            board=_make_board(),
+            judge_client=_AcceptingJudge(),  # type: ignore[arg-type]
+            race_score=2,
+        ),
+        timeout=5,
+    )
+
+    assert move["word"] == "ON"
+    assert [r["status"] for r in results] == ["cancelled", "ok"]
+    assert results[0]["model"] == "slow"
+    assert client.cancelled == ["slow"]
+
+
+def test_race_score_target_prefers_lower_reachable_score() -> None:
+    assert race_score_target(None) is None
+    assert race_score_target(40) == 40
+    assert race_score_target(40, best_local_score=22) == 22
+    assert race_score_target(None, best_local_score=0) is None
+
+
+@pytest.mark.asyncio
+async def test_multi_model_hedges_slow_model_with_its_fallback() -> None:
+    tracker = get_latency_tracker()
+    for _ in range(tracker.min_samples):
+        tracker.record("google/gemini-2.5-pro", 0.01)
+    client = _HedgingClient()
+
+    move, results = await asyncio.wait_for(
+        propose_move_multi_model(
+            client,  # type: ignore[arg-type]
+            [{"id": "google/gemini-2.5-pro", "name": "Gemini Pro"}],
+            compact_state="state",
+            variant=_make_variant(),
+            board=_make_board(),
+            judge_client=_AcceptingJudge(),  # type: ignore[arg-type]
+        ),
+        timeout=5,
+    )
+
+    assert move["word"] == "ON"
+    assert results[0]["hedge"]["winner"] == "hedge"
+    assert results[0]["hedge"]["hedge"] == "google/gemini-2.5-flash"
+    assert results[0]["fallback_from"] == "google/gemini-2.5-pro"
+    assert client.cancelled == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_slow_primary_raises_learned_latency(monkeypatch) -> None:
+    tracker = LatencyTracker()
+    for _ in range(tracker.min_samples):
+        tracker.record("google/gemini-2.5-pro", 0.01)
+    monkeypatch.setattr(multi_model, "get_latency_tracker", lambda: tracker)
+
+    await asyncio.wait_for(
+        propose_move_multi_model(
+            _HedgingClient(),  # type: ignore[arg-type]
+            [{"id": "google/gemini-2.5-pro", "name": "Gemini Pro"}],
+            compact_state="state",
+            variant=_make_variant(),
+            board=_make_board(),
+            judge_client=_AcceptingJudge(),  # type: ignore[arg-type]
+        ),
+        timeout=5,
+    )
+
+    # primary prehral hedge bez znamky zivota: censored vzorka >= oneskorenie hedge
+    assert tracker.snapshot()["google/gemini-2.5-pro"]["samples"] == tracker.min_samples + 1
+    learned = tracker.quantile_for("google/gemini-2.5-pro")
+    assert learned is not None and learned > 0.01
+
+
+def test_local_race_bound_leaves_out_the_bingo_bonus() -> None:
+    def generated(tiles: int, score: int) -> GeneratedMove:
+        placements = tuple(Placement(row=7, col=7 + i, letter="A") for i in range(tiles))
+        return GeneratedMove(placements, Direction.ACROSS, "A" * tiles, ("A" * tiles,), score)
+
+    assert local_race_bound([]) is None
+    assert local_race_bound([generated(2, 12), generated(3, 18)]) == 18
+    # bingo 7 pismen: 74 b. z generatora = 24 b. podla score_words
+    assert local_race_bound([generated(7, 74), generated(3, 18)]) == 24
@@ -45,7 +45,7 @@ class _DummyCompletions:
         self.calls = 0
         self.requests: list[dict] = []
 
-    def create(self, **kwargs):  # type: ignore[no-untyped-def]
+    async def create(self, **kwargs):  # type: ignore[no-untyped-def]
         self.calls += 1
         self.requests.append(kwargs)
         if self.calls == 1:
@@ -69,7 +69,7 @@ class _DummyCompletionsExplore:
     def __init__(self) -> None:
         self.calls = 0
 
-    def create(self, **kwargs):  # type: ignore[no-untyped-def]
+    async def create(self, **kwargs):  # type: ignore[no-untyped-def]
         del kwargs
         self.calls += 1
         if self.calls == 1:
@@ -93,7 +93,7 @@ class _DummyCompletionsScored:
     def __init__(self) -> None:
         self.calls = 0
 
-    def create(self, **kwargs):  # type: ignore[no-untyped-def]
+    async def create(self, **kwargs):  # type: ignore[no-untyped-def]
         del kwargs
         self.calls += 1
         if self.calls == 1:
@@ -161,7 +161,7 @@ class _DummyCompletionsMaxCompletionFallback:
         self.calls = 0
         self.requests: list[dict] = []
 
-    def create(self, **kwargs):  # type: ignore[no-untyped-def]
+    async def create(self, **kwargs):  # type: ignore[no-untyped-def]
         self.calls += 1
         self.requests.append(kwargs)
         if self.calls == 1:
@@ -183,7 +183,7 @@ class _DummyCompletionsRateLimited:
         self.calls = 0
         self.requests: list[dict] = []
 
-    def create(self, **kwargs):  # type: ignore[no-untyped-def]
+    async def create(self, **kwargs):  # type: ignore[no-untyped-def]
         self.calls += 1
         self.requests.append(kwargs)
         raise RuntimeError("429 Too Many Requests")
@@ -226,7 +226,7 @@ class _DummyOpenAIRateLimited:
 
 @pytest.mark.asyncio
 async def test_openai_tools_client_executes_tool_loop(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr("scrabgpt.ai.openai_tools_client.OpenAI", _DummyOpenAI)
+    monkeypatch.setattr("scrabgpt.ai.openai_tools_client.AsyncOpenAI", _DummyOpenAI)
     client = OpenAIToolClient(api_key="test-key", timeout_seconds=30)
     updates: list[dict] = []
 
@@ -282,7 +282,7 @@ def test_openai_tool_schemas_have_items_for_all_arrays() -> None:
 async def test_openai_tools_client_can_force_extra_exploration(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    monkeypatch.setattr("scrabgpt.ai.openai_tools_client.OpenAI", _DummyOpenAIExplore)
+    monkeypatch.setattr("scrabgpt.ai.openai_tools_client.AsyncOpenAI", _DummyOpenAIExplore)
     client = OpenAIToolClient(api_key="test-key", timeout_seconds=30)
 
     result = await client.call_model(
@@ -302,7 +302,7 @@ async def test_openai_tools_client_can_force_extra_exploration(
 async def test_openai_tools_client_can_force_more_scored_candidates(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    monkeypatch.setattr("scrabgpt.ai.openai_tools_client.OpenAI", _DummyOpenAIScored)
+    monkeypatch.setattr("scrabgpt.ai.openai_tools_client.AsyncOpenAI", _DummyOpenAIScored)
 
     def _fake_execute_tool(name: str, args: dict, *, context=None):  # type: ignore[no-untyped-def]
         del context
@@ -331,7 +331,7 @@ async def test_openai_tools_client_falls_back_to_max_tokens_only_when_needed(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     monkeypatch.setattr(
-        "scrabgpt.ai.openai_tools_client.OpenAI",
+        "scrabgpt.ai.openai_tools_client.AsyncOpenAI",
         _DummyOpenAIMaxCompletionFallback,
     )
     client = OpenAIToolClient(api_key="test-key", timeout_seconds=30)
@@ -354,7 +354,7 @@ async def test_openai_tools_client_falls_back_to_max_tokens_only_when_needed(
 async def test_openai_tools_client_does_not_retry_with_max_tokens_on_rate_limit(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    monkeypatch.setattr("scrabgpt.ai.openai_tools_client.OpenAI", _DummyOpenAIRateLimited)
+    monkeypatch.setattr("scrabgpt.ai.openai_tools_client.AsyncOpenAI", _DummyOpenAIRateLimited)
     client = OpenAIToolClient(api_key="test-key", timeout_seconds=30)
 
     result = await client.call_model(
@@ -375,3 +375,41 @@ def test_openai_tools_client_tool_unsupported_detection_ignores_token_parameter_
     )
     assert OpenAIToolClient._tool_unsupported(token_error) is False
     assert OpenAIToolClient._tool_unsupported("Unknown parameter: 'tools'.") is True
+
+
+@pytest.mark.asyncio
+async def test_execute_tools_runs_round_concurrently_in_call_order() -> None:
+    import threading
+    import time
+
+    from scrabgpt.ai.tool_adapter import execute_tools
+
+    barrier = threading.Barrier(3, timeout=2)
+
+    def _slow_tool(name: str, args: dict, *, context=None):  # type: ignore[no-untyped-def]
+        barrier.wait()  # all three calls must be in flight at once
+        time.sleep(0.01 * args["delay"])
+        return {"name": name, "context": context}
+
+    calls = [("a", {"delay": 3}), ("b", {"delay": 1}), ("c", {"delay": 2})]
+    results = await execute_tools(calls, context={"x": 1}, execute=_slow_tool)
+
+    assert [r["name"] for r in results] == ["a", "b", "c"]
+    assert all(r["context"] == {"x": 1} for r in results)
+
+
+def test_openai_tool_clients_share_connection_pool_per_event_loop() -> None:
+    import asyncio
+
+    from scrabgpt.ai.openai_transport import shared_async_http_client
+
+    async def pools() -> tuple[object, object, object]:
+        first = OpenAIToolClient(api_key="test-key").client
+        second = OpenAIToolClient(api_key="test-key").client
+        return first._client, second._client, shared_async_http_client()
+
+    a_first, a_second, a_shared = asyncio.run(pools())
+    b_first, _, _ = asyncio.run(pools())
+
+    assert a_first is a_second is a_shared
+    assert b_first is not a_first
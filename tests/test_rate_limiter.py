@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from scrabgpt.ai.rate_limiter import (
+    AdaptiveLimiter,
+    get_limiter,
+    is_throttle_error,
+    parse_retry_after,
+    retry_after_seconds,
+)
+
+
+def _throttle_error(headers: dict[str, str] | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://openrouter.ai/api/v1/chat/completions")
+    response = httpx.Response(429, headers=headers or {}, request=request)
+    return httpx.HTTPStatusError("Too Many Requests", request=request, response=response)
+
+
+def test_throttle_detection_and_retry_after_parsing() -> None:
+    assert is_throttle_error(_throttle_error())
+    assert is_throttle_error(RuntimeError("429 RESOURCE_EXHAUSTED"))
+    assert not is_throttle_error(RuntimeError("500 Internal Server Error"))
+
+    assert retry_after_seconds(_throttle_error({"Retry-After": "3"})) == 3.0
+    assert retry_after_seconds(_throttle_error({"retry-after-ms": "1500"})) == 1.5
+    assert retry_after_seconds(RuntimeError("{'retryDelay': '7s'}")) == 7.0
+    assert retry_after_seconds(_throttle_error()) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:10 GMT", now=1445412480.0) == 10.0
+
+
+async def test_excess_calls_queue_and_run_when_slots_free() -> None:
+    limiter = AdaptiveLimiter("test", initial=2, max_limit=2)
+    gate = asyncio.Event()
+    running = 0
+    peak = 0
+
+    async def work() -> None:
+        nonlocal running, peak
+        async with limiter.slot():
+            running += 1
+            peak = max(peak, running)
+            await gate.wait()
+            running -= 1
+
+    tasks = [asyncio.ensure_future(work()) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    assert limiter.in_flight == 2
+    assert limiter.queue_depth == 3
+
+    gate.set()
+    await asyncio.gather(*tasks)
+    assert peak == 2
+    assert limiter.stats()["queue_depth"] == 0
+    assert limiter.stats()["peak_queue_depth"] == 3
+    assert limiter.successes == 5
+
+
+async def test_throttle_halves_limit_and_success_grows_it_back() -> None:
+    limiter = AdaptiveLimiter("test", initial=8)
+
+    with pytest.raises(RuntimeError):
+        async with limiter.slot():
+            raise RuntimeError("429 Too Many Requests")
+    assert limiter.stats()["limit"] == 4
+    assert limiter.throttled == 1
+
+    # a burst of 429s from the same overload counts once
+    with pytest.raises(RuntimeError):
+        async with limiter.slot():
+            raise RuntimeError("429 Too Many Requests")
+    assert limiter.stats()["limit"] == 4
+
+    # additive increase: about +1 per window of successful calls
+    for _ in range(5):
+        async with limiter.slot():
+            pass
+    assert limiter.stats()["limit"] == 5
+
+    with pytest.raises(ValueError):
+        async with limiter.slot():
+            raise ValueError("bad json")
+    assert limiter.stats()["limit"] == 5
+    assert limiter.in_flight == 0
+
+
+async def test_call_requeues_after_retry_after() -> None:
+    limiter = AdaptiveLimiter("test", initial=4)
+    attempts: list[float] = []
+    loop = asyncio.get_running_loop()
+
+    async def request() -> str:
+        attempts.append(loop.time())
+        if len(attempts) == 1:
+            raise _throttle_error({"Retry-After": "0.05"})
+        return "ok"
+
+    assert await limiter.call(request) == "ok"
+    assert len(attempts) == 2
+    assert attempts[1] - attempts[0] >= 0.04
+
+    # without a back-off hint the error goes straight back to the caller
+    async def always_throttled() -> str:
+        raise RuntimeError("429 Too Many Requests")
+
+    with pytest.raises(RuntimeError):
+        await limiter.call(always_throttled)
+
+
+async def test_cancelled_waiter_leaves_the_queue() -> None:
+    limiter = AdaptiveLimiter("test", initial=1, max_limit=1)
+    await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.queue_depth == 0
+
+    limiter.release()
+    assert limiter.in_flight == 0
+
+
+def test_limiters_are_shared_per_provider_host_and_key() -> None:
+    first = get_limiter("https://api.novita.ai/openai", "key-a")
+    assert get_limiter("https://api.novita.ai/v3/openai", "key-a") is first
+    assert get_limiter("https://api.novita.ai/openai", "key-b") is not first
+    assert "key-a" not in first.name
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from scrabgpt.ai.openrouter import OpenRouterClient
+from scrabgpt.ai.schema import parse_ai_move
+from scrabgpt.ai.streaming import StreamError, stream_chat_completion
+
+_MOVE = {
+    "start": {"row": 7, "col": 7},
+    "direction": "ACROSS",
+    "placements": [
+        {"row": 7, "col": 7, "letter": "M"},
+        {"row": 7, "col": 8, "letter": "A"},
+    ],
+    "word": "MA",
+}
+
+
+def _sse(events: list[dict[str, Any]]) -> bytes:
+    lines = [": OPENROUTER PROCESSING", ""]
+    for event in events:
+        lines += [f"data: {json.dumps(event)}", ""]
+    lines += ["data: [DONE]", ""]
+    return "\n".join(lines).encode("utf-8")
+
+
+def _delta(content: str = "", reasoning: str = "") -> dict[str, Any]:
+    delta: dict[str, Any] = {}
+    if content:
+        delta["content"] = content
+    if reasoning:
+        delta["reasoning"] = reasoning
+    return {"choices": [{"index": 0, "delta": delta}]}
+
+
+def _client(body: bytes, seen: list[dict[str, Any]]) -> OpenRouterClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(json.loads(request.content))
+        return httpx.Response(200, content=body, headers={"content-type": "text/event-stream"})
+
+    client = OpenRouterClient(api_key="test-key")
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+async def test_streamed_call_stops_at_the_move_and_reports_ttft() -> None:
+    move_json = json.dumps(_MOVE)
+    events = [_delta(reasoning="Looking at the rack...")]
+    events += [_delta(move_json[i : i + 7]) for i in range(0, len(move_json), 7)]
+    events += [_delta(" and some more words after the move"), _delta(" that are never read")]
+    requests: list[dict[str, Any]] = []
+    progress: list[dict[str, Any]] = []
+    client = _client(_sse(events), requests)
+
+    result = await client.call_model(
+        "openai/gpt-4o-mini", "prompt", stream=True, progress_callback=progress.append,
+    )
+    await client.close()
+
+    assert requests[0]["stream"] is True
+    assert result["status"] == "ok"
+    assert result["streamed"] is True and result["stopped_early"] is True
+    assert result["ttft"] is not None and result["move_after"] >= result["ttft"]
+    assert result["usage_unknown"] is True
+    move, _method = parse_ai_move(result["content"])
+    assert move.word == "MA"
+    phases = [event["phase"] for event in progress]
+    assert phases[0] == "first_token" and "move_ready" in phases
+    assert all(event["model"] == "openai/gpt-4o-mini" for event in progress)
+
+
+async def test_early_stop_still_picks_up_usage_sent_after_the_move() -> None:
+    events = [_delta(json.dumps(_MOVE)), _delta(" trailing explanation")]
+    events.append({"choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                   "usage": {"prompt_tokens": 120, "completion_tokens": 45,
+                             "prompt_tokens_details": {"cached_tokens": 64}}})
+    client = _client(_sse(events), [])
+
+    result = await client.call_model("m", "prompt", stream=True)
+    await client.close()
+
+    assert result["stopped_early"] is True and result["usage_unknown"] is False
+    assert result["prompt_tokens"] == 120
+    assert result["completion_tokens"] == 45
+    assert result["cached_tokens"] == 64
+    assert parse_ai_move(result["content"])[0].word == "MA"
+
+
+async def test_error_event_in_stream_raises_an_httpx_error() -> None:
+    body = _sse([_delta("Thinking"), {"error": {"code": 429, "message": "Rate limited"}}])
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body)),
+    ) as http:
+        with pytest.raises(httpx.HTTPError) as caught:
+            await stream_chat_completion(http, "https://example.test/chat", headers={}, payload={})
+
+    assert isinstance(caught.value, StreamError)
+    assert caught.value.status_code == 429 and "Rate limited" in str(caught.value)
+
+
+async def test_streamed_call_reads_to_the_end_without_early_stop() -> None:
+    text = "Thinking out loud. " + json.dumps(_MOVE)
+    events = [_delta(text[:20]), _delta(text[20:])]
+    events.append({"choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                   "usage": {"prompt_tokens": 12, "completion_tokens": 34}})
+    client = _client(_sse(events), [])
+
+    result = await client.call_model("m", "prompt", stream=True, stop_at_move=False)
+    await client.close()
+
+    assert result["stopped_early"] is False
+    assert result["content"] == text
+    assert result["completion_tokens"] == 34
+    assert result["raw_json"]["choices"][0]["finish_reason"] == "stop"
+
+
+async def test_non_streamed_call_is_unchanged() -> None:
+    body = json.dumps({
+        "choices": [{"message": {"content": json.dumps(_MOVE)}}],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 2},
+    }).encode("utf-8")
+    requests: list[dict[str, Any]] = []
+    client = _client(body, requests)
+
+    result = await client.call_model("m", "prompt", stream=False)
+    await client.close()
+
+    assert "stream" not in requests[0]
+    assert result["status"] == "ok" and "streamed" not in result
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from scrabgpt.ai.token_usage import PromptCacheStats, cached_prompt_tokens
+
+
+def test_cached_prompt_tokens_reads_each_provider_shape() -> None:
+    openai_usage = SimpleNamespace(
+        prompt_tokens=2000,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=1536),
+    )
+    openrouter_usage = {"prompt_tokens": 2000, "prompt_tokens_details": {"cached_tokens": 1024}}
+    gemini_usage = SimpleNamespace(prompt_token_count=2000, cached_content_token_count=1800)
+
+    assert cached_prompt_tokens(openai_usage) == 1536
+    assert cached_prompt_tokens(openrouter_usage) == 1024
+    assert cached_prompt_tokens(gemini_usage) == 1800
+    assert cached_prompt_tokens({"prompt_tokens": 10}) == 0
+    assert cached_prompt_tokens(None) == 0
+
+
+def test_prompt_cache_stats_reports_cached_ratio() -> None:
+    stats = PromptCacheStats()
+    stats.record(1000, 0)
+    stats.record(1000, 800)
+
+    assert stats.snapshot() == {
+        "calls": 2,
+        "prompt_tokens": 2000,
+        "cached_tokens": 800,
+        "cached_ratio": 0.4,
+    }
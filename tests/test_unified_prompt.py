@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from scrabgpt.ai.player import _build_prompt, _load_prompt_template
+from scrabgpt.ai.player import (
+    _build_prompt,
+    _static_prompt_prefix,
+    _turn_prompt_suffix,
+)
 from scrabgpt.core.variant_store import VariantDefinition
 
 
@@ -8,13 +12,12 @@ def _variant() -> VariantDefinition:
     return VariantDefinition(slug="test", language="Slovak", letters=tuple())
 
 
-def test_prompt_template_is_unified_for_all_modes() -> None:
-    chat_template = _load_prompt_template(use_chat_protocol=True)
-    legacy_template = _load_prompt_template(use_chat_protocol=False)
+def test_prompt_prefix_is_unified_for_all_modes() -> None:
+    prefix = _static_prompt_prefix(_variant())
 
-    assert chat_template == legacy_template
-    assert "elite tournament Scrabble engine" in chat_template
-    assert "Use blank adaptively, never by a fixed points threshold." in chat_template
+    assert "elite tournament Scrabble engine" in prefix
+    assert "Use blank adaptively, never by a fixed points threshold." in prefix
+    assert "=== STRICT OUTPUT CONTRACT ===" in prefix
 
 
 def test_build_prompt_ignores_legacy_prompt_file_env(monkeypatch) -> None:
@@ -35,3 +38,18 @@ def test_build_prompt_contains_strict_output_contract() -> None:
     assert "=== STRICT OUTPUT CONTRACT ===" in prompt
     assert "For a scoring move, include: start, direction, placements, word." in prompt
     assert "Use pass=true only as absolute last resort when exchange is impossible." in prompt
+
+
+def test_build_prompt_starts_with_static_prefix_shared_across_turns() -> None:
+    variant = _variant()
+    first = _build_prompt("ai_rack: A,E,I,O,U,S,T\n", variant)
+    second = _build_prompt("ai_rack: K,L,M,N,O,P,R\n", variant)
+    prefix = _static_prompt_prefix(variant)
+
+    assert first.startswith(prefix) and second.startswith(prefix)
+    assert first.index("=== STRICT OUTPUT CONTRACT ===") < first.index("CURRENT STATE:")
+    assert "K,L,M,N,O,P,R" not in prefix
+    # premenlivá časť je memoizovaná podľa stavu
+    assert _turn_prompt_suffix("ai_rack: A,E,I,O,U,S,T\n") is _turn_prompt_suffix(
+        "ai_rack: A,E,I,O,U,S,T\n"
+    )
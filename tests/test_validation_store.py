@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+
+from scrabgpt.ai import client as client_mod
+from scrabgpt.ai.client import OpenAIClient
+from scrabgpt.ai.validation_store import TIER_JUDGE, TIER_JULS, ValidationStore
+
+
+def test_verdicts_survive_restart_and_expire_per_tier(tmp_path: Path) -> None:
+    path = tmp_path / "verdicts.sqlite3"
+    store = ValidationStore(path, ttls={(TIER_JULS, True): 3600, (TIER_JULS, False): 0.05})
+    store.put("Slovak", "neologizmus", valid=True, tier=TIER_JULS, reason="JULS")
+    store.put("slovak", "QQQ", valid=False, tier=TIER_JULS)
+    assert store.get("slovak", "NEOLOGIZMUS") is not None
+    store.close()
+
+    time.sleep(0.1)
+    reopened = ValidationStore(path)
+    verdict = reopened.get("slovak", "Neologizmus")
+    assert verdict is not None and verdict.valid and verdict.reason == "JULS"
+    # negativny verdikt JULS uz expiroval a kompakcia ho zmazala
+    assert reopened.get("slovak", "QQQ") is None
+    assert reopened.get("english", "NEOLOGIZMUS") is None
+    reopened.close()
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM verdicts").fetchone() == (1,)
+
+
+def test_compaction_keeps_newest_entries(tmp_path: Path) -> None:
+    store = ValidationStore(tmp_path / "v.sqlite3", max_entries=3)
+    for idx, word in enumerate(["AA", "BB", "CC", "DD", "EE"]):
+        store.put("slovak", word, valid=True, tier=TIER_JUDGE, reason=str(idx))
+    assert store.compact() == 2
+    assert len(store) == 3
+    assert store.get("slovak", "AA") is None and store.get("slovak", "EE") is not None
+    store.close()
+
+
+def test_judge_words_reuses_persisted_llm_verdicts(tmp_path: Path, monkeypatch) -> None:
+    store = ValidationStore(tmp_path / "v.sqlite3")
+    monkeypatch.setattr(client_mod, "get_validation_store", lambda: store)
+    asked: list[list[str]] = []
+
+    def judge(words: list[str], language: str) -> client_mod.JudgeBatchResponse:
+        asked.append(list(words))
+        return {"results": [{"word": w, "valid": w != "ZLE", "reason": "llm"} for w in words],
+                "all_valid": False}
+
+    judge_client = OpenAIClient.__new__(OpenAIClient)
+    judge_client._slovak_dict = None
+    first = judge_client.judge_words(["DOBRE", "ZLE"], language="english", llm_validator=judge)
+    second = judge_client.judge_words(["ZLE", "DOBRE"], language="english", llm_validator=judge)
+
+    assert asked == [["DOBRE", "ZLE"]]
+    assert first["all_valid"] is False and second["all_valid"] is False
+    assert {r["word"]: r["valid"] for r in second["results"]} == {"ZLE": False, "DOBRE": True}
+    store.close()
+
+
+def test_juls_miss_still_reaches_the_llm_judge(tmp_path: Path, monkeypatch) -> None:
+    from scrabgpt.ai import mcp_tools
+
+    store = ValidationStore(tmp_path / "v.sqlite3")
+    monkeypatch.setattr(mcp_tools, "get_validation_store", lambda: store)
+    monkeypatch.setattr(client_mod, "get_validation_store", lambda: store)
+    monkeypatch.setattr(mcp_tools, "is_word_in_juls", lambda word, **_: False)
+
+    tool_result = mcp_tools.tool_validate_word_slovak(word="QQQQQQQQQZ")
+    assert tool_result["valid"] is False and tool_result["tier"] == 2
+    assert store.get("slovak", "QQQQQQQQQZ") is None
+    # aj starsi negativny zaznam JULS musi ist k rozhodcovi
+    store.put("slovak", "QQQQQQQQQY", valid=False, tier=TIER_JULS)
+    asked: list[list[str]] = []
+
+    def judge(words: list[str], language: str) -> client_mod.JudgeBatchResponse:
+        asked.append(list(words))
+        return {"results": [{"word": w, "valid": True, "reason": "llm"} for w in words],
+                "all_valid": True}
+
+    judge_client = OpenAIClient.__new__(OpenAIClient)
+    judge_client._slovak_dict = None
+    result = judge_client.judge_words(
+        ["QQQQQQQQQZ", "QQQQQQQQQY"], language="slovak", llm_validator=judge,
+    )
+
+    assert asked == [["QQQQQQQQQZ", "QQQQQQQQQY"]]
+    assert result["all_valid"] is True
+    verdict = store.get("slovak", "QQQQQQQQQZ")
+    assert verdict is not None and verdict.tier == TIER_JUDGE
+    store.close()
+
+
+def test_missing_judge_verdicts_are_not_persisted(tmp_path: Path, monkeypatch) -> None:
+    store = ValidationStore(tmp_path / "v.sqlite3")
+    monkeypatch.setattr(client_mod, "get_validation_store", lambda: store)
+    asked: list[list[str]] = []
+
+    def judge(words: list[str], language: str) -> client_mod.JudgeBatchResponse:
+        asked.append(list(words))
+        # prvy raz rozhodca na slovo "CHYBA" zabudne
+        answered = words if len(asked) > 1 else [w for w in words if w != "CHYBA"]
+        return {"results": [{"word": w, "valid": True, "reason": "llm"} for w in answered],
+                "all_valid": True}
+
+    judge_client = OpenAIClient.__new__(OpenAIClient)
+    judge_client._slovak_dict = None
+    first = judge_client.judge_words(["DOBRE", "CHYBA"], language="english", llm_validator=judge)
+    assert {r["word"]: r["valid"] for r in first["results"]} == {"DOBRE": True, "CHYBA": False}
+    assert store.get("english", "CHYBA") is None
+
+    second = judge_client.judge_words(["DOBRE", "CHYBA"], language="english", llm_validator=judge)
+    assert asked == [["DOBRE", "CHYBA"], ["CHYBA"]]
+    assert second["all_valid"] is True
+    store.close()
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 import scrabgpt.core.variant_store as variant_store
 
 
@@ -25,3 +27,78 @@ def test_get_active_variant_slug_reads_from_dotenv(monkeypatch) -> None:
             env_path.unlink(missing_ok=True)
         else:
             env_path.write_text(original_env_contents, encoding="utf-8")
+
+
+def test_load_variant_is_cached_until_file_changes(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(variant_store, "_variants_dir", lambda: tmp_path)
+    variant_store.clear_variant_cache()
+    calls: list[Path] = []
+    original_loader = variant_store._load_variant_from_path
+
+    def counting_loader(path: Path) -> variant_store.VariantDefinition:
+        calls.append(path)
+        return original_loader(path)
+
+    monkeypatch.setattr(variant_store, "_load_variant_from_path", counting_loader)
+    try:
+        first = variant_store.load_variant("english")
+        assert variant_store.load_variant("english") is first
+        assert first.tile_points is first.tile_points
+        assert len(calls) == 1
+
+        # kontrola suborov (vlakno na pozadi) nechava nezmeneny variant v cache
+        variant_store._check_variant_files()
+        assert variant_store.load_variant("english") is first
+        assert len(calls) == 1
+
+        path = tmp_path / "english.json"
+        path.write_text(path.read_text(encoding="utf-8").replace('"points": 10', '"points": 11'), encoding="utf-8")
+        variant_store._check_variant_files()
+        reloaded = variant_store.load_variant("english")
+        assert reloaded is not first
+        assert reloaded.tile_points["Z"] == 11
+        assert len(calls) == 2
+    finally:
+        variant_store.clear_variant_cache()
+
+
+def test_active_variant_follows_env_changes(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(variant_store, "_variants_dir", lambda: tmp_path)
+    monkeypatch.setattr(variant_store, "_ENV_LOADED", True)
+    variant_store.clear_variant_cache()
+    try:
+        variant_store.ensure_builtin_variant()
+        custom = variant_store.VariantDefinition(
+            slug="mini",
+            language="Mini",
+            letters=(variant_store.VariantLetter("A", 2, 3),),
+        )
+        variant_store.save_variant(custom)
+
+        monkeypatch.setenv("SCRABBLE_VARIANT", "english")
+        assert variant_store.get_active_variant().slug == "english"
+        monkeypatch.setenv("SCRABBLE_VARIANT", "mini")
+        assert variant_store.get_active_variant().tile_points == {"A": 3}
+    finally:
+        variant_store.clear_variant_cache()
+
+
+def test_cached_variant_hit_does_no_io_and_maps_are_read_only(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(variant_store, "_variants_dir", lambda: tmp_path)
+    variant_store.clear_variant_cache()
+    try:
+        definition = variant_store.load_variant("english")
+
+        def forbidden_stat(self: Path, *args: object, **kwargs: object) -> None:
+            raise AssertionError(f"unexpected stat of {self}")
+
+        with monkeypatch.context() as patched:
+            patched.setattr(Path, "stat", forbidden_stat)
+            assert variant_store.load_variant("english") is definition
+
+        with pytest.raises(TypeError):
+            definition.tile_points["Z"] = 0  # type: ignore[index]
+        with pytest.raises(TypeError):
+            definition.distribution["Z"] = 0  # type: ignore[index]
+    finally:
+        variant_store.clear_variant_cache()